@@ -1,7 +1,7 @@
 """
 Fetcher Agent — orchestrates all source fetchers.
 
-Runs each source fetcher, deduplicates items, translates CJK content,
+Runs the source fetchers concurrently, deduplicates items, translates CJK content,
 and stores results in Supabase.
 
 See docs/AGENTS.md for the full contract.
@@ -9,10 +9,11 @@ See docs/AGENTS.md for the full contract.
 import logging
 from datetime import datetime, timezone
 
-from shared import supabase_client
-from shared.utils import content_hash, now_utc_iso
-from shared.translator import translate_item
+from shared import http_client, supabase_client
+from shared.utils import content_hash, normalize_date, now_utc_iso
+from shared.translator import translate_items
 
+from agents.fetcher.engine import run_sources
 from agents.fetcher.sources import (
     github_releases,
     huggingface,
@@ -36,7 +37,7 @@ from agents.fetcher.sources import (
 
 logger = logging.getLogger(__name__)
 
-# All source fetchers in execution order (most reliable first)
+# All source fetchers in result order (most reliable first)
 FETCHERS = [
     ("github_releases", github_releases),
     ("huggingface", huggingface),
@@ -66,58 +67,63 @@ def run_fetcher() -> dict:
     run_id = run["id"]
     logger.info(f"Created digest run: {run_id}")
 
+    http_client.reset_cache_stats()
+    http_client.discard_staged_cache()
     all_items = []
+    fetched_by: dict[int, str] = {}  # id(item) -> source that returned it
+    succeeded: list[str] = []
     errors = []
     sources_succeeded = 0
     sources_failed = 0
 
-    # 2. Run each fetcher
-    for name, module in FETCHERS:
-        try:
-            logger.info(f"Running fetcher: {name}")
-            fetched = module.fetch()
+    # 2. Run all fetchers concurrently; results come back in FETCHERS order
+    for name, fetched, error in run_sources(FETCHERS):
+        if error is None:
             all_items.extend(fetched)
+            fetched_by.update((id(item), name) for item in fetched)
+            succeeded.append(name)
             sources_succeeded += 1
-            logger.info(f"  {name}: {len(fetched)} items")
-        except Exception as e:
+        else:
             sources_failed += 1
-            error_info = {
+            errors.append({
                 "source_id": name,
-                "error": str(e),
+                "error": str(error),
                 "timestamp": now_utc_iso(),
-            }
-            errors.append(error_info)
-            logger.error(f"  {name} FAILED: {e}")
+            })
 
     items_fetched = len(all_items)
     logger.info(f"Total items fetched: {items_fetched}")
 
-    # 3. Deduplicate against existing items
-    new_items = []
+    # 3. Deduplicate: collapse repeats within this run, then check stored hashes in bulk
+    unique_items: dict[str, dict] = {}
     for item in all_items:
         ch = content_hash(
             item.get("source_id", ""),
             item.get("url", ""),
             item.get("title", ""),
         )
+        if ch in unique_items:
+            continue
         item["content_hash"] = ch
         item["fetched_at"] = now_utc_iso()
+        # Canonical ISO UTC, so later stages only ever see ISO dates
+        item["published_at"] = normalize_date(item.get("published_at"))
+        unique_items[ch] = item
 
-        if not supabase_client.item_exists(ch):
-            new_items.append(item)
+    existing = supabase_client.existing_content_hashes(list(unique_items))
+    new_items = [item for ch, item in unique_items.items() if ch not in existing]
 
     logger.info(f"New items after dedup: {len(new_items)}")
 
     # 4. Translate non-English items
-    for item in new_items:
-        if item.get("original_language", "en") != "en":
-            try:
-                translate_item(item)
-            except Exception as e:
-                logger.warning(f"Translation failed for item: {e}")
+    try:
+        translate_items(new_items)
+    except Exception as e:
+        logger.warning(f"Translation failed: {e}")
 
     # 5. Insert into Supabase
     inserted = 0
+    unstored_sources: set[str] = set()
     if new_items:
         # Insert in batches of 50
         for i in range(0, len(new_items), 50):
@@ -126,14 +132,31 @@ def run_fetcher() -> dict:
                 inserted += supabase_client.insert_items(batch)
             except Exception as e:
                 logger.error(f"Failed to insert batch {i}: {e}")
+                unstored_sources.update(fetched_by[id(item)] for item in batch)
+
+    # Only now let unchanged feeds be skipped next run: a source whose items
+    # didn't all make it into Supabase gets fetched in full again. Sources
+    # with their own incremental state save it through a commit() hook.
+    stored_sources = [name for name in succeeded if name not in unstored_sources]
+    http_client.commit_cache(stored_sources)
+    http_client.discard_staged_cache()
+    modules = dict(FETCHERS)
+    for name in stored_sources:
+        if hasattr(modules[name], "commit"):
+            try:
+                modules[name].commit()
+            except Exception as e:
+                logger.warning(f"Failed to commit {name} state: {e}")
 
     # 6. Update run stats
+    cache_stats = {"http": http_client.cache_stats()}
     supabase_client.update_run(run_id, {
         "items_fetched": items_fetched,
         "items_new": inserted,
         "sources_succeeded": sources_succeeded,
         "sources_failed": sources_failed,
         "errors": errors,
+        "cache_stats": cache_stats,
         "status": "completed" if sources_failed == 0 else "partial",
     })
 
@@ -144,12 +167,28 @@ def run_fetcher() -> dict:
         "sources_succeeded": sources_succeeded,
         "sources_failed": sources_failed,
         "errors": errors,
+        "cache_stats": cache_stats,
     }
     logger.info(f"Fetcher complete: {result}")
     return result
 
 
 if __name__ == "__main__":
+    import argparse
+    from shared import http_replay
+
+    parser = argparse.ArgumentParser(description="Run all source fetchers")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", action="store_true",
+                      help="store every HTTP response as a fixture file")
+    mode.add_argument("--replay", action="store_true",
+                      help="serve HTTP responses from fixture files instead of the network")
+    parser.add_argument("--fixtures-dir", help="fixture directory (default: HTTP_FIXTURES_DIR)")
+    parser.add_argument("--latency-ms", type=float, help="simulated per-request latency in replay mode")
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
+    if args.record or args.replay:
+        http_replay.set_mode("record" if args.record else "replay", args.fixtures_dir, args.latency_ms)
     result = run_fetcher()
     logger.info(f"Fetcher complete: {result}")
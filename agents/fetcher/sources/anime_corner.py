@@ -5,30 +5,32 @@ See docs/SOURCE_EXPLORATION.md §2b for details.
 """
 import logging
 
-import requests
 from bs4 import BeautifulSoup
 
-from shared import config
+from shared import config, http_client
+from shared.keywords import KeywordMatcher
 from shared.utils import now_utc_iso
 
 logger = logging.getLogger(__name__)
 
 NEWS_URL = "https://animecorner.me/category/news/"
 
+_MATCHER = KeywordMatcher(config.NEWS_KEYWORDS, substring=True)
+
 
 def _matches_keywords(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in config.NEWS_KEYWORDS)
+    return _MATCHER.matches(text)
 
 
 def fetch() -> list[dict]:
     """Scrape Anime Corner news page for AI/technology articles."""
     items = []
     try:
-        resp = requests.get(NEWS_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(NEWS_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("Anime Corner unchanged since last run, skipping")
+            return items
         soup = BeautifulSoup(resp.text, "lxml")
 
         articles = soup.select("article")
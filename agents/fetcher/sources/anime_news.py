@@ -6,28 +6,31 @@ See docs/SOURCE_EXPLORATION.md §2a for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
+from shared.keywords import KeywordMatcher
 from shared.utils import now_utc_iso
 
 logger = logging.getLogger(__name__)
 
 FEED_URL = "https://www.animenewsnetwork.com/all/rss.xml?ann-hierarchical"
 
+_MATCHER = KeywordMatcher(config.NEWS_KEYWORDS)
+
 
 def _matches_keywords(text: str) -> bool:
-    return config.keyword_in_text(config.NEWS_KEYWORDS, text) > 0
+    return _MATCHER.matches(text)
 
 
 def fetch() -> list[dict]:
     """Fetch ANN news filtered by AI/technology keywords."""
     items = []
     try:
-        resp = requests.get(FEED_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(FEED_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("ANN unchanged since last run, skipping")
+            return items
         feed = feedparser.parse(resp.text)
         for entry in feed.entries:
             title = entry.get("title", "")
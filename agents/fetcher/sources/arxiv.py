@@ -6,29 +6,31 @@ See docs/SOURCE_EXPLORATION.md §1c for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
+from shared.keywords import KeywordMatcher
 from shared.utils import now_utc_iso
 
 logger = logging.getLogger(__name__)
 
 FEED_URL = "https://rss.arxiv.org/rss/cs.CV"
 
+_MATCHER = KeywordMatcher(config.ARXIV_KEYWORDS, substring=True)
+
 
 def _matches_keywords(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in config.ARXIV_KEYWORDS)
+    return _MATCHER.matches(text)
 
 
 def fetch() -> list[dict]:
     """Fetch ArXiv cs.CV papers filtered by video/anime keywords."""
     items = []
     try:
-        resp = requests.get(FEED_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(FEED_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("ArXiv cs.CV unchanged since last run, skipping")
+            return items
         feed = feedparser.parse(resp.text)
         for entry in feed.entries:
             title = entry.get("title", "")
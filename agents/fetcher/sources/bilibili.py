@@ -6,45 +6,50 @@ See docs/SOURCE_EXPLORATION.md §2d for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
 from shared.utils import now_utc_iso
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
 
-def fetch() -> list[dict]:
-    """Fetch Bilibili AI animation content via RSSHub search routes."""
+def _fetch_keyword(keyword: str) -> list[dict]:
+    """Fetch the RSSHub search feed for a single keyword."""
     items = []
     rsshub = config.RSSHUB_URL.rstrip("/")
-
-    for keyword in config.BILIBILI_KEYWORDS:
-        try:
-            feed_url = f"{rsshub}/bilibili/search/{keyword}"
-            resp = requests.get(feed_url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
+    try:
+        feed_url = f"{rsshub}/bilibili/search/{keyword}"
+        resp = http_client.get(feed_url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"Bilibili [{keyword}] unchanged since last run, skipping")
+            return items
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries[:10]:
+            items.append({
+                "source_id": "bilibili_ai",
+                "source_category": "community",
+                "title": entry.get("title", ""),
+                "url": entry.get("link", ""),
+                "published_at": entry.get("published", entry.get("updated", now_utc_iso())),
+                "raw_body": entry.get("summary", ""),
+                "original_language": "zh",
+                "metadata": {
+                    "search_keyword": keyword,
+                },
             })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries[:10]:
-                items.append({
-                    "source_id": "bilibili_ai",
-                    "source_category": "community",
-                    "title": entry.get("title", ""),
-                    "url": entry.get("link", ""),
-                    "published_at": entry.get("published", entry.get("updated", now_utc_iso())),
-                    "raw_body": entry.get("summary", ""),
-                    "original_language": "zh",
-                    "metadata": {
-                        "search_keyword": keyword,
-                    },
-                })
-                count += 1
-            logger.info(f"Fetched {count} items from Bilibili [{keyword}]")
-        except Exception as e:
-            logger.warning(f"Failed to fetch Bilibili [{keyword}]: {e}")
+        logger.info(f"Fetched {len(items)} items from Bilibili [{keyword}]")
+    except Exception as e:
+        logger.warning(f"Failed to fetch Bilibili [{keyword}]: {e}")
+    return items
+
+
+def fetch() -> list[dict]:
+    """Fetch Bilibili AI animation content via RSSHub search routes."""
+    items = []
+    for keyword_items in map_feeds(_fetch_keyword, config.BILIBILI_KEYWORDS):
+        items.extend(keyword_items)
 
     # Deduplicate by URL
     seen = set()
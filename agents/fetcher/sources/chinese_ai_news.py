@@ -6,10 +6,11 @@ See docs/SOURCE_EXPLORATION.md §2e for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
+from shared.keywords import KeywordMatcher
 from shared.utils import now_utc_iso
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
@@ -21,42 +22,50 @@ FEEDS = [
 AI_KEYWORDS = ["ai", "视频", "动画", "模型", "开源", "video", "anime",
                "diffusion", "wan", "生成", "lora"]
 
+_MATCHER = KeywordMatcher(AI_KEYWORDS)
+
 
 def _matches_keywords(text: str) -> bool:
-    return config.keyword_in_text(AI_KEYWORDS, text) > 0
+    return _MATCHER.matches(text)
 
 
-def fetch() -> list[dict]:
-    """Fetch Chinese AI news from 36kr and 机器之心 via RSSHub."""
+def _fetch_feed(feed_config: tuple[str, str, str]) -> list[dict]:
+    """Fetch and keyword-filter a single RSSHub feed."""
+    path, source_id, name = feed_config
     items = []
     rsshub = config.RSSHUB_URL.rstrip("/")
-
-    for path, source_id, name in FEEDS:
-        try:
-            feed_url = f"{rsshub}{path}"
-            resp = requests.get(feed_url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
+    try:
+        feed_url = f"{rsshub}{path}"
+        resp = http_client.get(feed_url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"{name} unchanged since last run, skipping")
+            return items
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries:
+            title = entry.get("title", "")
+            summary = entry.get("summary", "")
+            if not _matches_keywords(f"{title} {summary}"):
+                continue
+            items.append({
+                "source_id": source_id,
+                "source_category": "industry",
+                "title": title,
+                "url": entry.get("link", ""),
+                "published_at": entry.get("published", now_utc_iso()),
+                "raw_body": summary,
+                "original_language": "zh",
+                "metadata": {},
             })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries:
-                title = entry.get("title", "")
-                summary = entry.get("summary", "")
-                if not _matches_keywords(f"{title} {summary}"):
-                    continue
-                items.append({
-                    "source_id": source_id,
-                    "source_category": "industry",
-                    "title": title,
-                    "url": entry.get("link", ""),
-                    "published_at": entry.get("published", now_utc_iso()),
-                    "raw_body": summary,
-                    "original_language": "zh",
-                    "metadata": {},
-                })
-                count += 1
-            logger.info(f"Fetched {count} items from {name}")
-        except Exception as e:
-            logger.warning(f"Failed to fetch {name}: {e}")
+        logger.info(f"Fetched {len(items)} items from {name}")
+    except Exception as e:
+        logger.warning(f"Failed to fetch {name}: {e}")
+    return items
+
+
+def fetch() -> list[dict]:
+    """Fetch Chinese AI news from 36kr and 机器之心 via RSSHub."""
+    items = []
+    for feed_items in map_feeds(_fetch_feed, FEEDS):
+        items.extend(feed_items)
     return items
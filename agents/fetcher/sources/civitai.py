@@ -5,10 +5,9 @@ See docs/SOURCE_EXPLORATION.md §3a for details.
 """
 import logging
 
-import requests
-
-from shared import config
+from shared import http_client
 from shared.utils import now_utc_iso, truncate
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
@@ -18,49 +17,56 @@ ANIME_TAGS = ["anime", "wan", "video", "webtoon", "animation"]
 
 def _fetch_page(params: dict) -> list[dict]:
     """Fetch a single page from CivitAI API."""
-    resp = requests.get(API_BASE, params=params, timeout=config.REQUEST_TIMEOUT, headers={
-        "User-Agent": config.USER_AGENT,
-    })
+    resp = http_client.get(API_BASE, params=params)
     resp.raise_for_status()
+    if resp.from_cache:
+        return []  # unchanged since last run; nothing new to report
     data = resp.json()
     return data.get("items", [])
 
 
+def _fetch_tag(tag: str) -> list[dict]:
+    """Fetch the newest LoRAs for a single tag."""
+    items = []
+    try:
+        models = _fetch_page({
+            "sort": "Newest",
+            "types": "LORA",
+            "tag": tag,
+            "limit": 10,
+        })
+        for model in models:
+            name = model.get("name", "")
+            model_id = model.get("id", "")
+            stats = model.get("stats", {})
+            items.append({
+                "source_id": "civitai_lora",
+                "source_category": "community",
+                "title": name,
+                "url": f"https://civitai.com/models/{model_id}",
+                "published_at": model.get("publishedAt", model.get("createdAt", now_utc_iso())),
+                "raw_body": truncate(model.get("description", "") or "", 500),
+                "original_language": "en",
+                "metadata": {
+                    "downloads": stats.get("downloadCount", 0),
+                    "rating": stats.get("rating", 0),
+                    "favorites": stats.get("favoriteCount", 0),
+                    "tags": model.get("tags", []),
+                    "creator": model.get("creator", {}).get("username", ""),
+                },
+            })
+    except Exception as e:
+        logger.warning(f"CivitAI tag '{tag}' fetch failed: {e}")
+    return items
+
+
 def fetch() -> list[dict]:
     """Fetch trending anime/video LoRAs from CivitAI."""
     items = []
     try:
-        # Newest anime LoRAs
-        for tag in ANIME_TAGS:
-            try:
-                models = _fetch_page({
-                    "sort": "Newest",
-                    "types": "LORA",
-                    "tag": tag,
-                    "limit": 10,
-                })
-                for model in models:
-                    name = model.get("name", "")
-                    model_id = model.get("id", "")
-                    stats = model.get("stats", {})
-                    items.append({
-                        "source_id": "civitai_lora",
-                        "source_category": "community",
-                        "title": name,
-                        "url": f"https://civitai.com/models/{model_id}",
-                        "published_at": model.get("publishedAt", model.get("createdAt", now_utc_iso())),
-                        "raw_body": truncate(model.get("description", "") or "", 500),
-                        "original_language": "en",
-                        "metadata": {
-                            "downloads": stats.get("downloadCount", 0),
-                            "rating": stats.get("rating", 0),
-                            "favorites": stats.get("favoriteCount", 0),
-                            "tags": model.get("tags", []),
-                            "creator": model.get("creator", {}).get("username", ""),
-                        },
-                    })
-            except Exception as e:
-                logger.warning(f"CivitAI tag '{tag}' fetch failed: {e}")
+        # Newest anime LoRAs, one request per tag
+        for tag_items in map_feeds(_fetch_tag, ANIME_TAGS):
+            items.extend(tag_items)
 
         # Deduplicate by model URL
         seen = set()
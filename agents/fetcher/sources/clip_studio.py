@@ -6,10 +6,10 @@ See docs/SOURCE_EXPLORATION.md §3f for details.
 import logging
 import re
 
-import requests
 from bs4 import BeautifulSoup
 
-from shared import config
+from shared import http_client
+from shared.keywords import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -17,19 +17,22 @@ TIPS_URL = "https://tips.clip-studio.com/en-us/"
 
 KEYWORDS = ["ai", "animation", "webtoon", "video", "automatic"]
 
+_MATCHER = KeywordMatcher(KEYWORDS)
+
 
 def _matches_keywords(text: str) -> bool:
-    return config.keyword_in_text(KEYWORDS, text) > 0
+    return _MATCHER.matches(text)
 
 
 def fetch() -> list[dict]:
     """Scrape Clip Studio Tips for AI/animation articles."""
     items = []
     try:
-        resp = requests.get(TIPS_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(TIPS_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("Clip Studio Tips unchanged since last run, skipping")
+            return items
         soup = BeautifulSoup(resp.text, "lxml")
 
         for a_tag in soup.select("a[href*='/articles/']"):
@@ -2,42 +2,102 @@
 Source fetcher: comfyui_nodes — ComfyUI Manager node list diff.
 
 Fetches the ComfyUI Manager custom-node-list.json and reports new entries.
+A compact snapshot (reference URL -> last_update) of the previous list is
+kept under CACHE_DIR, so only nodes added or updated since the last run are
+keyword-filtered and emitted. Without a snapshot (first run, cleared cache)
+the list is taken as a baseline: the MAX_ITEMS most recently updated relevant
+nodes are emitted and every other node is recorded as seen.
+
+fetch() only stages the new snapshot; run_fetcher calls commit() once the
+returned items are stored. With a previous snapshot, relevant nodes cut by
+MAX_ITEMS are left out of it, so they are emitted on a later run instead of
+being marked as seen.
 See docs/SOURCE_EXPLORATION.md §3b for details.
 """
 import json
 import logging
+import os
+from pathlib import Path
 
-import requests
-
-from shared import config
+from shared import config, http_client
+from shared.keywords import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
 NODE_LIST_URL = "https://raw.githubusercontent.com/ltdrdata/ComfyUI-Manager/main/custom-node-list.json"
+SNAPSHOT_PATH = Path(config.CACHE_DIR) / "comfyui_nodes_snapshot.json"
+MAX_ITEMS = 30
 
 ANIME_KEYWORDS = ["anime", "video", "wan", "animation", "i2v", "t2v",
                    "lora", "motion", "temporal", "diffusion"]
 
+_MATCHER = KeywordMatcher(ANIME_KEYWORDS, substring=True)
+
+# Snapshot staged by the last fetch(), saved by commit()
+_pending_snapshot: dict[str, str | None] | None = None
+
 
 def _matches_keywords(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in ANIME_KEYWORDS)
+    return _MATCHER.matches(text)
+
+
+def _node_key(node: dict) -> str:
+    return node.get("reference") or node.get("title") or node.get("name") or ""
+
+
+def _load_snapshot() -> dict[str, str | None] | None:
+    try:
+        return json.loads(SNAPSHOT_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_snapshot(snapshot: dict[str, str | None]) -> None:
+    try:
+        SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SNAPSHOT_PATH.with_name(SNAPSHOT_PATH.name + ".tmp")
+        tmp.write_text(json.dumps(snapshot, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, SNAPSHOT_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to save ComfyUI node snapshot: {e}")
+
+
+def diff_nodes(nodes: list, previous: dict[str, str | None] | None) -> tuple[list[dict], dict[str, str | None]]:
+    """Return (nodes added or updated since `previous`, new snapshot)."""
+    changed = []
+    snapshot: dict[str, str | None] = {}
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        key = _node_key(node)
+        if not key:
+            continue
+        last_update = node.get("last_update") or None
+        snapshot[key] = last_update
+        if previous is None or key not in previous or previous[key] != last_update:
+            changed.append(node)
+    return changed, snapshot
 
 
 def fetch() -> list[dict]:
     """Fetch new ComfyUI custom nodes relevant to anime/video."""
+    global _pending_snapshot
+    _pending_snapshot = None
     items = []
     try:
-        resp = requests.get(NODE_LIST_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(NODE_LIST_URL)
         resp.raise_for_status()
+        # An unchanged list is still diffed: nodes cut by MAX_ITEMS last run
+        # are not in the snapshot yet and are due now.
         data = resp.json()
         nodes = data.get("custom_nodes", data) if isinstance(data, dict) else data
 
-        for node in nodes:
-            if not isinstance(node, dict):
-                continue
+        previous = _load_snapshot()
+        changed, snapshot = diff_nodes(nodes, previous)
+        logger.info(f"ComfyUI node list: {len(changed)} of {len(snapshot)} nodes added or updated")
+
+        relevant = []  # (item, snapshot key)
+        for node in changed:
             title = node.get("title", "") or node.get("name", "")
             desc = node.get("description", "")
             reference = node.get("reference", "")
@@ -45,7 +105,7 @@ def fetch() -> list[dict]:
                 continue
             # Parse actual last_update field; fall back to None (Supabase default)
             last_update = node.get("last_update") or None
-            items.append({
+            relevant.append(({
                 "source_id": "comfyui_nodes",
                 "source_category": "community",
                 "title": title,
@@ -57,10 +117,31 @@ def fetch() -> list[dict]:
                     "author": node.get("author", ""),
                     "install_type": node.get("install_type", ""),
                 },
-            })
-        # Cap to avoid dominating the digest
-        items = items[:30]
-        logger.info(f"Found {len(items)} relevant ComfyUI nodes (capped at 30)")
+            }, _node_key(node)))
+        # Most recently updated first (undated additions keep list order, last),
+        # then cap to avoid dominating the digest
+        relevant.sort(key=lambda pair: pair[0]["published_at"] or "", reverse=True)
+        # On a baseline run the overflow is old history, not news: keep it as seen
+        deferred = relevant[MAX_ITEMS:] if previous is not None else []
+        for _, key in deferred:
+            # Not emitted: keep its previous state so it still counts as changed
+            if key in previous:
+                snapshot[key] = previous[key]
+            else:
+                del snapshot[key]
+        items = [item for item, _ in relevant[:MAX_ITEMS]]
+        _pending_snapshot = snapshot
+        logger.info(f"Found {len(items)} relevant new/updated ComfyUI nodes (capped at {MAX_ITEMS}, "
+                    f"{len(deferred)} deferred)"
+                    + ("" if previous is not None else "; no snapshot, rest taken as baseline"))
     except Exception as e:
         logger.error(f"Failed to fetch ComfyUI node list: {e}")
     return items
+
+
+def commit() -> None:
+    """Save the snapshot staged by fetch(). Called by run_fetcher once its items are stored."""
+    global _pending_snapshot
+    if _pending_snapshot is not None:
+        _save_snapshot(_pending_snapshot)
+        _pending_snapshot = None
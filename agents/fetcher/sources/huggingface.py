@@ -6,10 +6,11 @@ See docs/SOURCE_EXPLORATION.md §1b for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import http_client
+from shared.keywords import KeywordMatcher
 from shared.utils import now_utc_iso
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
@@ -21,40 +22,48 @@ FEEDS = [
 HF_KEYWORDS = ["video", "diffusion", "anime", "generation", "motion", "temporal",
                "wan", "i2v", "t2v", "lora", "animation"]
 
+_MATCHER = KeywordMatcher(HF_KEYWORDS, substring=True)
+
 
 def _matches_keywords(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in HF_KEYWORDS)
+    return _MATCHER.matches(text)
+
+
+def _fetch_feed(feed_config: tuple[str, str, str]) -> list[dict]:
+    """Fetch and keyword-filter a single HuggingFace feed."""
+    feed_url, source_id, feed_name = feed_config
+    items = []
+    try:
+        resp = http_client.get(feed_url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"{feed_name} unchanged since last run, skipping")
+            return items
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries:
+            title = entry.get("title", "")
+            summary = entry.get("summary", "")
+            if not _matches_keywords(f"{title} {summary}"):
+                continue
+            items.append({
+                "source_id": source_id,
+                "source_category": "models",
+                "title": title,
+                "url": entry.get("link", ""),
+                "published_at": entry.get("published", entry.get("updated", now_utc_iso())),
+                "raw_body": summary,
+                "original_language": "en",
+                "metadata": {},
+            })
+        logger.info(f"Fetched {len(items)} items from {feed_name}")
+    except Exception as e:
+        logger.error(f"Failed to fetch {feed_name}: {e}")
+    return items
 
 
 def fetch() -> list[dict]:
     """Fetch from HuggingFace RSS feeds, filtered by keywords."""
     items = []
-    for feed_url, source_id, feed_name in FEEDS:
-        try:
-            resp = requests.get(feed_url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
-            })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries:
-                title = entry.get("title", "")
-                summary = entry.get("summary", "")
-                if not _matches_keywords(f"{title} {summary}"):
-                    continue
-                items.append({
-                    "source_id": source_id,
-                    "source_category": "models",
-                    "title": title,
-                    "url": entry.get("link", ""),
-                    "published_at": entry.get("published", entry.get("updated", now_utc_iso())),
-                    "raw_body": summary,
-                    "original_language": "en",
-                    "metadata": {},
-                })
-                count += 1
-            logger.info(f"Fetched {count} items from {feed_name}")
-        except Exception as e:
-            logger.error(f"Failed to fetch {feed_name}: {e}")
+    for feed_items in map_feeds(_fetch_feed, FEEDS):
+        items.extend(feed_items)
     return items
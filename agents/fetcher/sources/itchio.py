@@ -6,9 +6,8 @@ See docs/SOURCE_EXPLORATION.md §3h for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import http_client
 from shared.utils import now_utc_iso
 
 logger = logging.getLogger(__name__)
@@ -20,10 +19,11 @@ def fetch() -> list[dict]:
     """Fetch interactive fiction games from itch.io RSS."""
     items = []
     try:
-        resp = requests.get(FEED_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(FEED_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("itch.io unchanged since last run, skipping")
+            return items
         feed = feedparser.parse(resp.text)
         for entry in feed.entries:
             items.append({
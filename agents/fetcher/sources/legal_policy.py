@@ -5,10 +5,11 @@ See docs/SOURCE_EXPLORATION.md §5 for details.
 """
 import logging
 
-import requests
 from bs4 import BeautifulSoup
 
-from shared import config
+from shared import http_client
+from shared.keywords import KeywordMatcher
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
@@ -20,45 +21,56 @@ SOURCES = [
 KEYWORDS = ["ai", "copyright", "training data", "generative", "content",
             "creative", "anime", "artificial intelligence"]
 
+_MATCHER = KeywordMatcher(KEYWORDS)
+
 
 def _matches_keywords(text: str) -> bool:
-    return config.keyword_in_text(KEYWORDS, text) > 0
+    return _MATCHER.matches(text)
 
 
-def fetch() -> list[dict]:
-    """Scrape CODA and METI for AI copyright/policy news."""
+def _scrape_site(site_config: tuple[str, str, str]) -> list[dict]:
+    """Scrape one policy site for keyword-matching links."""
+    url, source_id, name = site_config
     items = []
-    for url, source_id, name in SOURCES:
-        try:
-            resp = requests.get(url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
+    try:
+        resp = http_client.get(url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"{name} unchanged since last run, skipping")
+            return items
+        soup = BeautifulSoup(resp.text, "lxml")
+
+        # Generic link extraction from news/press sections
+        for a_tag in soup.select("a"):
+            text = a_tag.get_text(strip=True)
+            href = a_tag.get("href", "")
+            if not text or not href or len(text) < 10:
+                continue
+            if not _matches_keywords(text):
+                continue
+            # Resolve relative URLs
+            if href.startswith("/"):
+                from urllib.parse import urljoin
+                href = urljoin(url, href)
+            items.append({
+                "source_id": source_id,
+                "source_category": "legal",
+                "title": text[:200],
+                "url": href,
+                "published_at": None,  # No date available from scrape; Supabase defaults
+                "raw_body": "",
+                "original_language": "en",
+                "metadata": {"source_org": name},
             })
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "lxml")
+        logger.info(f"Fetched {len(items)} items from {name}")
+    except Exception as e:
+        logger.error(f"Failed to scrape {name}: {e}")
+    return items
 
-            # Generic link extraction from news/press sections
-            for a_tag in soup.select("a"):
-                text = a_tag.get_text(strip=True)
-                href = a_tag.get("href", "")
-                if not text or not href or len(text) < 10:
-                    continue
-                if not _matches_keywords(text):
-                    continue
-                # Resolve relative URLs
-                if href.startswith("/"):
-                    from urllib.parse import urljoin
-                    href = urljoin(url, href)
-                items.append({
-                    "source_id": source_id,
-                    "source_category": "legal",
-                    "title": text[:200],
-                    "url": href,
-                    "published_at": None,  # No date available from scrape; Supabase defaults
-                    "raw_body": "",
-                    "original_language": "en",
-                    "metadata": {"source_org": name},
-                })
-            logger.info(f"Fetched {len([i for i in items if i['source_id'] == source_id])} items from {name}")
-        except Exception as e:
-            logger.error(f"Failed to scrape {name}: {e}")
+
+def fetch() -> list[dict]:
+    """Scrape CODA and METI for AI copyright/policy news."""
+    items = []
+    for site_items in map_feeds(_scrape_site, SOURCES):
+        items.extend(site_items)
     return items
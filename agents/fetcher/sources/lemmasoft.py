@@ -6,10 +6,10 @@ See docs/SOURCE_EXPLORATION.md §3g for details.
 import logging
 
 import feedparser
-import requests
 from bs4 import BeautifulSoup
 
-from shared import config
+from shared import http_client
+from shared.keywords import KeywordMatcher
 from shared.utils import now_utc_iso
 
 logger = logging.getLogger(__name__)
@@ -20,10 +20,11 @@ FEED_URL = "https://lemmasoft.renai.us/forums/feed"
 KEYWORDS = ["ai", "artificial intelligence", "generative", "machine learning",
             "stable diffusion", "comfyui", "animation"]
 
+_MATCHER = KeywordMatcher(KEYWORDS, substring=True)
+
 
 def _matches_keywords(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in KEYWORDS)
+    return _MATCHER.matches(text)
 
 
 def fetch() -> list[dict]:
@@ -32,10 +33,11 @@ def fetch() -> list[dict]:
 
     # Try RSS feed first
     try:
-        resp = requests.get(FEED_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(FEED_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("Lemmasoft RSS unchanged since last run, skipping")
+            return items
         feed = feedparser.parse(resp.text)
         if feed.entries:
             for entry in feed.entries:
@@ -60,10 +62,11 @@ def fetch() -> list[dict]:
 
     # Fallback: scrape forum index
     try:
-        resp = requests.get(FORUM_URL, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
-        })
+        resp = http_client.get(FORUM_URL)
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("Lemmasoft forum index unchanged since last run, skipping")
+            return items
         soup = BeautifulSoup(resp.text, "lxml")
         for a_tag in soup.select("a.topictitle"):
             title = a_tag.get_text(strip=True)
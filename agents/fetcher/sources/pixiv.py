@@ -6,45 +6,50 @@ See docs/SOURCE_EXPLORATION.md §3e for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
 from shared.utils import now_utc_iso
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
 SEARCH_TERMS = ["AI動画", "AI生成", "AIイラスト"]
 
 
-def fetch() -> list[dict]:
-    """Fetch Pixiv AI art/video content via RSSHub search routes."""
+def _fetch_term(term: str) -> list[dict]:
+    """Fetch the RSSHub popular-search feed for a single term."""
     items = []
     rsshub = config.RSSHUB_URL.rstrip("/")
-
-    for term in SEARCH_TERMS:
-        try:
-            feed_url = f"{rsshub}/pixiv/search/{term}/popular"
-            resp = requests.get(feed_url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
+    try:
+        feed_url = f"{rsshub}/pixiv/search/{term}/popular"
+        resp = http_client.get(feed_url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"Pixiv [{term}] unchanged since last run, skipping")
+            return items
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries[:10]:
+            items.append({
+                "source_id": "pixiv_ai",
+                "source_category": "community",
+                "title": entry.get("title", ""),
+                "url": entry.get("link", ""),
+                "published_at": entry.get("published", now_utc_iso()),
+                "raw_body": entry.get("summary", ""),
+                "original_language": "ja",
+                "metadata": {"search_term": term},
             })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries[:10]:
-                items.append({
-                    "source_id": "pixiv_ai",
-                    "source_category": "community",
-                    "title": entry.get("title", ""),
-                    "url": entry.get("link", ""),
-                    "published_at": entry.get("published", now_utc_iso()),
-                    "raw_body": entry.get("summary", ""),
-                    "original_language": "ja",
-                    "metadata": {"search_term": term},
-                })
-                count += 1
-            logger.info(f"Fetched {count} items from Pixiv [{term}]")
-        except Exception as e:
-            logger.warning(f"Failed to fetch Pixiv [{term}]: {e}")
+        logger.info(f"Fetched {len(items)} items from Pixiv [{term}]")
+    except Exception as e:
+        logger.warning(f"Failed to fetch Pixiv [{term}]: {e}")
+    return items
+
+
+def fetch() -> list[dict]:
+    """Fetch Pixiv AI art/video content via RSSHub search routes."""
+    items = []
+    for term_items in map_feeds(_fetch_term, SEARCH_TERMS):
+        items.extend(term_items)
 
     # Deduplicate by URL
     seen = set()
@@ -6,42 +6,48 @@ See docs/SOURCE_EXPLORATION.md §3c for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
 from shared.utils import now_utc_iso
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
 
+def _fetch_subreddit(subreddit: str) -> list[dict]:
+    """Fetch the newest posts of a single subreddit."""
+    items = []
+    try:
+        feed_url = f"https://www.reddit.com/r/{subreddit}/new/.rss"
+        resp = http_client.get(feed_url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"r/{subreddit} unchanged since last run, skipping")
+            return items
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries[:10]:
+            items.append({
+                "source_id": f"reddit_{subreddit.lower()}",
+                "source_category": "community",
+                "title": entry.get("title", ""),
+                "url": entry.get("link", ""),
+                "published_at": entry.get("published", entry.get("updated", now_utc_iso())),
+                "raw_body": entry.get("summary", ""),
+                "original_language": "en",
+                "metadata": {
+                    "subreddit": subreddit,
+                    "author": entry.get("author", ""),
+                },
+            })
+        logger.info(f"Fetched {len(items)} posts from r/{subreddit}")
+    except Exception as e:
+        logger.error(f"Failed to fetch r/{subreddit}: {e}")
+    return items
+
+
 def fetch() -> list[dict]:
     """Fetch latest posts from tracked subreddits via RSS."""
     items = []
-    for subreddit in config.REDDIT_SUBREDDITS:
-        try:
-            feed_url = f"https://www.reddit.com/r/{subreddit}/new/.rss"
-            resp = requests.get(feed_url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
-            })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries[:10]:
-                items.append({
-                    "source_id": f"reddit_{subreddit.lower()}",
-                    "source_category": "community",
-                    "title": entry.get("title", ""),
-                    "url": entry.get("link", ""),
-                    "published_at": entry.get("published", entry.get("updated", now_utc_iso())),
-                    "raw_body": entry.get("summary", ""),
-                    "original_language": "en",
-                    "metadata": {
-                        "subreddit": subreddit,
-                        "author": entry.get("author", ""),
-                    },
-                })
-                count += 1
-            logger.info(f"Fetched {count} posts from r/{subreddit}")
-        except Exception as e:
-            logger.error(f"Failed to fetch r/{subreddit}: {e}")
+    for subreddit_items in map_feeds(_fetch_subreddit, config.REDDIT_SUBREDDITS):
+        items.extend(subreddit_items)
     return items
@@ -5,9 +5,7 @@ See docs/SOURCE_EXPLORATION.md §3d for details.
 """
 import logging
 
-import requests
-
-from shared import config
+from shared import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +16,14 @@ def fetch() -> list[dict]:
     """Fetch AI-tagged posts from Sakugabooru."""
     items = []
     try:
-        resp = requests.get(API_URL, params={
+        resp = http_client.get(API_URL, params={
             "tags": "ai animated",
             "limit": 20,
-        }, timeout=config.REQUEST_TIMEOUT, headers={
-            "User-Agent": config.USER_AGENT,
         })
         resp.raise_for_status()
+        if resp.from_cache:
+            logger.info("Sakugabooru unchanged since last run, skipping")
+            return items
         posts = resp.json()
 
         for post in posts:
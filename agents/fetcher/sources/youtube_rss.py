@@ -6,44 +6,51 @@ See docs/SOURCE_EXPLORATION.md §4 for details.
 import logging
 
 import feedparser
-import requests
 
-from shared import config
+from shared import config, http_client
 from shared.utils import now_utc_iso
+from agents.fetcher.engine import map_feeds
 
 logger = logging.getLogger(__name__)
 
 
+def _fetch_channel(channel_config: tuple[str, str, str]) -> list[dict]:
+    """Fetch the latest videos of a single channel."""
+    channel_id, name, source_id = channel_config
+    items = []
+    try:
+        feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+        resp = http_client.get(feed_url)
+        resp.raise_for_status()
+        if resp.from_cache:
+            logger.info(f"{name} unchanged since last run, skipping")
+            return items
+        feed = feedparser.parse(resp.text)
+        for entry in feed.entries[:5]:
+            video_id = entry.get("yt_videoid", "")
+            items.append({
+                "source_id": source_id,
+                "source_category": "youtube",
+                "title": entry.get("title", ""),
+                "url": entry.get("link", f"https://www.youtube.com/watch?v={video_id}"),
+                "published_at": entry.get("published", now_utc_iso()),
+                "raw_body": entry.get("summary", ""),
+                "original_language": "en",
+                "metadata": {
+                    "channel": name,
+                    "video_id": video_id,
+                    "thumbnail": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg" if video_id else "",
+                },
+            })
+        logger.info(f"Fetched {len(items)} videos from {name}")
+    except Exception as e:
+        logger.error(f"Failed to fetch YouTube channel {name}: {e}")
+    return items
+
+
 def fetch() -> list[dict]:
     """Fetch latest videos from tracked YouTube channels via RSS."""
     items = []
-    for channel_id, name, source_id in config.YOUTUBE_CHANNELS:
-        try:
-            feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-            resp = requests.get(feed_url, timeout=config.REQUEST_TIMEOUT, headers={
-                "User-Agent": config.USER_AGENT,
-            })
-            resp.raise_for_status()
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries[:5]:
-                video_id = entry.get("yt_videoid", "")
-                items.append({
-                    "source_id": source_id,
-                    "source_category": "youtube",
-                    "title": entry.get("title", ""),
-                    "url": entry.get("link", f"https://www.youtube.com/watch?v={video_id}"),
-                    "published_at": entry.get("published", now_utc_iso()),
-                    "raw_body": entry.get("summary", ""),
-                    "original_language": "en",
-                    "metadata": {
-                        "channel": name,
-                        "video_id": video_id,
-                        "thumbnail": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg" if video_id else "",
-                    },
-                })
-                count += 1
-            logger.info(f"Fetched {count} videos from {name}")
-        except Exception as e:
-            logger.error(f"Failed to fetch YouTube channel {name}: {e}")
+    for channel_items in map_feeds(_fetch_channel, config.YOUTUBE_CHANNELS):
+        items.extend(channel_items)
     return items
@@ -1,7 +1,8 @@
 """
 Renderer Agent — generates mid-week bulletin digest (Markdown + HTML).
 
-Reads top-scored items from Supabase, groups by category, renders a premium
+Reads the run's selected items (the summarizer's snapshot, or Supabase when run
+standalone), groups by category, renders a premium
 newspaper-style bulletin with categorized sections, stats boxes, and editor's pick.
 """
 import logging
@@ -10,9 +11,10 @@ from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
 
-from shared import config, supabase_client
-from shared.utils import truncate, clean_html
-from agents.scorer.main import apply_source_cap
+from shared import config, metrics, supabase_client
+from shared.selection import read_selection, render_fields
+from shared.utils import truncate
+from agents.scorer.main import select_digest_items
 
 logger = logging.getLogger(__name__)
 
@@ -60,21 +62,6 @@ def _time_ago(published_at: str | None) -> str:
         return ""
 
 
-def _get_item_data(item_data: dict) -> dict:
-    """Extract normalized item fields from a score row."""
-    item = item_data.get("items", item_data)
-    return {
-        "id": item.get("id", ""),
-        "title": item.get("title_translated") or item.get("title", ""),
-        "url": item.get("url", ""),
-        "source_id": item.get("source_id", ""),
-        "source_category": item.get("source_category", "community"),
-        "published_at": item.get("published_at", ""),
-        "metadata": item.get("metadata", {}),
-        "body": item.get("body_translated") or item.get("raw_body", ""),
-    }
-
-
 def _group_by_category(items: list[dict]) -> dict[str, list[dict]]:
     """Group items by source_category, preserving score order within each group."""
     groups: dict[str, list[dict]] = {}
@@ -140,7 +127,7 @@ def _render_markdown(date_str: str, all_items: list[dict], summary_data: dict |
 
             if idx <= FULL_CARDS_PER_CATEGORY:
                 if not summary:
-                    summary = truncate(clean_html(item["body"]), 150) if item["body"] else ""
+                    summary = truncate(item["body"], 150)
                 lines.append(f"**{idx}. {tldr or item['title']}**")
                 lines.append(f"[{item['title']}]({item['url']})")
                 if summary:
@@ -240,7 +227,7 @@ def _render_category_section(cat_key: str, cat_label: str, cat_items: list[dict]
         tldr = tldr_map.get(item["id"], "")
         summary = item_summaries.get(item["id"], "")
         if not summary:
-            summary = truncate(clean_html(item["body"]), 120) if item["body"] else ""
+            summary = truncate(item["body"], 120)
         cards_html += _render_item_card(item, idx, tldr, summary, pick_id)
 
     # Compact links for the rest (collapsible)
@@ -376,16 +363,10 @@ a:hover{{opacity:0.8;}}
 # MAIN ENTRY
 # =============================================================================
 
-def run_renderer(run_id: str, summary_data: dict | None = None) -> dict:
-    """Generate bulletin digest from scored items."""
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    # Get all scored items — need enough to ensure category diversity after cap
-    scored_items = supabase_client.get_top_scored_items(run_id, limit=1000)
-    scored_items = apply_source_cap(scored_items)
-    logger.info(f"Rendering {len(scored_items)} items for {date_str} (after source cap)")
+def _load_from_supabase(run_id: str) -> tuple[list[dict], dict[str, str]]:
+    """Selection and per-item summaries straight from the DB (standalone runs)."""
+    all_items = [render_fields(score_row) for score_row in select_digest_items(run_id)]
 
-    # Load per-item summaries from DB
     item_summaries: dict[str, str] = {}
     try:
         item_summaries = supabase_client.get_summaries_by_run(run_id)
@@ -393,13 +374,33 @@ def run_renderer(run_id: str, summary_data: dict | None = None) -> dict:
             logger.info(f"Loaded {len(item_summaries)} per-item summaries")
     except Exception as e:
         logger.warning(f"Failed to load summaries: {e}")
+    return all_items, item_summaries
+
+
+def run_renderer(run_id: str, summary_data: dict | None = None) -> dict:
+    """Generate bulletin digest from scored items.
+
+    Reads the summarizer's selection snapshot (summary_data["selection_path"])
+    when available, otherwise falls back to Supabase.
+    """
+    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    # Flatten items in score order
-    all_items = [_get_item_data(score_row) for score_row in scored_items]
+    snapshot = (summary_data or {}).get("selection_path")
+    with metrics.timer("render.load"):
+        if snapshot and os.path.exists(snapshot):
+            # Items in score order, with their summaries
+            all_items = read_selection(snapshot)
+            item_summaries = {item["id"]: item["summary"] for item in all_items if item.get("summary")}
+            logger.info(f"Loaded {len(all_items)} items from selection snapshot")
+        else:
+            all_items, item_summaries = _load_from_supabase(run_id)
+    logger.info(f"Rendering {len(all_items)} items for {date_str} (after source cap)")
 
     # Render
-    md_content = _render_markdown(date_str, all_items, summary_data, item_summaries)
-    html_content = _render_bulletin_html(date_str, all_items, summary_data, item_summaries)
+    with metrics.timer("render.markdown"):
+        md_content = _render_markdown(date_str, all_items, summary_data, item_summaries)
+    with metrics.timer("render.html"):
+        html_content = _render_bulletin_html(date_str, all_items, summary_data, item_summaries)
 
     # Write files
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -4,15 +4,30 @@ Scorer Agent — computes relevance scores for fetched items.
 Reads items from Supabase, applies weighted scoring, writes scores back.
 See docs/AGENTS.md for the full contract and scoring weights.
 """
+import hashlib
+import heapq
+import json
 import logging
 import math
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from agents.scorer.columnar import extract_columns, static_scores
 from shared import config, supabase_client
+from shared.keywords import KeywordMatcher
 from shared.utils import parse_date
 
 logger = logging.getLogger(__name__)
 
+_SCORING_KEYWORDS = KeywordMatcher(config.KEYWORDS_HIGH, config.KEYWORDS_MEDIUM, config.KEYWORDS_LOW)
+
+# Fingerprint of the config the stored static components depend on; changing
+# a keyword list or source priority makes every item recompute them once.
+STATIC_SCORE_VERSION = hashlib.sha256(json.dumps(
+    [config.KEYWORDS_HIGH, config.KEYWORDS_MEDIUM, config.KEYWORDS_LOW, config.SOURCE_PRIORITY],
+    sort_keys=True,
+).encode("utf-8")).hexdigest()[:16]
+STATIC_SCORE_PAGE_SIZE = 1000
+
 
 def _recency_score(published_at: str | None) -> float:
     """Score based on how recent the item is. 0-1, higher = newer."""
@@ -60,12 +75,9 @@ def _engagement_score(metadata: dict) -> float:
 
 def _keyword_score(title: str, body: str) -> float:
     """Score based on keyword relevance. 0-1."""
-    text = f"{title} {body}".lower()
     score = 0.0
 
-    high_matches = config.keyword_in_text(config.KEYWORDS_HIGH, text)
-    med_matches = config.keyword_in_text(config.KEYWORDS_MEDIUM, text)
-    low_matches = config.keyword_in_text(config.KEYWORDS_LOW, text)
+    high_matches, med_matches, low_matches = _SCORING_KEYWORDS.counts(f"{title} {body}")
 
     # Weighted keyword presence
     score += min(high_matches * 0.15, 0.6)
@@ -80,53 +92,41 @@ def _source_priority_score(source_category: str) -> float:
     return config.SOURCE_PRIORITY.get(source_category, 0.5)
 
 
+def _store_static_scores(since: str) -> int:
+    """Compute and store the item-intrinsic components (engagement, keyword,
+    source priority) for window items that don't have current ones yet."""
+    stored = 0
+    while True:
+        items = supabase_client.get_items_missing_static_scores(
+            since, STATIC_SCORE_VERSION, limit=STATIC_SCORE_PAGE_SIZE)
+        if not items:
+            break
+        components = static_scores(extract_columns(items, _SCORING_KEYWORDS))
+        rows = [
+            {"id": item["id"], **{name: float(values[i]) for name, values in components.items()}}
+            for i, item in enumerate(items)
+        ]
+        updated = supabase_client.set_item_static_scores(rows, STATIC_SCORE_VERSION)
+        stored += updated
+        # Stored items drop out of the query, so the next call returns the next page
+        if updated < len(items) or len(items) < STATIC_SCORE_PAGE_SIZE:
+            break
+    return stored
+
+
 def run_scorer(run_id: str) -> dict:
-    """Score all items from a given digest run."""
-    items = supabase_client.get_unscored_items_since(run_id, hours=config.DIGEST_WINDOW_HOURS)
-    logger.info(f"Scoring {len(items)} items for run {run_id}")
-
-    weights = config.SCORING_WEIGHTS
-    scores_to_insert = []
-
-    for item in items:
-        title = item.get("title", "")
-        body = item.get("raw_body", "") or ""
-        title_translated = item.get("title_translated", "")
-        body_translated = item.get("body_translated", "")
-        # Use translated text for keyword matching if available
-        search_title = title_translated or title
-        search_body = body_translated or body
-
-        r_score = _recency_score(item.get("published_at"))
-        e_score = _engagement_score(item.get("metadata", {}))
-        k_score = _keyword_score(search_title, search_body)
-        s_score = _source_priority_score(item.get("source_category", ""))
-
-        total = (
-            weights["recency"] * r_score +
-            weights["engagement"] * e_score +
-            weights["keyword_relevance"] * k_score +
-            weights["source_priority"] * s_score
-        )
-
-        scores_to_insert.append({
-            "item_id": item["id"],
-            "run_id": run_id,
-            "total_score": round(total, 4),
-            "recency_score": round(r_score, 4),
-            "engagement_score": round(e_score, 4),
-            "keyword_score": round(k_score, 4),
-            "source_priority_score": round(s_score, 4),
-        })
-
-    # Insert scores in batches
-    inserted = 0
-    for i in range(0, len(scores_to_insert), 50):
-        batch = scores_to_insert[i:i + 50]
-        try:
-            inserted += supabase_client.insert_scores(batch)
-        except Exception as e:
-            logger.error(f"Failed to insert score batch: {e}")
+    """Score all items from a given digest run.
+
+    Static components are computed once per item (first pass) and stored on
+    the item; each run then only computes recency and the weighted total, in
+    Postgres (score_run_items).
+    """
+    since = (datetime.now(timezone.utc) - timedelta(hours=config.DIGEST_WINDOW_HOURS)).isoformat()
+    computed = _store_static_scores(since)
+    logger.info(f"Computed static score components for {computed} items")
+
+    inserted = supabase_client.score_run_items(run_id, since, config.SCORING_WEIGHTS)
+    logger.info(f"Scored {inserted} items for run {run_id}")
 
     # Update run
     supabase_client.update_run(run_id, {"items_scored": inserted})
@@ -136,60 +136,66 @@ def run_scorer(run_id: str) -> dict:
     return result
 
 
-def apply_source_cap(scored_items: list[dict], max_per_source: int | None = None) -> list[dict]:
+def apply_source_cap(scored_items: list[dict], max_per_source: int | None = None,
+                     limit: int | None = None) -> list[dict]:
     """Apply per-source cap and ensure category diversity.
     Items should already be sorted by score descending.
 
-    Strategy:
-    1. First pass: pick top items per category (min 3 per non-empty category)
-    2. Fill remaining slots from the overall ranked list with per-source cap
+    Single pass over the score-ordered rows:
+    - rows whose source already has `max_per_source` picks are skipped
+    - the first 3 eligible rows of each category are reserved
+    - other eligible rows are fill candidates
+
+    With a `limit`, the result is every reserved row plus the best fill rows up
+    to `limit`, and the scan stops as soon as that set can no longer change
+    (enough fill rows and every configured category has its minimum). The
+    result keeps the input (score) order.
     """
     cap = max_per_source or config.MAX_ITEMS_PER_SOURCE
     min_per_category = 3
+    expected_categories = set(config.SOURCE_PRIORITY)
 
-    # Group by category preserving score order
-    by_category: dict[str, list[dict]] = {}
-    for item_row in scored_items:
-        item = item_row.get("items", item_row)
-        cat = item.get("source_category", "community")
-        by_category.setdefault(cat, []).append(item_row)
-
-    # Phase 1: Reserve minimum slots per category
-    reserved_ids: set[str] = set()
-    result: list[dict] = []
     source_counts: dict[str, int] = {}
+    category_counts: dict[str, int] = {}
+    reserved: list[tuple[int, dict]] = []
+    fill: list[tuple[int, dict]] = []
+    categories_short = len(expected_categories)
 
-    for cat, cat_items in by_category.items():
-        added = 0
-        for item_row in cat_items:
-            if added >= min_per_category:
-                break
-            item = item_row.get("items", item_row)
-            source = item.get("source_id", "unknown")
-            item_id = item.get("id", "")
-            if source_counts.get(source, 0) >= cap:
-                continue
-            result.append(item_row)
-            reserved_ids.add(item_id)
-            source_counts[source] = source_counts.get(source, 0) + 1
-            added += 1
-
-    # Phase 2: Fill remaining from overall ranked list
-    for item_row in scored_items:
+    for position, item_row in enumerate(scored_items):
         item = item_row.get("items", item_row)
-        item_id = item.get("id", "")
-        if item_id in reserved_ids:
-            continue
         source = item.get("source_id", "unknown")
         if source_counts.get(source, 0) >= cap:
             continue
         source_counts[source] = source_counts.get(source, 0) + 1
-        result.append(item_row)
-        reserved_ids.add(item_id)
 
-    # Re-sort by total_score descending
-    result.sort(key=lambda r: r.get("total_score", 0), reverse=True)
-    return result
+        cat = item.get("source_category", "community")
+        taken = category_counts.get(cat, 0)
+        category_counts[cat] = taken + 1
+        if taken < min_per_category:
+            reserved.append((position, item_row))
+            if taken + 1 == min_per_category and cat in expected_categories:
+                categories_short -= 1
+        else:
+            fill.append((position, item_row))
+
+        if limit is not None and categories_short == 0 and len(reserved) + len(fill) >= limit:
+            break
+
+    if limit is not None:
+        fill = fill[:max(0, limit - len(reserved))]
+    # Both lists are in input order; merge them back by position
+    return [row for _, row in heapq.merge(reserved, fill, key=lambda pair: pair[0])]
+
+
+def select_digest_items(run_id: str) -> list[dict]:
+    """The capped, score-ordered score rows a run's digest is built from.
+
+    Computed once per run by run.py and shared by the summarizer and renderer;
+    each stage calls this itself only when run standalone.
+    """
+    # Fetch enough rows to ensure category diversity after the cap
+    scored_items = supabase_client.get_top_scored_items(run_id, limit=1000)
+    return apply_source_cap(scored_items)
 
 
 if __name__ == "__main__":
@@ -3,19 +3,33 @@ Summarizer Agent — generates per-item summaries, themes, editor's pick, and ed
 
 Uses Azure OpenAI to transform raw items into a curated mid-week bulletin.
 """
+import hashlib
 import json
 import logging
+import math
+import time
 from datetime import datetime, timezone
+from functools import partial
 
-from shared import config, supabase_client
-from shared.llm_client import generate
-from shared.utils import truncate, clean_html
+from shared import config, metrics, supabase_client
+from shared.json_stream import ArrayItemParser, salvage_array_items
+from shared.llm_client import generate, generate_stream, run_parallel
+from shared.selection import write_selection
+from shared.utils import truncate, clean_html, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 10
+SUMMARIZE_LIMIT = 50
 BODY_TRUNCATE_LEN = 300
 
+# Summary call packing (see _pack_batches). Output per item is a <=60-word
+# summary, a tldr and the JSON around them; the headroom covers estimation
+# error and the reasoning tokens that count against max_tokens.
+ITEM_COMPLETION_TOKENS = 120
+COMPLETION_HEADROOM = 1.5
+# Items missing from a response are re-sent this many times, in smaller calls
+MISSING_RETRY_ROUNDS = 2
+
 
 def _prepare_item(item: dict) -> dict:
     """Extract fields needed for summarization."""
@@ -32,14 +46,31 @@ def _prepare_item(item: dict) -> dict:
     }
 
 
-def _summarize_batch(items: list[dict]) -> list[dict]:
-    """Summarize a batch of items. Returns list of {id, summary, tldr}."""
-    items_text = json.dumps(
-        [{"id": i["id"], "title": i["title"], "body": i["body"], "source_id": i["source_id"]}
-         for i in items],
-        ensure_ascii=False,
-    )
-    prompt = f"""You are writing for "The Anime AI Digest" — a mid-week bulletin for anime and webtoon creators who use AI tools in their workflow.
+def _summary_hash(item: dict) -> str:
+    """SHA-256 of the title and body the summary is generated from."""
+    raw = f"{item['title']}\n{item['body']}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _reusable_summaries(items: list[dict], hashes: dict[str, str]) -> dict[str, dict]:
+    """Stored summaries whose item content is unchanged. Returns {item_id: row}."""
+    try:
+        existing = supabase_client.get_existing_summaries([item["id"] for item in items])
+    except Exception as e:
+        logger.warning(f"Failed to look up existing summaries, summarizing all items: {e}")
+        return {}
+    return {
+        item_id: row for item_id, row in existing.items()
+        if row.get("summary") and row.get("content_hash") == hashes.get(item_id)
+    }
+
+
+def _summary_payload(item: dict) -> dict:
+    return {"id": item["id"], "title": item["title"], "body": item["body"], "source_id": item["source_id"]}
+
+
+def _summary_prompt(items_text: str) -> str:
+    return f"""You are writing for "The Anime AI Digest" — a mid-week bulletin for anime and webtoon creators who use AI tools in their workflow.
 
 For each item below, write:
 - "summary": 2 sentences in an objective, informative tone (knowledgeable but neutral — never corporate, never prescriptive). Sentence 1 = what this is, concretely. Sentence 2 = the broader significance or what's notable about it. Max 60 words.
@@ -58,13 +89,99 @@ Items:
 
 Return JSON: {{"summaries": [{{"id": "...", "summary": "...", "tldr": "..."}}]}}"""
 
+
+def _item_tokens(item: dict) -> tuple[int, int]:
+    """Estimated (prompt, completion) tokens one item adds to a summary call."""
+    prompt = estimate_tokens(json.dumps(_summary_payload(item), ensure_ascii=False)) + 1
+    return prompt, ITEM_COMPLETION_TOKENS + estimate_tokens(item["id"])
+
+
+def _pack_batches(items: list[dict], token_budget: int) -> list[tuple[list[dict], int]]:
+    """Bin-pack items into as few summary calls as fit token_budget.
+
+    First-fit decreasing on estimated tokens. A call fits when its prompt plus
+    its completion allowance (estimate * COMPLETION_HEADROOM, capped at
+    SUMMARY_MAX_COMPLETION_TOKENS) stays within the budget. Returns
+    (items, max_tokens) per call; an item too large for any call gets its own.
+    """
+    overhead = estimate_tokens(_summary_prompt("[]"))
+
+    def allowance(completion: int) -> int:
+        return math.ceil(completion * COMPLETION_HEADROOM)
+
+    def fits(prompt: int, completion: int) -> bool:
+        return (allowance(completion) <= config.SUMMARY_MAX_COMPLETION_TOKENS
+                and overhead + prompt + allowance(completion) <= token_budget)
+
+    costed = sorted(((item, *_item_tokens(item)) for item in items), key=lambda c: c[1] + c[2], reverse=True)
+    bins: list[list] = []  # [items, prompt tokens, completion tokens]
+    for item, prompt, completion in costed:
+        for b in bins:
+            if fits(b[1] + prompt, b[2] + completion):
+                b[0].append(item)
+                b[1] += prompt
+                b[2] += completion
+                break
+        else:
+            bins.append([[item], prompt, completion])
+    return [(batch, min(allowance(completion), config.SUMMARY_MAX_COMPLETION_TOKENS))
+            for batch, _, completion in bins]
+
+
+def _summarize_batch(items: list[dict], max_tokens: int = 2048) -> list[dict]:
+    """Summarize a batch of items. Returns list of {id, summary, tldr}.
+
+    With SUMMARY_STREAMING the response is parsed as it arrives, so the
+    summaries completed before a truncated or broken tail are kept.
+    """
+    prompt = _summary_prompt(json.dumps([_summary_payload(i) for i in items], ensure_ascii=False))
+    messages = [{"role": "user", "content": prompt}]
+
+    if config.SUMMARY_STREAMING:
+        return _stream_summaries(messages, max_tokens)
+
     response = generate(
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=2048,
+        messages=messages,
+        max_tokens=max_tokens,
         temperature=0.3,
         response_format={"type": "json_object"},
     )
+    return _parse_summaries(response)
 
+
+def _stream_summaries(messages: list[dict], max_tokens: int) -> list[dict]:
+    """Stream a summary call, keeping each summary object as soon as it is complete."""
+    parser = ArrayItemParser()
+    rows: list[dict] = []
+    chunks: list[str] = []
+    start = time.perf_counter()
+    try:
+        for chunk in generate_stream(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        ):
+            chunks.append(chunk)
+            for row in parser.feed(chunk):
+                if not isinstance(row, dict):
+                    continue
+                if not rows:
+                    metrics.observe("summarize.first_item_seconds", time.perf_counter() - start)
+                rows.append(row)
+    except Exception as e:
+        if not rows:
+            raise
+        logger.warning(f"Summary stream failed after {len(rows)} items, keeping them: {e}")
+        return rows
+    if rows:
+        return rows
+    # Nothing in array form; fall back to the other shapes _parse_summaries accepts
+    return _parse_summaries("".join(chunks))
+
+
+def _parse_summaries(response: str) -> list[dict]:
+    """Summary rows from a complete response. A malformed response keeps its complete rows."""
     try:
         parsed = json.loads(response)
         if isinstance(parsed, list):
@@ -78,8 +195,44 @@ Return JSON: {{"summaries": [{{"id": "...", "summary": "...", "tldr": "..."}}]}}
         logger.warning(f"Unexpected summary response format: {type(parsed)}")
         return []
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse summary response: {e}")
-        return []
+        rows = [row for row in salvage_array_items(response) if isinstance(row, dict)]
+        logger.error(f"Failed to parse summary response ({e}), salvaged {len(rows)} items")
+        return rows
+
+
+def _summarize_items(items: list[dict]) -> list[dict]:
+    """Summaries for items, packed into token-budgeted calls run in parallel.
+
+    Items a response leaves out (truncated or skipped) are re-sent on their
+    own, with the budget halved each round so the retry calls are smaller.
+    """
+    summaries: list[dict] = []
+    pending = items
+    budget = config.SUMMARY_BATCH_TOKEN_BUDGET
+    for attempt in range(MISSING_RETRY_ROUNDS + 1):
+        batches = _pack_batches(pending, budget)
+        logger.info(f"Summarizing {len(pending)} items in {len(batches)} calls")
+        results = run_parallel([partial(_summarize_batch, batch, max_tokens) for batch, max_tokens in batches])
+        done: set[str] = set()
+        for n, ((batch, _), result) in enumerate(zip(batches, results), 1):
+            if isinstance(result, Exception):
+                logger.error(f"Batch {n} failed: {result}")
+                continue
+            sent = {item["id"] for item in batch}
+            returned = [row for row in result if row.get("id") in sent and row.get("summary")]
+            summaries.extend(returned)
+            done.update(row["id"] for row in returned)
+            logger.info(f"Batch {n}: summarized {len(returned)}/{len(batch)} items")
+
+        pending = [item for item in pending if item["id"] not in done]
+        if not pending:
+            break
+        if attempt < MISSING_RETRY_ROUNDS:
+            logger.warning(f"Retrying {len(pending)} items missing from summary responses")
+            budget = max(budget // 2, 1)
+    if pending:
+        logger.error(f"No summary for {len(pending)} items after {MISSING_RETRY_ROUNDS} retries")
+    return summaries
 
 
 def _extract_themes(items_with_summaries: list[dict]) -> list[str]:
@@ -117,8 +270,9 @@ Return JSON: {{"themes": ["...", "..."]}}"""
             return parsed
         return []
     except json.JSONDecodeError:
-        logger.error("Failed to parse themes response")
-        return []
+        themes = [theme for theme in salvage_array_items(response) if isinstance(theme, str)]
+        logger.error(f"Failed to parse themes response, salvaged {len(themes)} themes")
+        return themes
 
 
 def _generate_highlights(themes: list[str], top_items: list[dict]) -> str:
@@ -197,70 +351,197 @@ Return JSON: {{"pick_id": "...", "pick_reason": "..."}}"""
         return None
 
 
-def _generate_section_stats(items_by_category: dict[str, list[dict]]) -> dict[str, list[str]]:
-    """Generate 3-4 punchy numerical facts per category section."""
-    section_stats: dict[str, list[str]] = {}
-    for category, items in items_by_category.items():
-        if not items:
-            continue
-        items_text = json.dumps(
-            [{"title": i["title"], "summary": i.get("summary", ""), "source_id": i.get("source_id", "")}
-             for i in items[:15]],
-            ensure_ascii=False,
-        )
-        prompt = f"""Given these {category} articles from an anime/webtoon AI digest, generate exactly 3-4 punchy numerical/statistical facts.
-
-Examples of good facts:
+# Shared by the per-category stats prompt and the combined editorial prompt
+_FACTS_RULES = """Examples of good facts:
 - "4 new LoRA models released this week"
 - "$2.3B anime AI market projected by 2027"
 - "12,000+ ComfyUI workflow downloads"
 - "3 major video generation models updated"
-
 Each fact must reference a specific number from the articles or a publicly known statistic relevant to the topic.
-Keep each fact under 15 words. Be specific, not vague.
+Keep each fact under 15 words. Be specific, not vague."""
+
+
+def _generate_category_stats(category: str, items: list[dict]) -> list[str]:
+    """Generate 3-4 punchy numerical facts for one category section."""
+    items_text = json.dumps(
+        [{"title": i["title"], "summary": i.get("summary", ""), "source_id": i.get("source_id", "")}
+         for i in items[:15]],
+        ensure_ascii=False,
+    )
+    prompt = f"""Given these {category} articles from an anime/webtoon AI digest, generate exactly 3-4 punchy numerical/statistical facts.
+
+{_FACTS_RULES}
 
 Articles:
 {items_text}
 
 Return JSON: {{"facts": ["...", "...", "..."]}}"""
 
-        try:
-            response = generate(
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=512,
-                temperature=0.4,
-                response_format={"type": "json_object"},
-            )
-            parsed = json.loads(response)
-            facts = parsed.get("facts", []) if isinstance(parsed, dict) else []
+    response = generate(
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=512,
+        temperature=0.4,
+        response_format={"type": "json_object"},
+    )
+    parsed = json.loads(response)
+    facts = parsed.get("facts", []) if isinstance(parsed, dict) else []
+    return facts[:4]
+
+
+def _generate_section_stats(items_by_category: dict[str, list[dict]]) -> dict[str, list[str]]:
+    """Generate 3-4 punchy numerical facts per category section, one call per category in parallel."""
+    categories = [cat for cat, items in items_by_category.items() if items]
+    results = run_parallel([partial(_generate_category_stats, cat, items_by_category[cat])
+                            for cat in categories])
+    section_stats: dict[str, list[str]] = {}
+    for category, facts in zip(categories, results):
+        if isinstance(facts, Exception):
+            logger.warning(f"Failed to generate stats for {category}: {facts}")
+        elif facts:
+            section_stats[category] = facts
+            logger.info(f"Generated {len(facts)} stats for {category}")
+    return section_stats
+
+
+def _editorial_prompt(items_text: str, categories: list[str]) -> str:
+    return f"""You are preparing the editorial extras for this week's "The Anime AI Digest" — a bulletin for anime/webtoon creators who use AI tools.
+
+Each item below is tagged with its section category.
+
+1. Editor's Pick: choose ONE item with "pick_eligible": true as the pick — the one most immediately useful or exciting for an anime/webtoon creator. Write a 1-sentence reason (15-25 words) explaining WHY in practical creator terms.
+
+2. Section stats: for EACH of these categories: {", ".join(categories)} — generate exactly 3-4 punchy numerical/statistical facts from that category's items.
+{_FACTS_RULES}
+
+Items:
+{items_text}
+
+Return JSON: {{"pick_id": "...", "pick_reason": "...", "section_stats": {{"<category>": ["...", "...", "..."]}}}}"""
+
+
+def _combined_editorial(items: list[dict], items_by_category: dict[str, list[dict]],
+                        categories: list[str]) -> tuple[dict | None, dict[str, list[str]]]:
+    """One request for the editor's pick and every category's stats.
+
+    Sends the items the separate calls would (the top 20 for the pick, the
+    top 15 of each category for stats) once each; only the top 20 are marked
+    pick_eligible, and a pick outside them is dropped. Returns (pick, section_stats),
+    leaving out whatever the response doesn't answer usably.
+    """
+    category_of = {item["id"]: cat for cat in categories for item in items_by_category[cat]}
+    eligible = {item["id"] for item in items[:20]}
+    wanted = eligible | {item["id"] for cat in categories for item in items_by_category[cat][:15]}
+    items_text = json.dumps(
+        [{"id": i["id"], "title": i["title"], "summary": i.get("summary", ""),
+          "source_id": i.get("source_id", ""), "category": category_of.get(i["id"], ""),
+          "pick_eligible": i["id"] in eligible}
+         for i in items if i["id"] in wanted],
+        ensure_ascii=False,
+    )
+
+    response = generate(
+        messages=[{"role": "user", "content": _editorial_prompt(items_text, categories)}],
+        max_tokens=256 + 512 * len(categories),
+        temperature=0.4,
+        response_format={"type": "json_object"},
+    )
+    parsed = json.loads(response)
+    if not isinstance(parsed, dict):
+        return None, {}
+
+    pick = None
+    if parsed.get("pick_id") in eligible:
+        pick = {"pick_id": parsed["pick_id"], "pick_reason": parsed.get("pick_reason", "")}
+    stats = parsed.get("section_stats")
+    section_stats = {}
+    if isinstance(stats, dict):
+        for category in categories:
+            facts = [f for f in stats.get(category) or [] if isinstance(f, str) and f]
             if facts:
                 section_stats[category] = facts[:4]
-                logger.info(f"Generated {len(facts[:4])} stats for {category}")
-        except Exception as e:
-            logger.warning(f"Failed to generate stats for {category}: {e}")
-    return section_stats
+    return pick, section_stats
 
 
-def run_summarizer(run_id: str) -> dict:
-    """Run the summarizer agent. Returns dict with themes, highlights, pick, and count."""
+def _generate_editorial(items: list[dict],
+                        items_by_category: dict[str, list[dict]]) -> tuple[dict | None, dict[str, list[str]]]:
+    """Editor's pick and section stats from one combined request. Never raises.
+
+    Falls back to _select_editors_pick() if the response has no valid pick,
+    and to per-category calls for only the categories it leaves out. A failed
+    fallback pick is returned as its exception, like run_parallel() would.
+    """
+    categories = [cat for cat, cat_items in items_by_category.items() if cat_items]
+    pick, section_stats = None, {}
+    try:
+        pick, section_stats = _combined_editorial(items, items_by_category, categories)
+        logger.info(f"Combined editorial request: pick={'yes' if pick else 'no'}, "
+                    f"stats for {len(section_stats)}/{len(categories)} categories")
+    except Exception as e:
+        logger.warning(f"Combined editorial request failed, falling back to separate calls: {e}")
+
+    missing = {cat: items_by_category[cat] for cat in categories if cat not in section_stats}
+    fallbacks = []
+    if missing:
+        logger.info(f"Generating stats separately for: {', '.join(missing)}")
+        fallbacks.append(partial(_generate_section_stats, missing))
+    if pick is None:
+        fallbacks.append(partial(_select_editors_pick, items))
+    results = run_parallel(fallbacks)
+    if missing:
+        extra = results.pop(0)
+        if isinstance(extra, Exception):
+            logger.warning(f"Fallback section stats failed: {extra}")
+        else:
+            section_stats.update(extra)
+    if pick is None:
+        pick = results.pop(0)
+    return pick, section_stats
+
+
+def _themes_and_highlights(items: list[dict]) -> tuple[list[str], str]:
+    """Theme extraction followed by the highlights that build on it. Never raises."""
+    try:
+        themes = _extract_themes(items)
+        logger.info(f"Extracted themes: {themes}")
+    except Exception as e:
+        logger.error(f"Theme extraction failed: {e}")
+        themes = []
+
+    try:
+        highlights = _generate_highlights(themes, items)
+        logger.info(f"Generated highlights ({len(highlights)} chars)")
+    except Exception as e:
+        logger.error(f"Highlights generation failed: {e}")
+        highlights = ""
+    return themes, highlights
+
+
+def run_summarizer(run_id: str, selection: list[dict] | None = None) -> dict:
+    """Run the summarizer agent. Returns dict with themes, highlights, pick, and count.
+
+    `selection` is the run's capped score rows (select_digest_items); it is
+    fetched here only when the summarizer runs standalone.
+    """
     if not config.AZURE_OPENAI_API_KEY or not config.AZURE_OPENAI_ENDPOINT:
         logger.warning("Azure OpenAI not configured — skipping summarization")
-        return {"items_summarized": 0, "themes": [], "highlights": "",
+        # Still hand the renderer the selection it was given
+        selection_path = write_selection(run_id, selection, {}) if selection else ""
+        return {"items_summarized": 0, "items_reused": 0, "themes": [], "highlights": "",
                 "tldr_map": {}, "editor_pick_id": None, "editor_pick_reason": "",
-                "section_stats": {}}
+                "section_stats": {}, "selection_path": selection_path}
 
     # Get top scored items with category diversity
-    from agents.scorer.main import apply_source_cap
-    scored_items = supabase_client.get_top_scored_items(run_id, limit=1000)
-    scored_items = apply_source_cap(scored_items)
-    if not scored_items:
+    from agents.scorer.main import apply_source_cap, select_digest_items
+    if selection is None:
+        selection = select_digest_items(run_id)
+    if not selection:
         logger.warning("No scored items found for summarization")
-        return {"items_summarized": 0, "themes": [], "highlights": "",
+        return {"items_summarized": 0, "items_reused": 0, "themes": [], "highlights": "",
                 "tldr_map": {}, "editor_pick_id": None, "editor_pick_reason": "",
-                "section_stats": {}}
+                "section_stats": {}, "selection_path": ""}
 
     # Cap to 50 for summarization after diversity selection
-    scored_items = scored_items[:50]
+    scored_items = apply_source_cap(selection, limit=SUMMARIZE_LIMIT)
 
     # Extract item data from score rows
     items = []
@@ -268,18 +549,17 @@ def run_summarizer(run_id: str) -> dict:
         item = score_row.get("items", score_row)
         items.append(_prepare_item(item))
 
-    logger.info(f"Summarizing {len(items)} items in batches of {BATCH_SIZE}")
+    # Step 1: Per-item summaries. Items carried over from a previous digest
+    # with unchanged content reuse their stored summary; the rest go to the
+    # LLM, all batches in parallel.
+    hashes = {item["id"]: _summary_hash(item) for item in items}
+    reused = _reusable_summaries(items, hashes)
+    to_summarize = [item for item in items if item["id"] not in reused]
+    logger.info(f"Reusing {len(reused)} stored summaries, summarizing {len(to_summarize)} items")
 
-    # Step 1: Per-item summaries in batches
-    all_summaries = []
-    for i in range(0, len(items), BATCH_SIZE):
-        batch = items[i:i + BATCH_SIZE]
-        try:
-            batch_summaries = _summarize_batch(batch)
-            all_summaries.extend(batch_summaries)
-            logger.info(f"Batch {i // BATCH_SIZE + 1}: summarized {len(batch_summaries)} items")
-        except Exception as e:
-            logger.error(f"Batch {i // BATCH_SIZE + 1} failed: {e}")
+    all_summaries = [{"id": item_id, "summary": row["summary"], "tldr": row.get("tldr") or ""}
+                     for item_id, row in reused.items()]
+    all_summaries.extend(_summarize_items(to_summarize))
 
     # Build lookup maps and attach to items
     summary_map = {s["id"]: s["summary"] for s in all_summaries if "id" in s and "summary" in s}
@@ -287,9 +567,13 @@ def run_summarizer(run_id: str) -> dict:
     for item in items:
         item["summary"] = summary_map.get(item["id"], "")
 
+    # Snapshot the full selection with its summaries for the renderer
+    selection_path = write_selection(run_id, selection, summary_map)
+
     # Store summaries in Supabase
     summary_rows = [
-        {"item_id": item["id"], "run_id": run_id, "summary": item["summary"]}
+        {"item_id": item["id"], "run_id": run_id, "summary": item["summary"],
+         "tldr": tldr_map.get(item["id"], ""), "content_hash": hashes[item["id"]]}
         for item in items if item["summary"]
     ]
     if summary_rows:
@@ -299,54 +583,51 @@ def run_summarizer(run_id: str) -> dict:
         except Exception as e:
             logger.error(f"Failed to store summaries: {e}")
 
-    # Step 2: Theme extraction
-    try:
-        themes = _extract_themes(items)
-        logger.info(f"Extracted themes: {themes}")
-    except Exception as e:
-        logger.error(f"Theme extraction failed: {e}")
-        themes = []
-
-    # Step 3: Editorial highlights
-    try:
-        highlights = _generate_highlights(themes, items)
-        logger.info(f"Generated highlights ({len(highlights)} chars)")
-    except Exception as e:
-        logger.error(f"Highlights generation failed: {e}")
-        highlights = ""
+    # Steps 2-5 only depend on the summaries: run the themes -> highlights chain
+    # alongside the editor's pick and the per-category stats (one combined
+    # request with EDITORIAL_COMBINED_CALL, otherwise separate calls).
+    items_by_category: dict[str, list[dict]] = {}
+    for item in items:
+        cat = item.get("source_category", "community")
+        items_by_category.setdefault(cat, []).append(item)
+
+    if config.EDITORIAL_COMBINED_CALL:
+        (themes, highlights), (pick, section_stats) = run_parallel([
+            partial(_themes_and_highlights, items),
+            partial(_generate_editorial, items, items_by_category),
+        ])
+    else:
+        (themes, highlights), pick, section_stats = run_parallel([
+            partial(_themes_and_highlights, items),
+            partial(_select_editors_pick, items),
+            partial(_generate_section_stats, items_by_category),
+        ])
 
-    # Step 4: Editor's pick
     editor_pick_id = None
     editor_pick_reason = ""
-    try:
-        pick = _select_editors_pick(items)
-        if pick:
-            editor_pick_id = pick.get("pick_id")
-            editor_pick_reason = pick.get("pick_reason", "")
-            logger.info(f"Editor's pick: {editor_pick_id}")
-    except Exception as e:
-        logger.error(f"Editor's pick selection failed: {e}")
-
-    # Step 5: Section stats (numerical facts per category)
-    section_stats: dict[str, list[str]] = {}
-    try:
-        items_by_category: dict[str, list[dict]] = {}
-        for item in items:
-            cat = item.get("source_category", "community")
-            items_by_category.setdefault(cat, []).append(item)
-        section_stats = _generate_section_stats(items_by_category)
+    if isinstance(pick, Exception):
+        logger.error(f"Editor's pick selection failed: {pick}")
+    elif pick:
+        editor_pick_id = pick.get("pick_id")
+        editor_pick_reason = pick.get("pick_reason", "")
+        logger.info(f"Editor's pick: {editor_pick_id}")
+
+    if isinstance(section_stats, Exception):
+        logger.error(f"Section stats generation failed: {section_stats}")
+        section_stats = {}
+    else:
         logger.info(f"Generated section stats for {len(section_stats)} categories")
-    except Exception as e:
-        logger.error(f"Section stats generation failed: {e}")
 
     return {
         "items_summarized": len(summary_map),
+        "items_reused": len(reused),
         "themes": themes,
         "highlights": highlights,
         "tldr_map": tldr_map,
         "editor_pick_id": editor_pick_id,
         "editor_pick_reason": editor_pick_reason,
         "section_stats": section_stats,
+        "selection_path": selection_path,
     }
 
 
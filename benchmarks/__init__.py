@@ -0,0 +1 @@
+# Micro-benchmarks for pipeline hot paths
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark: clean_html (lxml tree walk) vs BeautifulSoup get_text.
+
+The corpus is real feed markup: entry bodies from the recorded HTTP fixtures
+(HTTP_FIXTURES_DIR) and the on-disk HTTP cache (CACHE_DIR/http, populated by
+any previous fetcher run), plus the item cards
+of the rendered digests in outputs/ and their plain-text Markdown blocks
+(which exercise the no-markup short-circuit). Checks both implementations agree.
+
+Usage:
+    python -m benchmarks.bench_clean_html [--repeat N]
+"""
+import argparse
+import re
+import time
+import warnings
+from pathlib import Path
+
+import feedparser
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+
+from shared import config
+from shared.utils import clean_html
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "outputs"
+
+
+def _legacy_clean_html(html_string: str) -> str:
+    """The pre-lxml implementation of utils.clean_html."""
+    if not html_string:
+        return ""
+    return BeautifulSoup(html_string, "lxml").get_text(separator=" ", strip=True)
+
+
+def _feed_bodies() -> list[str]:
+    bodies = []
+    paths = [*sorted(Path(config.HTTP_FIXTURES_DIR).glob("*.body")),
+             *sorted((Path(config.CACHE_DIR) / "http").glob("*.body"))]
+    for path in paths:
+        feed = feedparser.parse(path.read_bytes())
+        for entry in feed.entries:
+            for content in entry.get("content", []):
+                bodies.append(content.get("value", ""))
+            if entry.get("summary"):
+                bodies.append(entry["summary"])
+    return bodies
+
+
+def load_corpus() -> tuple[list[str], int]:
+    """(texts, number of texts taken from recorded/cached feeds)."""
+    feed_texts = _feed_bodies()
+    texts = list(feed_texts)
+    for path in sorted(OUTPUT_DIR.glob("*.html")):
+        texts.extend(chunk for chunk in re.split(r"(?=<tr>)", path.read_text(encoding="utf-8")) if chunk.strip())
+    for path in sorted(OUTPUT_DIR.glob("*.md")):
+        texts.extend(block for block in path.read_text(encoding="utf-8").split("\n\n") if block.strip())
+    return texts, len(feed_texts)
+
+
+def _time(fn, texts: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+
+    texts, from_feeds = load_corpus()
+    mismatches = sum(1 for t in texts if _legacy_clean_html(t) != clean_html(t))
+    legacy_s = _time(_legacy_clean_html, texts, args.repeat)
+    fast_s = _time(clean_html, texts, args.repeat)
+
+    calls = len(texts) * args.repeat
+    print(f"corpus: {len(texts)} texts ({from_feeds} from recorded/cached feeds), "
+          f"{sum(map(len, texts))} chars, {args.repeat} repeats")
+    print(f"BeautifulSoup get_text: {legacy_s * 1e6 / calls:8.1f} us/text")
+    print(f"clean_html:             {fast_s * 1e6 / calls:8.1f} us/text")
+    print(f"speedup: {legacy_s / fast_s:.1f}x, mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Fetcher throughput over the recorded HTTP fixtures (HTTP_FIXTURES_DIR).
+
+Runs every source through the fetch engine in replay mode, with a simulated
+latency per request, so timings reflect the engine's concurrency caps and the
+sources' parsing rather than the network. Re-record the fixtures with
+`python -m agents.fetcher.main --record`.
+
+Usage:
+    python -m benchmarks.bench_fetch_replay [--latency-ms MS] [--repeat N]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from shared import config, http_replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from agents.fetcher.engine import run_sources
+    from agents.fetcher.main import FETCHERS
+    from agents.fetcher.sources import comfyui_nodes
+
+    http_replay.set_mode("replay", latency_ms=args.latency_ms)
+    fixtures = len(list(Path(config.HTTP_FIXTURES_DIR).glob("*.json")))
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(comfyui_nodes, "SNAPSHOT_PATH", Path(tmp) / "snapshot.json"):
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = run_sources(FETCHERS)
+            best = min(best, time.perf_counter() - start)
+
+    items = sum(len(fetched or []) for _, fetched, _ in results)
+    failed = [name for name, _, error in results if error is not None]
+    print(f"{len(FETCHERS)} sources, {fixtures} fixtures, {items} items, "
+          f"{args.latency_ms:.0f} ms/request simulated latency")
+    print(f"best of {args.repeat}: {best * 1000:.1f} ms"
+          + (f" (failed: {', '.join(failed)})" if failed else ""))
+
+
+if __name__ == "__main__":
+    main()
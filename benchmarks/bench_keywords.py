@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: KeywordMatcher vs the per-keyword regex implementation.
+
+Times the scorer's three-list keyword pass over a corpus built from the
+rendered digests in outputs/ and checks both implementations agree.
+
+Usage:
+    python -m benchmarks.bench_keywords [--repeat N]
+"""
+import argparse
+import re
+import time
+from pathlib import Path
+
+from shared import config
+from shared.keywords import KeywordMatcher
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "outputs"
+
+
+def _legacy_keyword_in_text(keywords: list[str], text: str) -> int:
+    """The pre-KeywordMatcher implementation of config.keyword_in_text."""
+    return sum(1 for kw in keywords if re.search(r'\b' + re.escape(kw) + r'\b', text, re.IGNORECASE))
+
+
+def load_corpus() -> list[str]:
+    """One text per digest entry (blank-line separated blocks of the .md outputs)."""
+    texts = []
+    for path in sorted(OUTPUT_DIR.glob("*.md")):
+        for block in path.read_text(encoding="utf-8").split("\n\n"):
+            block = block.strip()
+            if block:
+                texts.append(block)
+    return texts
+
+
+def _time(fn, texts: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = load_corpus()
+    lists = (config.KEYWORDS_HIGH, config.KEYWORDS_MEDIUM, config.KEYWORDS_LOW)
+    matcher = KeywordMatcher(*lists)
+
+    def legacy(text):
+        return tuple(_legacy_keyword_in_text(kws, text) for kws in lists)
+
+    mismatches = sum(1 for t in texts if legacy(t) != matcher.counts(t))
+    legacy_s = _time(legacy, texts, args.repeat)
+    matcher_s = _time(matcher.counts, texts, args.repeat)
+
+    calls = len(texts) * args.repeat
+    print(f"corpus: {len(texts)} texts, {sum(map(len, texts))} chars, {args.repeat} repeats")
+    print(f"legacy re.search per keyword: {legacy_s * 1e6 / calls:8.1f} us/text")
+    print(f"KeywordMatcher.counts:        {matcher_s * 1e6 / calls:8.1f} us/text")
+    print(f"speedup: {legacy_s / matcher_s:.1f}x, mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+End-to-end pipeline benchmark over synthetic corpora.
+
+For each corpus size, generates items (benchmarks/corpus.py) and runs the
+stages in run.py order against in-process fakes (benchmarks/fakes.py): an
+in-memory Supabase, a stub translator and an instant fake LLM. Times:
+
+- fetch_dedup:       run_fetcher over one synthetic source (hashing, date
+                     normalization, dedup lookup, inserts), translation off
+- translate:         translate_items on the new items, stub translator
+- score:             run_scorer (static components + per-run scoring)
+- select:            select_digest_items (top 1000 + source cap)
+- source_cap_full:   apply_source_cap over every scored row of the run
+- summarize:         run_summarizer with the fake LLM (prompt assembly,
+                     response parsing, selection snapshot)
+- render_markdown / render_html: the renderer's two formatters
+
+Each size runs --repeat times on a fresh store; the JSON report keeps the
+fastest time per stage, so reports from different commits can be diffed.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--sizes 100,1000,10000,100000] [--repeat N] [--output FILE]
+"""
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from benchmarks.corpus import generate_items
+from benchmarks.fakes import InMemorySupabase, install
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+
+@contextmanager
+def _timed(timings: dict[str, float], stage: str):
+    start = time.perf_counter()
+    yield
+    timings[stage] = time.perf_counter() - start
+
+
+def run_once(n: int, seed: int) -> tuple[dict[str, float], dict[str, int]]:
+    """One pass over an n-item corpus. Returns (stage timings, item counts)."""
+    from agents.fetcher import main as fetcher_main
+    from agents.renderer.main import _render_bulletin_html, _render_markdown
+    from agents.scorer.main import apply_source_cap, run_scorer, select_digest_items
+    from agents.summarizer.main import run_summarizer
+    from shared.selection import read_selection
+    from shared.translator import translate_items
+
+    corpus = generate_items(n, seed=seed)
+    source = SimpleNamespace(fetch=lambda: corpus)
+    store = InMemorySupabase()
+    timings: dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory() as cache_dir, install(store, cache_dir), \
+            mock.patch.object(fetcher_main, "FETCHERS", [("synthetic", source)]), \
+            mock.patch.object(fetcher_main, "translate_items", lambda items: items):
+        with _timed(timings, "fetch_dedup"):
+            fetch_result = fetcher_main.run_fetcher()
+        run_id = fetch_result["run_id"]
+
+        new_items = list(store.items.values())
+        with _timed(timings, "translate"):
+            translate_items(new_items)
+
+        with _timed(timings, "score"):
+            run_scorer(run_id)
+
+        with _timed(timings, "select"):
+            selection = select_digest_items(run_id)
+
+        all_rows = store.get_top_scored_items(run_id, limit=len(store.items))
+        with _timed(timings, "source_cap_full"):
+            apply_source_cap(all_rows)
+
+        with _timed(timings, "summarize"):
+            summary_result = run_summarizer(run_id, selection=selection)
+
+        items = read_selection(summary_result["selection_path"])
+        summaries = {item["id"]: item["summary"] for item in items if item.get("summary")}
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        with _timed(timings, "render_markdown"):
+            _render_markdown(date_str, items, summary_result, summaries)
+        with _timed(timings, "render_html"):
+            _render_bulletin_html(date_str, items, summary_result, summaries)
+
+    counts = {
+        "items_fetched": fetch_result["items_fetched"],
+        "items_new": fetch_result["items_new"],
+        "translations": len(store.translations),
+        "items_scored": len(store.scores.get(run_id, [])),
+        "items_selected": len(selection),
+        "items_summarized": summary_result["items_summarized"],
+    }
+    return timings, counts
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated corpus sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    for n in (int(size) for size in args.sizes.split(",")):
+        best: dict[str, float] = {}
+        for _ in range(args.repeat):
+            timings, counts = run_once(n, args.seed)
+            for stage, seconds in timings.items():
+                best[stage] = min(best.get(stage, seconds), seconds)
+        stages = {stage: round(seconds, 6) for stage, seconds in best.items()}
+        results.append({"items": n, "stages": stages, "total": round(sum(best.values()), 6), "counts": counts})
+        print(f"{n:>7} items: " + ", ".join(f"{s}={t * 1000:.1f}ms" for s, t in best.items()),
+              file=sys.stderr)
+
+    report = {
+        "benchmark": "pipeline",
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Micro-benchmark: classify_text vs the per-character is_cjk / detect_language loops.
+
+The corpus is the Markdown blocks of the rendered digests in outputs/ (mostly
+English) plus Japanese, Chinese and Korean feed-style bodies of realistic
+lengths. Times the translator's pattern — is_cjk on the body, then
+detect_language — and reports where the two implementations disagree (expected
+only for scripts the old ranges missed, and for CJK that only appears past
+the classified prefix of a long text).
+
+Usage:
+    python -m benchmarks.bench_text_classify [--repeat N]
+"""
+import argparse
+import time
+from pathlib import Path
+
+from shared.utils import classify_text
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "outputs"
+
+CJK_SAMPLES = [
+    "新しい動画生成モデルがアニメ調のLoRAに対応し、ComfyUIのワークフローで利用できるようになった。",
+    "字节跳动发布了新的视频生成模型，支持动漫风格的角色一致性，并开放了权重下载。",
+    "새로운 애니메이션 스타일 비디오 생성 모델이 공개되었으며 ComfyUI 워크플로를 지원합니다.",
+    "\uff71\uff86\uff92 \uff72\uff97\uff7d\uff84",  # half-width katakana only
+    "\u3400\u3401\u3402\u3403 \u4db0\u4db1",  # CJK Extension A only
+    "\u1112\u1161\u11ab\u1100\u1173\u11af",  # conjoining Hangul Jamo only
+]
+
+
+def _legacy_is_cjk(text: str) -> bool:
+    """The pre-classify_text implementation of utils.is_cjk."""
+    for char in text:
+        cp = ord(char)
+        if (0x4E00 <= cp <= 0x9FFF or 0x3040 <= cp <= 0x309F or
+                0x30A0 <= cp <= 0x30FF or 0xAC00 <= cp <= 0xD7AF):
+            return True
+    return False
+
+
+def _legacy_detect_language(text: str) -> str:
+    """The pre-classify_text implementation of utils.detect_language."""
+    if not text:
+        return "en"
+    cjk_count = ja_count = ko_count = total = 0
+    for char in text:
+        cp = ord(char)
+        if char.isalpha():
+            total += 1
+            if 0x4E00 <= cp <= 0x9FFF:
+                cjk_count += 1
+            elif 0x3040 <= cp <= 0x309F or 0x30A0 <= cp <= 0x30FF:
+                ja_count += 1
+            elif 0xAC00 <= cp <= 0xD7AF:
+                ko_count += 1
+    if total == 0:
+        return "en"
+    if ja_count > 0:
+        return "ja"
+    if ko_count > total * 0.3:
+        return "ko"
+    if cjk_count > total * 0.3:
+        return "zh"
+    return "en"
+
+
+def load_corpus() -> list[str]:
+    texts = []
+    for path in sorted(OUTPUT_DIR.glob("*.md")):
+        texts.extend(block for block in path.read_text(encoding="utf-8").split("\n\n") if block.strip())
+    for sample in CJK_SAMPLES:
+        texts.extend([sample, sample * 10, sample * 100])  # title, snippet, long body
+    return texts
+
+
+def _time(fn, texts: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = load_corpus()
+
+    def legacy(text):
+        return _legacy_is_cjk(text), _legacy_detect_language(text)
+
+    def current(text):
+        profile = classify_text(text)
+        return profile.has_cjk, profile.language
+
+    mismatches = [t for t in texts if legacy(t) != current(t)]
+    legacy_s = _time(legacy, texts, args.repeat)
+    current_s = _time(current, texts, args.repeat)
+
+    calls = len(texts) * args.repeat
+    print(f"corpus: {len(texts)} texts, {sum(map(len, texts))} chars, {args.repeat} repeats")
+    print(f"legacy is_cjk + detect_language: {legacy_s * 1e6 / calls:8.1f} us/text")
+    print(f"classify_text:                   {current_s * 1e6 / calls:8.1f} us/text")
+    print(f"speedup: {legacy_s / current_s:.1f}x, disagreements: {len(mismatches)}")
+    for text in mismatches[:10]:
+        print(f"  {text[:40]!r}: legacy={legacy(text)} new={current(text)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Synthetic FetchItem corpora for pipeline benchmarks.
+
+generate_items(n) returns n items shaped like the sources' output: a category
+mix close to a real run, a share of Japanese / Chinese / Korean items, HTML
+bodies of feed-like lengths, keyword hits drawn from the scoring lists, and
+the engagement metadata each kind of source reports. A small share of items
+repeat an earlier (source_id, url, title), as overlapping feeds do, so dedup
+has work to do. Output is deterministic for a given seed.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from shared import config
+
+# (category, share of items, number of distinct sources)
+CATEGORY_MIX = [
+    ("models", 0.30, 20),
+    ("community", 0.35, 30),
+    ("industry", 0.15, 15),
+    ("youtube", 0.12, 25),
+    ("legal", 0.08, 6),
+]
+CJK_SHARE = 0.25
+DUPLICATE_SHARE = 0.05
+
+_CJK_TITLES = {
+    "ja": ["新しい動画生成モデルがアニメ調のLoRAに対応", "ComfyUIで作画を自動化するワークフロー",
+           "イラストから動画へ：最新の研究まとめ"],
+    "zh": ["字节跳动发布新的视频生成模型", "动漫风格角色一致性的开源方案", "国产AI动画工具更新"],
+    "ko": ["새로운 애니메이션 스타일 비디오 생성 모델 공개", "웹툰 작가를 위한 AI 채색 도구"],
+}
+_CJK_BODY = {
+    "ja": "本モデルはアニメ調の映像生成に特化しており、キャラクターの一貫性を保ったまま長尺の動画を生成できる。",
+    "zh": "该模型专注于动漫风格的视频生成，支持角色一致性，并开放了权重下载与推理代码。",
+    "ko": "이 모델은 애니메이션 스타일 영상 생성에 특화되어 있으며 캐릭터 일관성을 유지합니다.",
+}
+_EN_WORDS = ("model video release workflow update support training sampler frames motion "
+             "style character scene artist tool node pipeline quality speed memory").split()
+
+
+def _en_text(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_EN_WORDS) for _ in range(words))
+    # Keyword hits at roughly the rate real feeds have them
+    for keywords, chance in ((config.KEYWORDS_HIGH, 0.4), (config.KEYWORDS_MEDIUM, 0.5), (config.KEYWORDS_LOW, 0.3)):
+        if rng.random() < chance:
+            text += f" {rng.choice(keywords)}"
+    return text
+
+
+def _html_body(rng: random.Random, paragraphs: list[str]) -> str:
+    parts = []
+    for text in paragraphs:
+        if rng.random() < 0.3:
+            text += f' <a href="https://example.com/{rng.randrange(10**6)}">link</a>'
+        if rng.random() < 0.2:
+            text += " <code>pip install -U model</code>"
+        parts.append(f"<p>{text}</p>")
+    if rng.random() < 0.2:
+        parts.append("<ul>" + "".join(f"<li>{rng.choice(_EN_WORDS)}</li>" for _ in range(4)) + "</ul>")
+    return "\n".join(parts)
+
+
+def _metadata(rng: random.Random, category: str) -> dict:
+    if category == "models":
+        return {"stars": int(rng.paretovariate(1.2) * 20), "downloads": int(rng.paretovariate(1.1) * 100)}
+    if category == "community":
+        return rng.choice([
+            {"downloads": int(rng.paretovariate(1.1) * 50), "rating": round(rng.uniform(3, 5), 1)},
+            {"favorites": int(rng.paretovariate(1.3) * 10)},
+            {"score": rng.randrange(0, 80)},
+        ])
+    if category == "youtube":
+        return {"channel": f"channel-{rng.randrange(25)}"}
+    return {}
+
+
+def generate_items(n: int, seed: int = 0, now: datetime | None = None) -> list[dict]:
+    """n synthetic FetchItems (including DUPLICATE_SHARE repeats)."""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    categories = [c for c, _, _ in CATEGORY_MIX]
+    shares = [share for _, share, _ in CATEGORY_MIX]
+    sources = {c: count for c, _, count in CATEGORY_MIX}
+
+    items: list[dict] = []
+    for i in range(n):
+        if items and rng.random() < DUPLICATE_SHARE:
+            items.append(dict(rng.choice(items)))
+            continue
+        category = rng.choices(categories, shares)[0]
+        source_id = f"{category}_{rng.randrange(sources[category])}"
+        published = now - timedelta(hours=rng.expovariate(1 / 30))
+
+        if rng.random() < CJK_SHARE:
+            lang = rng.choice(list(_CJK_TITLES))
+            title = f"{rng.choice(_CJK_TITLES[lang])} #{i}"
+            body = _html_body(rng, [_CJK_BODY[lang] * rng.randint(1, 4), _en_text(rng, 20)])
+        else:
+            lang = "en"
+            title = f"{_en_text(rng, rng.randint(4, 10)).title()} #{i}"
+            body = _html_body(rng, [_en_text(rng, rng.randint(20, 80)) for _ in range(rng.randint(1, 4))])
+
+        items.append({
+            "source_id": source_id,
+            "source_category": category,
+            "title": title,
+            "url": f"https://{source_id}.example.com/items/{i}",
+            # Feeds use both formats; the fetcher normalizes them
+            "published_at": published.isoformat() if rng.random() < 0.7
+            else published.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+            "raw_body": body,
+            "original_language": lang,
+            "metadata": _metadata(rng, category),
+        })
+    return items
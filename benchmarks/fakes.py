@@ -0,0 +1,195 @@
+"""
+In-process stand-ins for the pipeline's external services, for benchmarks.
+
+- InMemorySupabase implements the shared.supabase_client functions the stages
+  call, over plain dicts. score_run_items() mirrors the SQL function in
+  supabase/migrations/20261017120000_static_item_scores.sql.
+- fake_generate() answers every summarizer prompt instantly with well-formed
+  JSON, so summarizer timings are prompt assembly and response handling only.
+  fake_generate_stream() streams the same responses in chunks.
+- StubTranslator stands in for GoogleTranslator.
+
+install() patches all three in for the duration of a with-block.
+"""
+import heapq
+import json
+import re
+import uuid
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from unittest import mock
+
+import numpy as np
+
+from agents.scorer.columnar import recency_scores, weighted_total
+from shared.ratelimit import TokenBucket
+from shared.utils import parse_date
+
+
+class InMemorySupabase:
+    """Dict-backed replacement for the supabase_client functions used by the stages."""
+
+    def __init__(self):
+        self.runs: dict[str, dict] = {}
+        self.items: dict[str, dict] = {}
+        self.hashes: set[str] = set()
+        self.scores: dict[str, list[dict]] = {}
+        self.summaries: list[dict] = []
+        self.translations: dict[str, str] = {}
+        self._missing_static: dict[str, dict] = {}
+        self._ids = 0
+
+    def _new_id(self) -> str:
+        self._ids += 1
+        return str(uuid.UUID(int=self._ids))
+
+    # --- digest_runs ---
+
+    def create_run(self) -> dict:
+        run = {"id": self._new_id(), "started_at": datetime.now(timezone.utc).isoformat(), "status": "running"}
+        self.runs[run["id"]] = run
+        return run
+
+    def update_run(self, run_id: str, updates: dict) -> None:
+        self.runs[run_id].update(updates)
+
+    def get_run(self, run_id: str) -> dict | None:
+        return self.runs.get(run_id)
+
+    # --- items ---
+
+    def existing_content_hashes(self, hashes: list[str], chunk_size: int = 100) -> set[str]:
+        return {h for h in hashes if h in self.hashes}
+
+    def insert_items(self, items: list[dict]) -> int:
+        for item in items:
+            row = {**item, "id": self._new_id()}
+            self.items[row["id"]] = row
+            self._missing_static[row["id"]] = row
+            self.hashes.add(row["content_hash"])
+        return len(items)
+
+    def get_items_missing_static_scores(self, since: str, version: str, limit: int = 1000) -> list[dict]:
+        rows = []
+        for row in self._missing_static.values():
+            if row["fetched_at"] >= since and row.get("static_score_version") != version:
+                rows.append(row)
+                if len(rows) == limit:
+                    break
+        return rows
+
+    def set_item_static_scores(self, rows: list[dict], version: str) -> int:
+        for row in rows:
+            item = self.items[row["id"]]
+            item.update(row, static_score_version=version)
+            self._missing_static.pop(row["id"], None)
+        return len(rows)
+
+    def score_run_items(self, run_id: str, since: str, weights: dict[str, float]) -> int:
+        scored = {row["item_id"] for row in self.scores.get(run_id, [])}
+        candidates = [item for item in self.items.values()
+                      if item["fetched_at"] >= since and item.get("static_score_version")
+                      and item["id"] not in scored]
+        published = np.array([
+            dt.timestamp() if (dt := parse_date(item.get("published_at"))) else np.nan
+            for item in candidates
+        ])
+        recency = recency_scores(published)
+        rows = self.scores.setdefault(run_id, [])
+        for item, rec in zip(candidates, recency):
+            total = weighted_total(rec, item["engagement_score"], item["keyword_score"],
+                                   item["source_priority_score"], weights)
+            rows.append({
+                "item_id": item["id"], "run_id": run_id, "total_score": round(float(total), 4),
+                "recency_score": round(float(rec), 4),
+                "engagement_score": round(item["engagement_score"], 4),
+                "keyword_score": round(item["keyword_score"], 4),
+                "source_priority_score": round(item["source_priority_score"], 4),
+            })
+        return len(candidates)
+
+    def get_top_scored_items(self, run_id: str, limit: int = 50) -> list[dict]:
+        top = heapq.nlargest(limit, self.scores.get(run_id, []), key=lambda row: row["total_score"])
+        return [{**row, "items": self.items[row["item_id"]]} for row in top]
+
+    # --- summaries ---
+
+    def insert_summaries(self, summaries: list[dict]) -> int:
+        self.summaries.extend(summaries)
+        return len(summaries)
+
+    def get_existing_summaries(self, item_ids: list[str], chunk_size: int = 100) -> dict[str, dict]:
+        wanted = set(item_ids)
+        return {row["item_id"]: row for row in self.summaries if row["item_id"] in wanted}
+
+    def get_summaries_by_run(self, run_id: str) -> dict[str, str]:
+        return {row["item_id"]: row["summary"] for row in self.summaries if row["run_id"] == run_id}
+
+    # --- translations ---
+
+    def get_cached_translations(self, text_hashes: list[str], chunk_size: int = 100) -> dict[str, str]:
+        return {h: self.translations[h] for h in text_hashes if h in self.translations}
+
+    def cache_translations(self, rows: list[dict]) -> int:
+        for row in rows:
+            self.translations[row["text_hash"]] = row["translated_text"]
+        return len(rows)
+
+
+_ID_RE = re.compile(r'"id": "([^"]+)"')
+
+
+def fake_generate(messages: list[dict], **_kwargs) -> str:
+    """Instant, well-formed responses to each of the summarizer's prompts."""
+    prompt = messages[-1]["content"]
+    if "For each item below" in prompt:
+        ids = _ID_RE.findall(prompt)
+        return json.dumps({"summaries": [
+            {"id": i, "summary": f"Summary of {i}. It is notable.", "tldr": "A short hook"} for i in ids
+        ]})
+    if "theme phrases" in prompt:
+        return json.dumps({"themes": ["Theme one", "Theme two", "Theme three"]})
+    if '"section_stats"' in prompt:
+        ids = _ID_RE.findall(prompt)
+        categories = set(re.findall(r'"category": "([^"]*)"', prompt))
+        return json.dumps({"pick_id": ids[0] if ids else "", "pick_reason": "Most significant release.",
+                           "section_stats": {cat: ["3 new models", "2 new LoRAs"] for cat in categories}})
+    if "Editor's Pick" in prompt:
+        ids = _ID_RE.findall(prompt)
+        return json.dumps({"pick_id": ids[0] if ids else "", "pick_reason": "Most significant release."})
+    if "numerical/statistical facts" in prompt:
+        return json.dumps({"facts": ["3 new models", "2 new LoRAs"]})
+    return "Highlights paragraph."
+
+
+def fake_generate_stream(messages: list[dict], **kwargs):
+    """fake_generate()'s response, streamed in small chunks."""
+    response = fake_generate(messages, **kwargs)
+    for i in range(0, len(response), 16):
+        yield response[i:i + 16]
+
+
+class StubTranslator:
+    def translate(self, text: str) -> str:
+        return f"[en] {text}"
+
+
+@contextmanager
+def install(store: InMemorySupabase, cache_dir: str):
+    """Route Supabase, the LLM and the translator to in-process fakes."""
+    from agents.summarizer import main as summarizer
+    from shared import config, supabase_client, translator
+
+    with ExitStack() as stack:
+        for name in dir(InMemorySupabase):
+            if not name.startswith("_") and hasattr(supabase_client, name):
+                stack.enter_context(mock.patch.object(supabase_client, name, getattr(store, name)))
+        stack.enter_context(mock.patch.object(summarizer, "generate", fake_generate))
+        stack.enter_context(mock.patch.object(summarizer, "generate_stream", fake_generate_stream))
+        stack.enter_context(mock.patch.object(translator, "_get_translator", lambda target_lang: StubTranslator()))
+        stack.enter_context(mock.patch.object(translator, "_rate_limiter", TokenBucket(rate=1e9, capacity=10**9)))
+        stack.enter_context(mock.patch.multiple(
+            config, CACHE_DIR=cache_dir, LLM_CACHE_ENABLED=False,
+            AZURE_OPENAI_API_KEY="benchmark", AZURE_OPENAI_ENDPOINT="https://benchmark.invalid",
+        ))
+        yield store
@@ -1,13 +1,24 @@
 """
 Pipeline orchestrator — runs fetcher → scorer → summarizer → renderer → emailer.
 
+Each finished stage is checkpointed on the run's digest_runs row, so a run that
+failed late can be resumed without refetching or repeating any LLM calls.
+Timings and counters from shared/metrics.py are appended to the run's row and
+written to a JSON report under CACHE_DIR/runs/<run_id>/ at the end of every
+attempt, so a resumed run keeps the metrics of the attempts before it.
+
 Usage:
     python run.py
+    python run.py --resume <run_id>
 """
+import argparse
+import json
 import logging
+import os
 import sys
+from pathlib import Path
 
-from shared import config
+from shared import config, metrics
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,17 +27,53 @@ logging.basicConfig(
 logger = logging.getLogger("pipeline")
 
 
-def main():
+def _checkpoint(run_id: str, checkpoints: dict, stage: str, result: dict) -> None:
+    """Record a finished stage's result. Never fails the pipeline."""
+    from shared import supabase_client
+    checkpoints[stage] = result
+    try:
+        supabase_client.update_run(run_id, {"checkpoints": checkpoints})
+    except Exception as e:
+        logger.warning(f"Failed to checkpoint {stage}: {e}")
+
+
+def _render_done(checkpoints: dict) -> bool:
+    """A render checkpoint only counts while its files are still on disk."""
+    paths = checkpoints.get("render")
+    return bool(paths) and all(os.path.exists(paths.get(key, "")) for key in ("md_path", "html_path"))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Anime AI Video Digest pipeline")
+    parser.add_argument("--resume", metavar="RUN_ID",
+                        help="resume a run, skipping the stages it already finished")
+    args = parser.parse_args(argv)
+
     logger.info("=== Anime AI Video Digest Pipeline ===")
 
+    checkpoints: dict = {}
+    if args.resume:
+        from shared import supabase_client
+        run = supabase_client.get_run(args.resume)
+        checkpoints = (run or {}).get("checkpoints") or {}
+        if "fetch" not in checkpoints:
+            logger.error(f"Run {args.resume} has no fetch checkpoint to resume from. Aborting.")
+            sys.exit(1)
+        logger.info(f"Resuming run {args.resume} (finished: {', '.join(checkpoints)})")
+
     # Step 1: Fetch
-    from agents.fetcher.main import run_fetcher
-    logger.info("--- FETCHER ---")
-    try:
-        fetch_result = run_fetcher()
-    except Exception as e:
-        logger.error(f"Fetcher crashed: {e}")
-        sys.exit(1)
+    if "fetch" in checkpoints:
+        fetch_result = checkpoints["fetch"]
+        logger.info("--- FETCHER --- skipped (checkpointed)")
+    else:
+        from agents.fetcher.main import run_fetcher
+        logger.info("--- FETCHER ---")
+        try:
+            with metrics.timer("stage.fetch"):
+                fetch_result = run_fetcher()
+        except Exception as e:
+            logger.error(f"Fetcher crashed: {e}")
+            sys.exit(1)
 
     run_id = fetch_result.get("run_id")
     logger.info(f"Fetch complete: {fetch_result}")
@@ -34,6 +81,8 @@ def main():
     if not run_id:
         logger.error("No run_id returned from fetcher. Aborting.")
         sys.exit(1)
+    if "fetch" not in checkpoints:
+        _checkpoint(run_id, checkpoints, "fetch", fetch_result)
 
     items_new = fetch_result.get("items_new", 0)
     if items_new < config.MIN_ITEMS_FOR_DIGEST:
@@ -43,56 +92,136 @@ def main():
         return
 
     # Step 2: Score
-    from agents.scorer.main import run_scorer
-    logger.info("--- SCORER ---")
-    try:
-        score_result = run_scorer(run_id)
-        logger.info(f"Score complete: {score_result}")
-    except Exception as e:
-        logger.error(f"Scorer failed: {e}")
-        from shared import supabase_client
-        supabase_client.update_run(run_id, {"status": "failed", "errors": [{"agent": "scorer", "error": str(e)}]})
-        sys.exit(1)
+    if "score" in checkpoints:
+        logger.info("--- SCORER --- skipped (checkpointed)")
+    else:
+        from agents.scorer.main import run_scorer
+        logger.info("--- SCORER ---")
+        try:
+            with metrics.timer("stage.score"):
+                score_result = run_scorer(run_id)
+            logger.info(f"Score complete: {score_result}")
+        except Exception as e:
+            logger.error(f"Scorer failed: {e}")
+            _fail(run_id, "scorer", e)
+        _checkpoint(run_id, checkpoints, "score", score_result)
 
     # Step 3: Summarize
-    from agents.summarizer.main import run_summarizer
-    logger.info("--- SUMMARIZER ---")
-    try:
-        summary_result = run_summarizer(run_id)
-        logger.info(f"Summarize complete: {summary_result}")
-    except Exception as e:
-        logger.error(f"Summarizer failed: {e}")
-        from shared import supabase_client
-        supabase_client.update_run(run_id, {"status": "failed", "errors": [{"agent": "summarizer", "error": str(e)}]})
-        sys.exit(1)
+    if "summarize" in checkpoints:
+        summary_result = checkpoints["summarize"]
+        logger.info("--- SUMMARIZER --- skipped (checkpointed)")
+    else:
+        from agents.scorer.main import select_digest_items
+        from agents.summarizer.main import run_summarizer
+        logger.info("--- SUMMARIZER ---")
+        try:
+            # Selected once; the summarizer writes the snapshot the renderer reads
+            with metrics.timer("stage.summarize"):
+                selection = select_digest_items(run_id)
+                logger.info(f"Selected {len(selection)} items after source cap")
+                summary_result = run_summarizer(run_id, selection=selection)
+            logger.info(f"Summarize complete: {summary_result}")
+        except Exception as e:
+            logger.error(f"Summarizer failed: {e}")
+            _fail(run_id, "summarizer", e)
+        _checkpoint(run_id, checkpoints, "summarize", summary_result)
 
     # Step 4: Render
-    from agents.renderer.main import run_renderer
-    logger.info("--- RENDERER ---")
-    try:
-        render_result = run_renderer(run_id, summary_data=summary_result)
-        logger.info(f"Render complete: {render_result}")
-    except Exception as e:
-        logger.error(f"Renderer failed: {e}")
-        from shared import supabase_client
-        supabase_client.update_run(run_id, {"status": "failed", "errors": [{"agent": "renderer", "error": str(e)}]})
-        sys.exit(1)
-
-    # Step 5: Email
-    from agents.emailer.main import run_emailer
-    logger.info("--- EMAILER ---")
-    html_path = render_result.get("html_path", "")
-    if html_path:
+    if _render_done(checkpoints):
+        render_result = checkpoints["render"]
+        logger.info("--- RENDERER --- skipped (checkpointed)")
+    else:
+        from agents.renderer.main import run_renderer
+        logger.info("--- RENDERER ---")
         try:
-            email_result = run_emailer(html_path)
-            logger.info(f"Email complete: {email_result}")
+            with metrics.timer("stage.render"):
+                render_result = run_renderer(run_id, summary_data=summary_result)
+            logger.info(f"Render complete: {render_result}")
         except Exception as e:
-            logger.error(f"Emailer failed: {e}")
+            logger.error(f"Renderer failed: {e}")
+            _fail(run_id, "renderer", e)
+        _checkpoint(run_id, checkpoints, "render", render_result)
+
+    # Step 5: Email
+    if "email" in checkpoints:
+        # Never send the same digest twice
+        logger.info("--- EMAILER --- skipped (already sent)")
     else:
-        logger.warning("No HTML path from renderer, skipping email")
+        from agents.emailer.main import run_emailer
+        logger.info("--- EMAILER ---")
+        html_path = render_result.get("html_path", "")
+        if html_path:
+            try:
+                with metrics.timer("stage.email"):
+                    email_result = run_emailer(html_path)
+                logger.info(f"Email complete: {email_result}")
+                _checkpoint(run_id, checkpoints, "email", email_result)
+            except Exception as e:
+                logger.error(f"Emailer failed: {e}")
+        else:
+            logger.warning("No HTML path from renderer, skipping email")
+
+    if args.resume:
+        # Clear the "failed" status left by the interrupted attempt
+        from shared import supabase_client
+        status = "completed" if fetch_result.get("sources_failed", 0) == 0 else "partial"
+        supabase_client.update_run(run_id, {"status": status})
 
+    _report_cache_stats(run_id, fetch_result.get("cache_stats", {}))
+    _report_metrics(run_id)
     logger.info("=== Pipeline complete ===")
 
 
+def _fail(run_id: str, agent: str, error: Exception) -> None:
+    """Mark the run failed, keep its metrics, and exit."""
+    from shared import supabase_client
+    supabase_client.update_run(run_id, {"status": "failed", "errors": [{"agent": agent, "error": str(error)}]})
+    _report_metrics(run_id)
+    sys.exit(1)
+
+
+def _report_cache_stats(run_id: str, cache_stats: dict) -> None:
+    """Log LLM cache savings and add them to the run's cache_stats."""
+    from shared import llm_cache, supabase_client
+    llm_stats = llm_cache.cache_stats()
+    logger.info(
+        f"LLM cache: {llm_stats['hits']} hits, {llm_stats['misses']} misses, "
+        f"~{llm_stats['tokens_saved']} tokens saved"
+    )
+    try:
+        supabase_client.update_run(run_id, {"cache_stats": {**cache_stats, "llm": llm_stats}})
+    except Exception as e:
+        logger.warning(f"Failed to record cache stats: {e}")
+
+
+def _report_metrics(run_id: str) -> None:
+    """Append this attempt's timings and counters to digest_runs and write its JSON report."""
+    from shared import supabase_client
+    snapshot = metrics.snapshot()
+    stages = {name.removeprefix("stage."): t["total"] for name, t in snapshot["timers"].items()
+              if name.startswith("stage.")}
+    logger.info("Stage timings: " + ", ".join(f"{stage}={seconds:.1f}s" for stage, seconds in stages.items()))
+
+    # Earlier attempts of a resumed run keep their own entries
+    try:
+        previous = ((supabase_client.get_run(run_id) or {}).get("metrics") or {}).get("attempts") or []
+    except Exception as e:
+        logger.warning(f"Failed to read earlier run metrics: {e}")
+        previous = []
+    attempts = previous + [snapshot]
+
+    report_path = Path(config.CACHE_DIR) / "runs" / run_id / f"report-{len(attempts)}.json"
+    try:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps({"run_id": run_id, "attempt": len(attempts), **snapshot}, indent=2),
+                               encoding="utf-8")
+        logger.info(f"Run report: {report_path}")
+    except OSError as e:
+        logger.warning(f"Failed to write run report: {e}")
+    try:
+        supabase_client.update_run(run_id, {"metrics": {"attempts": attempts}})
+    except Exception as e:
+        logger.warning(f"Failed to record metrics: {e}")
+
 if __name__ == "__main__":
     main()
@@ -5,9 +5,12 @@ Loads environment variables and defines source configurations,
 keyword lists, and scoring weights.
 """
 import os
-import re
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
+from shared.keywords import KeywordMatcher
+
 load_dotenv()
 
 # --- Supabase ---
@@ -24,6 +27,17 @@ AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY", "")
 AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "")
 AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-5.2-chat")
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # ceiling for the adaptive in-flight limit
+# Deployment quota, paced client-side (0 disables). Azure counts prompt + max_tokens towards TPM.
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "300"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "50000"))
+# Per-item summary calls are packed to fit this many prompt + completion tokens
+SUMMARY_BATCH_TOKEN_BUDGET = int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", "8000"))
+SUMMARY_MAX_COMPLETION_TOKENS = int(os.getenv("SUMMARY_MAX_COMPLETION_TOKENS", "4096"))
+# Stream summary calls and keep each item as soon as it is complete
+SUMMARY_STREAMING = os.getenv("SUMMARY_STREAMING", "1") == "1"
+# Ask for the editor's pick and every section's stats in one request
+EDITORIAL_COMBINED_CALL = os.getenv("EDITORIAL_COMBINED_CALL", "1") == "1"
 
 # --- Email delivery (Resend) ---
 RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
@@ -147,17 +161,36 @@ MIN_ITEMS_FOR_DIGEST = int(os.getenv("MIN_ITEMS_FOR_DIGEST", "3"))
 
 # --- Fetch settings ---
 REQUEST_TIMEOUT = 30  # seconds
+FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "8"))  # global cap on in-flight requests
+FETCH_MAX_PER_HOST = int(os.getenv("FETCH_MAX_PER_HOST", "2"))  # per-host cap on in-flight requests
 USER_AGENT = "anime-ai-digest/1.0 (+https://github.com/shu-bamma/anime-ai-digest)"
 
+# --- Translation settings ---
+TRANSLATE_MAX_WORKERS = int(os.getenv("TRANSLATE_MAX_WORKERS", "4"))  # concurrent translator calls
+TRANSLATE_RATE_PER_SEC = float(os.getenv("TRANSLATE_RATE_PER_SEC", "5"))  # sustained translator call rate
+TRANSLATE_BURST = int(os.getenv("TRANSLATE_BURST", "5"))
+
+# --- Local caches (persisted between CI runs via actions/cache) ---
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"))
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") == "1"
+HTTP_REPLAY_MODE = os.getenv("HTTP_REPLAY_MODE", "")  # "", "record" or "replay" (see shared/http_replay.py)
+HTTP_FIXTURES_DIR = os.getenv("HTTP_FIXTURES_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures", "http"))
+HTTP_REPLAY_LATENCY_MS = float(os.getenv("HTTP_REPLAY_LATENCY_MS", "0"))  # simulated per-request latency in replay mode
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+LLM_CACHE_TTL_HOURS = int(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
 
 # --- Word-boundary keyword matching ---
 
-def _word_boundary_match(keyword: str, text: str) -> bool:
-    """Check if keyword matches as a whole word (not substring) in text."""
-    return bool(re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE))
+@lru_cache(maxsize=64)
+def _matcher_for(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(list(keywords))
 
 
 def keyword_in_text(keywords: list[str], text: str) -> int:
     """Count how many keywords match using word boundaries. Avoids false positives
-    like 'AI' matching 'email', 'detail', 'fair', etc."""
-    return sum(1 for kw in keywords if _word_boundary_match(kw, text))
+    like 'AI' matching 'email', 'detail', 'fair', etc.
+
+    Hot paths should hold their own shared.keywords.KeywordMatcher instead."""
+    return _matcher_for(tuple(keywords)).count(text)
@@ -0,0 +1,252 @@
+"""
+HTTP client for source fetchers.
+
+All outbound fetches go through get(), which:
+- reuses one pooled requests.Session,
+- caps the number of in-flight requests globally (FETCH_MAX_WORKERS) and per
+  host (FETCH_MAX_PER_HOST) so concurrent fetchers don't hammer a single host,
+- keeps an on-disk response cache under CACHE_DIR/http and revalidates it with
+  If-None-Match / If-Modified-Since. A 304 (or a response still fresh per
+  Cache-Control max-age) is served from disk with `resp.from_cache = True`,
+  so sources can skip parsing feeds that haven't changed since the last run.
+  New 200 responses are only staged: run_fetcher calls commit_cache() for a
+  source once its items are stored, so a run that fails before that point
+  refetches the feed instead of being told it hasn't changed.
+
+Per-source hit / miss / 304 counts are collected for the digest_runs row.
+
+With HTTP_REPLAY_MODE set, get() records responses as fixtures or serves them
+back without touching the network (see shared/http_replay.py).
+"""
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from shared import config, http_replay
+
+logger = logging.getLogger(__name__)
+
+_global_slots = threading.BoundedSemaphore(config.FETCH_MAX_WORKERS)
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_lock = threading.Lock()
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+_CACHE_DIR = Path(config.CACHE_DIR) / "http"
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_VALIDATOR_HEADERS = ("etag", "last-modified", "cache-control")
+_STORED_HEADERS = _VALIDATOR_HEADERS + ("content-type",)
+
+# Source the current request is attributed to (set by the fetch engine)
+current_source: contextvars.ContextVar[str] = contextvars.ContextVar("current_source", default="unknown")
+
+# Responses waiting for commit_cache(): {source: {url: (meta, body)}}
+_staged: dict[str, dict[str, tuple[dict, bytes]]] = defaultdict(dict)
+_staged_lock = threading.Lock()
+
+_stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hit": 0, "not_modified": 0, "miss": 0, "bytes_saved": 0})
+_stats_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers["User-Agent"] = config.USER_AGENT
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=config.FETCH_MAX_WORKERS)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _host_semaphore(host: str) -> threading.BoundedSemaphore:
+    with _host_lock:
+        sem = _host_slots.get(host)
+        if sem is None:
+            sem = threading.BoundedSemaphore(config.FETCH_MAX_PER_HOST)
+            _host_slots[host] = sem
+        return sem
+
+
+@contextmanager
+def request_slot(url: str):
+    """Hold a per-host slot, then a global slot, for the duration of a request."""
+    host = urlsplit(url).netloc.lower()
+    # Take the host slot first so a request queued behind a busy host
+    # doesn't sit on one of the global slots while it waits.
+    with _host_semaphore(host), _global_slots:
+        yield
+
+
+# --- on-disk cache ---
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return _CACHE_DIR / f"{key}.json", _CACHE_DIR / f"{key}.body"
+
+
+def _load_cached(url: str) -> tuple[dict, bytes] | None:
+    meta_path, body_path = _cache_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return meta, body_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+
+
+def _stage_cached(url: str, resp: requests.Response) -> None:
+    """Hold a cacheable response until commit_cache() for the current source."""
+    headers = _kept_headers(resp.headers, _STORED_HEADERS)
+    if not (headers.get("etag") or headers.get("last-modified") or _max_age(headers)):
+        return
+    meta = {"url": url, "stored_at": time.time(), "headers": headers}
+    with _staged_lock:
+        _staged[current_source.get()][url] = (meta, resp.content)
+
+
+def _store_cached(url: str, meta: dict, body: bytes) -> None:
+    meta_path, body_path = _cache_paths(url)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Body before meta, so a reader never sees meta pointing at a stale body
+        _write_atomic(body_path, body)
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    except OSError as e:
+        logger.debug(f"Failed to write HTTP cache for {url}: {e}")
+
+
+def commit_cache(sources=None) -> int:
+    """Write the responses staged for `sources` (all sources when None) to the cache.
+
+    Call once a source's items are safely stored: from then on its unchanged
+    feeds are answered from the cache. Returns the number of responses written.
+    """
+    with _staged_lock:
+        names = list(_staged) if sources is None else [name for name in sources if name in _staged]
+        entries = [entry for name in names for entry in _staged.pop(name).items()]
+    for url, (meta, body) in entries:
+        _store_cached(url, meta, body)
+    return len(entries)
+
+
+def discard_staged_cache() -> None:
+    """Drop every staged response, e.g. those of sources whose items weren't stored."""
+    with _staged_lock:
+        _staged.clear()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _kept_headers(headers, names: tuple[str, ...]) -> dict[str, str]:
+    """Subset of response headers, with lowercased names."""
+    return {k.lower(): v for k, v in headers.items() if k.lower() in names}
+
+
+def _max_age(headers) -> int:
+    """Cache-Control max-age in seconds (headers: lowercased dict or CaseInsensitiveDict)."""
+    cache_control = headers.get("cache-control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def _cached_response(url: str, meta: dict, body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp._content = body
+    resp.headers.update(meta.get("headers", {}))
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    resp.from_cache = True
+    return resp
+
+
+def _record(outcome: str, bytes_saved: int = 0) -> None:
+    with _stats_lock:
+        counts = _stats[current_source.get()]
+        counts[outcome] += 1
+        counts["bytes_saved"] += bytes_saved
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Per-source {hit, not_modified, miss, bytes_saved} since the last reset."""
+    with _stats_lock:
+        return {source: dict(counts) for source, counts in _stats.items()}
+
+
+def reset_cache_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+# --- public API ---
+
+def get(url: str, params: dict | None = None, use_cache: bool = True, **kwargs) -> requests.Response:
+    """GET with the pipeline's User-Agent, timeout, concurrency caps and HTTP cache.
+
+    Returns a requests.Response with an extra `from_cache` attribute: True when
+    the body was served from disk because the resource hasn't changed.
+    """
+    kwargs.setdefault("timeout", config.REQUEST_TIMEOUT)
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    if config.HTTP_REPLAY_MODE == "replay":
+        with request_slot(full_url):
+            return http_replay.replay(full_url)
+    if config.HTTP_REPLAY_MODE == "record":
+        use_cache = False  # record full bodies, not 304s
+
+    cached = _load_cached(full_url) if use_cache and config.HTTP_CACHE_ENABLED else None
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cached:
+        meta, body = cached
+        if time.time() - meta.get("stored_at", 0) < _max_age(meta.get("headers", {})):
+            _record("hit", len(body))
+            return _cached_response(full_url, meta, body)
+        if meta["headers"].get("etag"):
+            headers["If-None-Match"] = meta["headers"]["etag"]
+        if meta["headers"].get("last-modified"):
+            headers["If-Modified-Since"] = meta["headers"]["last-modified"]
+
+    with request_slot(full_url):
+        resp = _get_session().get(full_url, headers=headers, **kwargs)
+    if config.HTTP_REPLAY_MODE == "record":
+        http_replay.record(full_url, resp)
+
+    if resp.status_code == 304 and cached:
+        meta, body = cached
+        # Refresh validators/max-age from the 304 so the next run revalidates correctly
+        meta["headers"].update(_kept_headers(resp.headers, _VALIDATOR_HEADERS))
+        meta["stored_at"] = time.time()
+        try:
+            _write_atomic(_cache_paths(full_url)[0], json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.debug(f"Failed to refresh HTTP cache for {full_url}: {e}")
+        _record("not_modified", len(body))
+        return _cached_response(full_url, meta, body)
+
+    resp.from_cache = False
+    if use_cache and config.HTTP_CACHE_ENABLED:
+        _record("miss")
+        if resp.status_code == 200:
+            _stage_cached(full_url, resp)
+    return resp
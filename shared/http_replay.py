@@ -0,0 +1,86 @@
+"""
+Record/replay of source fetcher HTTP traffic.
+
+Set HTTP_REPLAY_MODE (or pass --record / --replay to the fetcher):
+- "record": every response http_client.get() receives from the network is
+  stored as a fixture under HTTP_FIXTURES_DIR (the on-disk HTTP cache is
+  bypassed, so fixtures hold full 200 bodies rather than 304s).
+- "replay": http_client.get() never touches the network. Responses come from
+  the fixtures after HTTP_REPLAY_LATENCY_MS of simulated latency, still under
+  the usual global/per-host request caps, so fetcher throughput can be
+  measured deterministically. A URL with no fixture fails like a connection
+  error, which the sources already handle.
+
+Each fixture is a <host>_<hash>.json (url, status, headers) plus a .body file.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+from shared import config
+
+logger = logging.getLogger(__name__)
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def fixture_paths(url: str) -> tuple[Path, Path]:
+    host = urlsplit(url).netloc.lower().replace(":", "_") or "local"
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    fixtures = Path(config.HTTP_FIXTURES_DIR)
+    return fixtures / f"{host}_{key}.json", fixtures / f"{host}_{key}.body"
+
+
+def record(url: str, resp: requests.Response) -> None:
+    """Store a live response as a fixture. Never fails the fetch."""
+    meta = {
+        "url": url,
+        "status": resp.status_code,
+        "headers": {k.lower(): v for k, v in resp.headers.items() if k.lower() in _STORED_HEADERS},
+    }
+    meta_path, body_path = fixture_paths(url)
+    try:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(resp.content)
+        meta_path.write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Failed to record fixture for {url}: {e}")
+
+
+def replay(url: str) -> requests.Response:
+    """The recorded response for url, after the simulated latency."""
+    if config.HTTP_REPLAY_LATENCY_MS > 0:
+        time.sleep(config.HTTP_REPLAY_LATENCY_MS / 1000)
+    meta_path, body_path = fixture_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_bytes()
+    except (OSError, ValueError):
+        logger.warning(f"No recorded response for {url}")
+        raise requests.ConnectionError(f"No recorded response for {url} in {config.HTTP_FIXTURES_DIR}")
+
+    resp = requests.Response()
+    resp.status_code = meta.get("status", 200)
+    resp.url = url
+    resp._content = body
+    resp.headers.update(meta.get("headers", {}))
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    resp.from_cache = False
+    return resp
+
+
+def set_mode(mode: str, fixtures_dir: str | None = None, latency_ms: float | None = None) -> None:
+    """Switch record/replay on for this process ("" turns it off)."""
+    if mode not in ("", "record", "replay"):
+        raise ValueError(f"Unknown HTTP replay mode: {mode!r}")
+    config.HTTP_REPLAY_MODE = mode
+    if fixtures_dir is not None:
+        config.HTTP_FIXTURES_DIR = os.path.abspath(fixtures_dir)
+    if latency_ms is not None:
+        config.HTTP_REPLAY_LATENCY_MS = latency_ms
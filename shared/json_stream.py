@@ -0,0 +1,93 @@
+"""
+Incremental parsing of JSON arrays from streamed or truncated LLM output.
+
+LLM responses like {"summaries": [{...}, {...}, ...]} are fed in as they
+arrive; every element of the first array is returned as soon as it is
+complete, so a response that is cut off (max_tokens) or malformed near the
+end still yields everything before the damage.
+
+    parser = ArrayItemParser()
+    for chunk in generate_stream(...):
+        for item in parser.feed(chunk):
+            ...
+"""
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ArrayItemParser:
+    """Yields the object and string elements of the first JSON array in a text stream.
+
+    Elements that are not valid JSON on their own are skipped; scalars other
+    than strings are ignored. Anything after the first array is ignored.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._array_depth: int | None = None  # stack depth inside the first array
+        self._start: int | None = None  # buffer index where the current element began
+        self.done = False
+
+    def feed(self, text: str) -> list:
+        """Add the next chunk of text. Returns the elements it completed."""
+        if self.done:
+            return []
+        self._buf += text
+        found = []
+        buf = self._buf
+        for i in range(self._pos, len(buf)):
+            c = buf[i]
+            at_top = self._array_depth is not None and len(self._stack) == self._array_depth
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if at_top and self._start is not None:
+                        self._emit(self._start, i + 1, found)
+                continue
+            if at_top and self._start is None and c not in " \t\r\n,]":
+                self._start = i
+            if c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._stack.append(c)
+                if c == "[" and self._array_depth is None:
+                    self._array_depth = len(self._stack)
+            elif c in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if self._array_depth is None:
+                    continue
+                if len(self._stack) == self._array_depth and self._start is not None:
+                    self._emit(self._start, i + 1, found)
+                elif len(self._stack) < self._array_depth:
+                    self.done = True
+                    break
+            elif c == "," and at_top:
+                self._start = None  # end of a number/literal element
+        self._pos = len(buf)
+        return found
+
+    def _emit(self, start: int, end: int, found: list) -> None:
+        self._start = None
+        raw = self._buf[start:end]
+        if raw[0] not in '{"':
+            return
+        try:
+            found.append(json.loads(raw))
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping malformed array element: {raw[:80]}")
+
+
+def salvage_array_items(text: str) -> list:
+    """Every complete element of the first array in a (possibly truncated) JSON text."""
+    return ArrayItemParser().feed(text)
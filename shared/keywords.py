@@ -0,0 +1,100 @@
+"""
+Compiled keyword matching.
+
+A KeywordMatcher is built once from one or more keyword lists and returns
+per-list match counts in a single pass over the text: the text is lowercased
+and tokenized once, single-word keywords are resolved with a set intersection,
+and only multi-word / CJK keywords whose first token is present fall back to a
+precompiled regex.
+
+Matching rules:
+- case-insensitive, each distinct keyword counts at most once per list
+- ASCII keyword edges must sit on a word boundary, so "AI" does not match
+  "email", "detail" or "fair"
+- non-ASCII (CJK) keyword edges match as substrings, since CJK text has no
+  word boundaries between words ("AIアニメ" matches both "AI" and "アニメ")
+
+substring=True drops the word-boundary rule: every keyword matches anywhere
+in the text, so "wan" and "video" match "ComfyUI-WanVideoWrapper". Use it for
+lists written against repo and node names; matches() is then one search of
+a precompiled alternation.
+"""
+import re
+
+_TOKEN_RE = re.compile(r"[0-9a-z_]+")
+_WORD_CHAR_RE = re.compile(r"[0-9a-z_]")
+
+
+def _edge_pattern(keyword: str) -> re.Pattern:
+    pattern = re.escape(keyword)
+    if _WORD_CHAR_RE.match(keyword[0]):
+        pattern = r"(?<![0-9a-z_])" + pattern
+    if _WORD_CHAR_RE.match(keyword[-1]):
+        pattern += r"(?![0-9a-z_])"
+    return re.compile(pattern)
+
+
+class KeywordMatcher:
+    """Precompiled matcher over one or more keyword lists."""
+
+    def __init__(self, *keyword_lists: list[str], substring: bool = False):
+        self._list_count = len(keyword_lists)
+        owners: dict[str, set[int]] = {}
+        for list_idx, keywords in enumerate(keyword_lists):
+            for kw in keywords:
+                kw = kw.strip().lower()
+                if kw:
+                    owners.setdefault(kw, set()).add(list_idx)
+
+        self._substring = substring
+        if substring:
+            self._owners = {kw: tuple(sorted(lists)) for kw, lists in owners.items()}
+            self._any = re.compile("|".join(map(re.escape, sorted(owners, key=len, reverse=True)))) if owners else None
+            return
+
+        # Single ASCII tokens: present iff the token appears in the text
+        self._single: dict[str, tuple[int, ...]] = {}
+        # Everything else: (first ASCII token or None, compiled pattern, owners)
+        self._multi: list[tuple[str | None, re.Pattern, tuple[int, ...]]] = []
+        for kw, lists in owners.items():
+            lists = tuple(sorted(lists))
+            if _TOKEN_RE.fullmatch(kw):
+                self._single[kw] = lists
+            else:
+                first = _TOKEN_RE.match(kw)
+                self._multi.append((first.group() if first else None, _edge_pattern(kw), lists))
+        self._single_keys = frozenset(self._single)
+
+    def counts(self, text: str) -> tuple[int, ...]:
+        """Number of distinct keywords from each list found in text."""
+        counts = [0] * self._list_count
+        if not text:
+            return tuple(counts)
+        lower = text.lower()
+        if self._substring:
+            for kw, lists in self._owners.items():
+                if kw in lower:
+                    for list_idx in lists:
+                        counts[list_idx] += 1
+            return tuple(counts)
+        tokens = set(_TOKEN_RE.findall(lower))
+        for kw in tokens & self._single_keys:
+            for list_idx in self._single[kw]:
+                counts[list_idx] += 1
+        for first, pattern, lists in self._multi:
+            if first is not None and first not in tokens:
+                continue
+            if pattern.search(lower):
+                for list_idx in lists:
+                    counts[list_idx] += 1
+        return tuple(counts)
+
+    def count(self, text: str) -> int:
+        """Sum of counts(); for a single-list matcher, the number of distinct keywords found."""
+        return sum(self.counts(text))
+
+    def matches(self, text: str) -> bool:
+        """True if any keyword from any list is present."""
+        if self._substring:
+            return bool(text) and self._any is not None and self._any.search(text.lower()) is not None
+        return any(self.counts(text))
@@ -0,0 +1,114 @@
+"""
+Persistent LLM response cache.
+
+Content-addressed SQLite store under CACHE_DIR, keyed by a fingerprint of
+(model, messages, max_tokens, response_format). Re-running the pipeline after
+a late-stage failure then replays identical prompts locally instead of paying
+for them again. Entries expire after LLM_CACHE_TTL_HOURS and the least
+recently used entries are evicted beyond LLM_CACHE_MAX_ENTRIES.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from shared import config
+
+logger = logging.getLogger(__name__)
+
+_DB_PATH = Path(config.CACHE_DIR) / "llm_cache.sqlite3"
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            tokens INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL
+        )""")
+        _conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used_at)")
+        _conn.commit()
+    return _conn
+
+
+def make_key(model: str, messages: list[dict], max_tokens: int, response_format: dict | None) -> str:
+    """Stable fingerprint of everything that determines the completion."""
+    raw = json.dumps(
+        {"model": model, "messages": messages, "max_tokens": max_tokens, "response_format": response_format},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached completion for key, or None. Counts a hit or miss."""
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    now = time.time()
+    min_created = now - config.LLM_CACHE_TTL_HOURS * 3600
+    try:
+        with _lock:
+            conn = _get_conn()
+            row = conn.execute(
+                "SELECT content, tokens FROM responses WHERE key = ? AND created_at >= ?",
+                (key, min_created),
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE responses SET last_used_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+                _stats["hits"] += 1
+                _stats["tokens_saved"] += row[1]
+                return row[0]
+            _stats["misses"] += 1
+    except sqlite3.Error as e:
+        logger.debug(f"LLM cache lookup failed (ok, will call the API): {e}")
+    return None
+
+
+def put(key: str, content: str, tokens: int = 0) -> None:
+    """Store a completion, then evict expired and least recently used entries."""
+    if not config.LLM_CACHE_ENABLED or not content:
+        return
+    now = time.time()
+    try:
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, tokens, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, content, tokens, now, now),
+            )
+            conn.execute("DELETE FROM responses WHERE created_at < ?",
+                         (now - config.LLM_CACHE_TTL_HOURS * 3600,))
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (config.LLM_CACHE_MAX_ENTRIES,),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to cache LLM response: {e}")
+
+
+def cache_stats() -> dict[str, int]:
+    """{hits, misses, tokens_saved} since the last reset."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_cache_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
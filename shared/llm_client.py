@@ -2,15 +2,29 @@
 Azure OpenAI client with retry logic.
 
 Simplified wrapper around the OpenAI SDK for Azure-hosted models.
+generate() is thread-safe and paces itself before sending:
+- token buckets hold every caller to the deployment's LLM_RPM_LIMIT and
+  LLM_TPM_LIMIT (prompt estimate + max_tokens, as Azure counts it),
+- an AIMD limit caps in-flight calls: it starts at LLM_MAX_CONCURRENCY,
+  halves on a 429 and grows back by one per window of successes,
+- a 429 also pauses every caller until the Retry-After window passes,
+so run_parallel() can fan calls out without causing retry storms. Limiter
+state is reported through shared/metrics.py. generate_stream() is the
+streaming variant, for callers that parse output as it arrives.
 """
 import json
 import logging
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
 
 from openai import AzureOpenAI, RateLimitError, APITimeoutError, APIConnectionError, APIStatusError
 
-from shared import config
+from shared import config, llm_cache, metrics
+from shared.ratelimit import AdaptiveConcurrency, TokenBucket
+from shared.utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +35,13 @@ _MAX_RETRIES = 3
 _BASE_DELAY = 2.0
 _MAX_DELAY = 60.0
 
+_concurrency = AdaptiveConcurrency(config.LLM_MAX_CONCURRENCY)
+# Buckets hold 10 seconds' worth, the shortest window Azure enforces quotas over
+_request_bucket = TokenBucket(config.LLM_RPM_LIMIT / 60, config.LLM_RPM_LIMIT / 6) if config.LLM_RPM_LIMIT else None
+_token_bucket = TokenBucket(config.LLM_TPM_LIMIT / 60, config.LLM_TPM_LIMIT / 6) if config.LLM_TPM_LIMIT else None
+_cooldown_lock = threading.Lock()
+_cooldown_until = 0.0
+
 
 def _get_client() -> AzureOpenAI:
     global _client
@@ -42,8 +63,64 @@ def generate(
     temperature: float = 0.3,
     response_format: dict | None = None,
 ) -> str:
-    """Call the LLM and return the content string. Retries on transient errors."""
+    """Call the LLM and return the content string. Retries on transient errors.
+
+    Identical requests are answered from the persistent llm_cache.
+    """
+    cache_key = llm_cache.make_key(config.LLM_MODEL, messages, max_tokens, response_format)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        metrics.incr("llm.cache_hits")
+        return cached
+
+    client = _get_client()
+    kwargs = _request_kwargs(messages, max_tokens, temperature, response_format)
+    with metrics.timer("llm.generate"):  # includes retries and backoff
+        return _generate_with_retries(client, kwargs, cache_key)
+
+
+def generate_stream(
+    messages: list[dict],
+    max_tokens: int = 2048,
+    temperature: float = 0.3,
+    response_format: dict | None = None,
+) -> Iterator[str]:
+    """Like generate(), but yields the content in chunks as they arrive.
+
+    Transient errors are retried until the first chunk has been yielded; after
+    that they propagate, and the caller keeps whatever it already consumed.
+    Shares generate()'s cache: a hit is yielded as a single chunk, and only
+    complete (not truncated) responses are stored.
+    """
+    cache_key = llm_cache.make_key(config.LLM_MODEL, messages, max_tokens, response_format)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        metrics.incr("llm.cache_hits")
+        yield cached
+        return
+
     client = _get_client()
+    kwargs = _request_kwargs(messages, max_tokens, temperature, response_format)
+    kwargs["stream"] = True
+    kwargs["stream_options"] = {"include_usage": True}
+    with metrics.timer("llm.generate"):
+        for attempt in range(_MAX_RETRIES + 1):
+            if attempt:
+                metrics.incr("llm.retries")
+            started = False
+            try:
+                for chunk in _stream(client, kwargs, cache_key):
+                    started = True
+                    yield chunk
+                return
+            except (APIConnectionError, APIStatusError) as e:
+                if started or attempt == _MAX_RETRIES:
+                    raise
+                _before_retry(e, attempt)
+
+
+def _request_kwargs(messages: list[dict], max_tokens: int, temperature: float,
+                    response_format: dict | None) -> dict:
     kwargs = {
         "model": config.LLM_MODEL,
         "messages": messages,
@@ -54,30 +131,151 @@ def generate(
         logger.debug("Skipping temperature=%.1f (gpt-5.2 only supports default=1)", temperature)
     if response_format:
         kwargs["response_format"] = response_format
+    return kwargs
 
+
+def _generate_with_retries(client: AzureOpenAI, kwargs: dict, cache_key: str) -> str:
     for attempt in range(_MAX_RETRIES):
+        if attempt:
+            metrics.incr("llm.retries")
         try:
-            response = client.chat.completions.create(**kwargs)
-            return response.choices[0].message.content or ""
-        except RateLimitError as e:
-            delay = _backoff_delay(attempt, e)
-            logger.warning(f"Rate limited (attempt {attempt + 1}/{_MAX_RETRIES}), retrying in {delay:.1f}s")
-            time.sleep(delay)
-        except (APITimeoutError, APIConnectionError) as e:
-            delay = _backoff_delay(attempt)
-            logger.warning(f"Transient error (attempt {attempt + 1}/{_MAX_RETRIES}): {e}, retrying in {delay:.1f}s")
-            time.sleep(delay)
-        except APIStatusError as e:
-            if e.status_code in _RETRYABLE_STATUS_CODES:
-                delay = _backoff_delay(attempt)
-                logger.warning(f"Server error {e.status_code} (attempt {attempt + 1}/{_MAX_RETRIES}), retrying in {delay:.1f}s")
-                time.sleep(delay)
-            else:
-                raise
+            return _create(client, kwargs, cache_key)
+        except (APIConnectionError, APIStatusError) as e:
+            _before_retry(e, attempt)
 
     # Final attempt — let it raise
-    response = client.chat.completions.create(**kwargs)
-    return response.choices[0].message.content or ""
+    metrics.incr("llm.retries")
+    return _create(client, kwargs, cache_key)
+
+
+def _before_retry(error: Exception, attempt: int) -> None:
+    """Wait out a failed attempt before the next one, or re-raise if it isn't retryable."""
+    if isinstance(error, RateLimitError):
+        _on_throttle()
+        delay = _backoff_delay(attempt, error)
+        logger.warning(f"Rate limited (attempt {attempt + 1}/{_MAX_RETRIES}), retrying in {delay:.1f}s")
+        _pause_all(delay)
+    elif isinstance(error, (APITimeoutError, APIConnectionError)):
+        delay = _backoff_delay(attempt)
+        logger.warning(f"Transient error (attempt {attempt + 1}/{_MAX_RETRIES}): {error}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+    elif isinstance(error, APIStatusError) and error.status_code in _RETRYABLE_STATUS_CODES:
+        delay = _backoff_delay(attempt)
+        logger.warning(f"Server error {error.status_code} (attempt {attempt + 1}/{_MAX_RETRIES}), retrying in {delay:.1f}s")
+        time.sleep(delay)
+    else:
+        raise error
+
+
+def _create(client: AzureOpenAI, kwargs: dict, cache_key: str) -> str:
+    """One API call, after any shared cooldown and within the concurrency cap."""
+    _wait_for_cooldown()
+    _pace(kwargs)  # before taking a slot, so a rate wait doesn't hold one
+    with _concurrency.slot():
+        with metrics.timer("llm.request"):
+            response = client.chat.completions.create(**kwargs)
+    choice = response.choices[0]
+    content = choice.message.content or ""
+    _finish(kwargs, cache_key, content, getattr(choice, "finish_reason", None), getattr(response, "usage", None))
+    return content
+
+
+def _stream(client: AzureOpenAI, kwargs: dict, cache_key: str) -> Iterator[str]:
+    """One streaming API call; holds its concurrency slot until the stream ends."""
+    _wait_for_cooldown()
+    parts: list[str] = []
+    finish_reason = usage = None
+    _pace(kwargs)
+    with _concurrency.slot():
+        with metrics.timer("llm.request"):
+            start = time.perf_counter()
+            for chunk in client.chat.completions.create(**kwargs):
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:  # usage chunk, or Azure's prompt filter results
+                    continue
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                delta = choice.delta.content if choice.delta else None
+                if delta:
+                    if not parts:
+                        metrics.observe("llm.first_token_seconds", time.perf_counter() - start)
+                    parts.append(delta)
+                    yield delta
+    _finish(kwargs, cache_key, "".join(parts), finish_reason, usage)
+
+
+def _finish(kwargs: dict, cache_key: str, content: str, finish_reason: str | None, usage) -> None:
+    """Bookkeeping for a completed call: limiter, token metrics and the cache."""
+    _concurrency.on_success()
+    metrics.gauge("llm.concurrency_limit", _concurrency.limit)
+    if usage is not None:
+        metrics.observe("llm.prompt_tokens", getattr(usage, "prompt_tokens", 0) or 0)
+        metrics.observe("llm.completion_tokens", getattr(usage, "completion_tokens", 0) or 0)
+    if finish_reason == "length":
+        # Cut off at max_tokens: don't cache it, so a retry gets a fresh answer
+        metrics.incr("llm.truncated")
+        logger.warning(f"Response truncated at max_completion_tokens={kwargs.get('max_completion_tokens')}")
+        return
+    llm_cache.put(cache_key, content, getattr(usage, "total_tokens", 0) or 0)
+
+
+def _pace(kwargs: dict) -> None:
+    """Wait for request and token budget before sending a request."""
+    tokens = sum(estimate_tokens(str(m.get("content", ""))) for m in kwargs["messages"])
+    tokens += kwargs.get("max_completion_tokens", 0)
+    waited = 0.0
+    if _request_bucket:
+        waited += _request_bucket.acquire()
+    if _token_bucket:
+        waited += _token_bucket.acquire(tokens)
+        metrics.gauge("llm.tpm_available", _token_bucket.available())
+    metrics.observe("llm.rate_wait_seconds", waited)
+    metrics.observe("llm.estimated_tokens", tokens)
+
+
+def _on_throttle() -> None:
+    metrics.incr("llm.throttled")
+    if _concurrency.on_throttle():
+        logger.warning(f"Throttled: concurrency limit lowered to {int(_concurrency.limit)}")
+        metrics.incr("llm.concurrency_decreases")
+    metrics.gauge("llm.concurrency_limit", _concurrency.limit)
+
+
+def _pause_all(delay: float) -> None:
+    """Hold back every caller (not just this thread) for `delay` seconds."""
+    global _cooldown_until
+    with _cooldown_lock:
+        _cooldown_until = max(_cooldown_until, time.monotonic() + delay)
+
+
+def _wait_for_cooldown() -> None:
+    while True:
+        with _cooldown_lock:
+            remaining = _cooldown_until - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(remaining)
+
+
+def run_parallel(tasks: list[Callable[[], Any]]) -> list[Any]:
+    """Run zero-argument callables (that call generate()) concurrently.
+
+    Returns one entry per task, in task order: the task's return value, or the
+    exception it raised. The number of in-flight API calls is still capped by
+    generate(), so tasks may freely nest further run_parallel() calls.
+    """
+    if not tasks:
+        return []
+
+    def _call(task):
+        try:
+            return task()
+        except Exception as e:
+            return e
+
+    workers = min(len(tasks), config.LLM_MAX_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm") as pool:
+        return list(pool.map(_call, tasks))
 
 
 def _backoff_delay(attempt: int, error=None) -> float:
@@ -0,0 +1,132 @@
+"""
+Lightweight in-process instrumentation: timers, counters and histograms.
+
+    with metrics.timer("fetch.source.arxiv"):
+        ...
+
+    @metrics.timer("render.html")
+    def render(...): ...
+
+    metrics.incr("supabase.retries.items.insert")
+    metrics.observe("llm.prompt_tokens", usage.prompt_tokens)
+    metrics.gauge("llm.concurrency_limit", limiter.limit)
+
+Metric names are dotted strings the caller composes (stage, then the thing
+measured). Everything is thread-safe and process-wide; run.py writes
+snapshot() to the digest_runs row and a JSON run report at the end of a run.
+"""
+import functools
+import threading
+import time
+from collections import defaultdict
+
+# Per-metric sample cap for percentiles; count/total/min/max stay exact
+MAX_SAMPLES = 10_000
+
+_lock = threading.Lock()
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "min", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.samples: list[float] = []
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+
+        def pct(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+        return {
+            "count": self.count,
+            "total": round(self.total, 4),
+            "mean": round(self.total / self.count, 4),
+            "min": round(self.min, 4),
+            "p50": round(pct(0.5), 4),
+            "p95": round(pct(0.95), 4),
+            "max": round(self.max, 4),
+        }
+
+
+_timers: dict[str, _Histogram] = defaultdict(_Histogram)
+_histograms: dict[str, _Histogram] = defaultdict(_Histogram)
+_counters: dict[str, float] = defaultdict(float)
+_gauges: dict[str, float] = {}
+
+
+class timer:
+    """Time a block (context manager) or every call of a function (decorator), in seconds."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._local = threading.local()
+
+    def __enter__(self):
+        # Per-thread start times, so one timer can be shared across threads
+        starts = getattr(self._local, "starts", None)
+        if starts is None:
+            starts = self._local.starts = []
+        starts.append(time.perf_counter())
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._local.starts.pop()
+        with _lock:
+            _timers[self.name].add(elapsed)
+        return False
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self:
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+def incr(name: str, value: float = 1) -> None:
+    with _lock:
+        _counters[name] += value
+
+
+def observe(name: str, value: float) -> None:
+    with _lock:
+        _histograms[name].add(value)
+
+
+def gauge(name: str, value: float) -> None:
+    """Record the current value of something (last write wins)."""
+    with _lock:
+        _gauges[name] = value
+
+
+def snapshot() -> dict:
+    """{"timers": {name: summary (seconds)}, "histograms": {name: summary},
+    "counters": {name: value}, "gauges": {name: value}}."""
+    with _lock:
+        return {
+            "timers": {name: h.summary() for name, h in sorted(_timers.items())},
+            "histograms": {name: h.summary() for name, h in sorted(_histograms.items())},
+            "counters": dict(sorted(_counters.items())),
+            "gauges": {name: round(value, 4) for name, value in sorted(_gauges.items())},
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _timers.clear()
+        _histograms.clear()
+        _counters.clear()
+        _gauges.clear()
@@ -39,5 +39,8 @@ class DigestRun(TypedDict, total=False):
     sources_succeeded: int
     sources_failed: int
     errors: list
+    cache_stats: dict  # {"http": {source: {hit, not_modified, miss, bytes_saved}}, "llm": {hits, misses, tokens_saved}}
+    checkpoints: dict  # {"fetch", "score", "summarize", "render", "email"} -> stage result
+    metrics: dict  # {"attempts": [shared.metrics.snapshot() per attempt, oldest first]}
     output_md: Optional[str]
     output_html: Optional[str]
@@ -0,0 +1,98 @@
+"""
+Client-side rate limiting shared by the translator and the LLM client.
+
+- TokenBucket paces calls (or tokens) to a sustained rate with a bounded burst.
+  Oversized requests put the bucket into debt rather than being clamped.
+- AdaptiveConcurrency caps in-flight calls with an AIMD limit: +1 after a
+  full window of successes, halved when the server throttles.
+
+Both are thread-safe and meant to be module-level singletons.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+
+class TokenBucket:
+    """Thread-safe token bucket. acquire() blocks until enough tokens are available."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1) -> float:
+        """Take `amount` tokens. Returns seconds waited.
+
+        An amount larger than the capacity waits for a full bucket and leaves it
+        in debt (negative), so later callers pay for the excess.
+        """
+        needed = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return waited
+                wait = (needed - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def available(self) -> float:
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+class AdaptiveConcurrency:
+    """AIMD cap on concurrent calls, between min_limit and max_limit.
+
+    Throttles within `decrease_interval` seconds of a decrease count as the
+    same overload (they were already in flight) and don't cut the limit again.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, decrease_interval: float = 5.0):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.decrease_interval = decrease_interval
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the currently allowed slots."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify()
+
+    def on_success(self) -> None:
+        with self._cond:
+            if self.limit < self.max_limit:
+                before = int(self.limit)
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                if int(self.limit) > before:
+                    self._cond.notify()
+
+    def on_throttle(self) -> bool:
+        """Halve the limit. Returns False if this throttle was absorbed by a recent decrease."""
+        with self._cond:
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_interval:
+                return False
+            self._last_decrease = now
+            self.limit = max(self.min_limit, self.limit / 2)
+            return True
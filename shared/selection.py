@@ -0,0 +1,68 @@
+"""
+Per-run selection snapshot.
+
+The summarizer writes the run's capped, score-ordered item list once, as JSON
+lines under CACHE_DIR/runs/<run_id>/, with only the fields the renderer needs
+(body already cleaned and cut to a short excerpt, plus the item's summary).
+run.py hands the path to the renderer through the summary data, so rendering
+doesn't re-query the scores/items join or the summaries table. Stages run
+standalone fall back to Supabase.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+
+from shared import config
+from shared.utils import clean_html
+
+logger = logging.getLogger(__name__)
+
+# Longest excerpt the renderer shows is 150 chars; keep a margin so truncate()
+# produces the same output as on the full text.
+SNAPSHOT_BODY_LEN = 300
+
+
+def snapshot_path(run_id: str) -> Path:
+    return Path(config.CACHE_DIR) / "runs" / run_id / "selection.jsonl"
+
+
+def render_fields(score_row: dict) -> dict:
+    """Extract normalized item fields from a score row. body is plain text."""
+    item = score_row.get("items", score_row)
+    body = item.get("body_translated") or item.get("raw_body", "")
+    return {
+        "id": item.get("id", ""),
+        "title": item.get("title_translated") or item.get("title", ""),
+        "url": item.get("url", ""),
+        "source_id": item.get("source_id", ""),
+        "source_category": item.get("source_category", "community"),
+        "published_at": item.get("published_at", ""),
+        "body": clean_html(body) if body else "",
+    }
+
+
+def write_selection(run_id: str, score_rows: list[dict], summaries: dict[str, str]) -> str:
+    """Write the snapshot for a run. Returns its path, or "" if it couldn't be written."""
+    path = snapshot_path(run_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for row in score_rows:
+                fields = render_fields(row)
+                fields["body"] = fields["body"][:SNAPSHOT_BODY_LEN]
+                fields["summary"] = summaries.get(fields["id"], "")
+                f.write(json.dumps(fields, ensure_ascii=False) + "\n")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Failed to write selection snapshot: {e}")
+        return ""
+    logger.info(f"Wrote selection snapshot ({len(score_rows)} items) to {path}")
+    return str(path)
+
+
+def read_selection(path: str) -> list[dict]:
+    """Items from a snapshot, in score order."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
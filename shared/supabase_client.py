@@ -9,7 +9,7 @@ from typing import Optional
 
 from supabase import create_client, Client
 
-from shared import config
+from shared import config, metrics
 
 logger = logging.getLogger(__name__)
 
@@ -26,17 +26,24 @@ def get_client() -> Client:
     return _client
 
 
-def _retry(fn, retries: int = 3, backoff: float = 2.0):
-    """Retry a function with exponential backoff."""
-    for attempt in range(retries):
-        try:
-            return fn()
-        except Exception as e:
-            if attempt == retries - 1:
-                raise
-            wait = backoff ** attempt
-            logger.warning(f"Retry {attempt + 1}/{retries} after {wait}s: {e}")
-            time.sleep(wait)
+def _retry(fn, retries: int = 3, backoff: float = 2.0, op: str = "other"):
+    """Retry a function with exponential backoff.
+
+    op ("<table>.<operation>" or "rpc.<function>") labels the call's timing,
+    retry and error metrics.
+    """
+    with metrics.timer(f"supabase.{op}"):
+        for attempt in range(retries):
+            try:
+                return fn()
+            except Exception as e:
+                if attempt == retries - 1:
+                    metrics.incr(f"supabase.errors.{op}")
+                    raise
+                wait = backoff ** attempt
+                metrics.incr(f"supabase.retries.{op}")
+                logger.warning(f"Retry {attempt + 1}/{retries} of {op} after {wait}s: {e}")
+                time.sleep(wait)
 
 
 # --- digest_runs ---
@@ -53,7 +60,7 @@ def create_run() -> dict:
             "sources_failed": 0,
             "errors": [],
         }).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="digest_runs.insert")
     return result.data[0]
 
 
@@ -61,7 +68,15 @@ def update_run(run_id: str, updates: dict) -> None:
     """Update a digest run record."""
     def _do():
         return get_client().table("digest_runs").update(updates).eq("id", run_id).execute()
-    _retry(_do)
+    _retry(_do, op="digest_runs.update")
+
+
+def get_run(run_id: str) -> Optional[dict]:
+    """Get a digest run record, or None if it doesn't exist."""
+    def _do():
+        return get_client().table("digest_runs").select("*").eq("id", run_id).limit(1).execute()
+    result = _retry(_do, op="digest_runs.select")
+    return result.data[0] if result.data else None
 
 
 # --- items ---
@@ -70,17 +85,35 @@ def item_exists(content_hash_val: str) -> bool:
     """Check if an item with this content_hash already exists."""
     def _do():
         return get_client().table("items").select("id").eq("content_hash", content_hash_val).limit(1).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="items.select")
     return len(result.data) > 0
 
 
+def existing_content_hashes(hashes: list[str], chunk_size: int = 100) -> set[str]:
+    """Return the subset of `hashes` already stored in the items table.
+
+    Checks in chunks with one `in_` query per chunk, so dedup costs
+    len(hashes) / chunk_size round-trips instead of one per item. Chunks are
+    kept small enough that the PostgREST query string stays well under URL limits.
+    """
+    unique = list(dict.fromkeys(h for h in hashes if h))
+    found: set[str] = set()
+    for i in range(0, len(unique), chunk_size):
+        chunk = unique[i:i + chunk_size]
+        def _do():
+            return get_client().table("items").select("content_hash").in_("content_hash", chunk).execute()
+        result = _retry(_do, op="items.select")
+        found.update(row["content_hash"] for row in result.data)
+    return found
+
+
 def insert_items(items: list[dict]) -> int:
     """Insert items into the items table. Returns count of inserted items."""
     if not items:
         return 0
     def _do():
         return get_client().table("items").insert(items).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="items.insert")
     return len(result.data)
 
 
@@ -90,21 +123,7 @@ def get_items_by_run(run_id: str) -> list[dict]:
         run = get_client().table("digest_runs").select("started_at").eq("id", run_id).single().execute()
         started_at = run.data["started_at"]
         return get_client().table("items").select("*").gte("fetched_at", started_at).order("fetched_at", desc=True).execute()
-    result = _retry(_do)
-    return result.data
-
-
-def get_unscored_items(run_id: str) -> list[dict]:
-    """Get items from this run that haven't been scored yet."""
-    def _do():
-        run = get_client().table("digest_runs").select("started_at").eq("id", run_id).single().execute()
-        started_at = run.data["started_at"]
-        # Get items fetched after this run started that don't have scores for this run
-        items = get_client().table("items").select("*").gte("fetched_at", started_at).execute()
-        scored = get_client().table("scores").select("item_id").eq("run_id", run_id).execute()
-        scored_ids = {s["item_id"] for s in scored.data}
-        return type("Result", (), {"data": [i for i in items.data if i["id"] not in scored_ids]})()
-    result = _retry(_do)
+    result = _retry(_do, op="items.select")
     return result.data
 
 
@@ -116,10 +135,54 @@ def insert_scores(scores: list[dict]) -> int:
         return 0
     def _do():
         return get_client().table("scores").insert(scores).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="scores.insert")
     return len(result.data)
 
 
+def get_items_missing_static_scores(since: str, version: str, limit: int = 1000) -> list[dict]:
+    """Items fetched since `since` whose stored score components are missing or
+    were computed with a different static_score_version. Returns at most `limit`."""
+    def _do():
+        return (
+            get_client().table("items")
+            .select("id, source_category, title, title_translated, raw_body, body_translated, metadata")
+            .gte("fetched_at", since)
+            .or_(f"static_score_version.is.null,static_score_version.neq.{version}")
+            .limit(limit)
+            .execute()
+        )
+    result = _retry(_do, op="items.select")
+    return result.data
+
+
+def set_item_static_scores(rows: list[dict], version: str) -> int:
+    """Store {id, engagement_score, keyword_score, source_priority_score} rows on
+    their items in one round-trip. Returns count updated."""
+    if not rows:
+        return 0
+    def _do():
+        return get_client().rpc("set_item_static_scores", {"p_rows": rows, "p_version": version}).execute()
+    result = _retry(_do, op="rpc.set_item_static_scores")
+    return result.data or 0
+
+
+def score_run_items(run_id: str, since: str, weights: dict[str, float]) -> int:
+    """Insert scores for every unscored item since `since` from its stored
+    components (recency and total computed in Postgres). Returns count inserted."""
+    params = {
+        "p_run_id": run_id,
+        "p_since": since,
+        "p_w_recency": weights["recency"],
+        "p_w_engagement": weights["engagement"],
+        "p_w_keyword": weights["keyword_relevance"],
+        "p_w_source": weights["source_priority"],
+    }
+    def _do():
+        return get_client().rpc("score_run_items", params).execute()
+    result = _retry(_do, op="rpc.score_run_items")
+    return result.data or 0
+
+
 def get_top_scored_items(run_id: str, limit: int = 50) -> list[dict]:
     """Get top-scored items for a run, joined with item data."""
     def _do():
@@ -127,7 +190,7 @@ def get_top_scored_items(run_id: str, limit: int = 50) -> list[dict]:
             "*, items(*)"
         ).eq("run_id", run_id).order("total_score", desc=True).limit(limit).execute()
         return scores
-    result = _retry(_do)
+    result = _retry(_do, op="scores.select")
     return result.data
 
 
@@ -139,43 +202,29 @@ def get_cached_translation(text_hash: str, source_lang: str, target_lang: str =
         return get_client().table("translations").select("translated_text").eq(
             "text_hash", text_hash
         ).eq("source_language", source_lang).eq("target_language", target_lang).limit(1).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="translations.select")
     if result.data:
         return result.data[0]["translated_text"]
     return None
 
 
-# --- multi-day item retrieval ---
-
-def get_unscored_items_since(run_id: str, hours: int = 72) -> list[dict]:
-    """Get items from the last N hours that haven't been scored in this run.
-    Used for mid-week digests that span multiple fetcher runs.
-    Paginates to avoid Supabase's default 1000-row limit."""
-    from datetime import datetime, timezone, timedelta
-    cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
-
-    def _do():
-        # Paginate items to get all results beyond Supabase's 1000-row default
-        all_items = []
-        page_size = 1000
-        offset = 0
-        while True:
-            page = get_client().table("items").select("*").gte(
-                "fetched_at", cutoff
-            ).order("fetched_at", desc=True).range(offset, offset + page_size - 1).execute()
-            all_items.extend(page.data)
-            if len(page.data) < page_size:
-                break
-            offset += page_size
-
-        scored = get_client().table("scores").select("item_id").eq("run_id", run_id).execute()
-        scored_ids = {s["item_id"] for s in scored.data}
-        return type("Result", (), {
-            "data": [i for i in all_items if i["id"] not in scored_ids]
-        })()
-
-    result = _retry(_do)
-    return result.data
+def get_cached_translations(text_hashes: list[str], chunk_size: int = 100) -> dict[str, str]:
+    """Look up many cached translations at once. Returns {text_hash: translated_text}.
+
+    The hash already covers the source and target language, so one `in_`
+    query per chunk resolves every hit.
+    """
+    unique = list(dict.fromkeys(h for h in text_hashes if h))
+    found: dict[str, str] = {}
+    for i in range(0, len(unique), chunk_size):
+        chunk = unique[i:i + chunk_size]
+        def _do():
+            return get_client().table("translations").select("text_hash, translated_text").in_(
+                "text_hash", chunk
+            ).execute()
+        result = _retry(_do, op="translations.select")
+        found.update((row["text_hash"], row["translated_text"]) for row in result.data)
+    return found
 
 
 # --- summaries ---
@@ -186,15 +235,40 @@ def insert_summaries(summaries: list[dict]) -> int:
         return 0
     def _do():
         return get_client().table("summaries").insert(summaries).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="summaries.insert")
     return len(result.data)
 
 
+def get_existing_summaries(item_ids: list[str], chunk_size: int = 100) -> dict[str, dict]:
+    """Latest stored summary per item. Returns {item_id: {summary, tldr, content_hash}}.
+
+    One `in_` query per chunk of item IDs; callers compare content_hash to decide
+    whether the summary still matches the item.
+    """
+    unique = list(dict.fromkeys(i for i in item_ids if i))
+    found: dict[str, dict] = {}
+    for i in range(0, len(unique), chunk_size):
+        chunk = unique[i:i + chunk_size]
+        def _do():
+            return (
+                get_client().table("summaries")
+                .select("item_id, summary, tldr, content_hash, created_at")
+                .in_("item_id", chunk)
+                .order("created_at", desc=True)
+                .execute()
+            )
+        result = _retry(_do, op="summaries.select")
+        for row in result.data:
+            # Newest first, so the first row seen per item wins
+            found.setdefault(row["item_id"], row)
+    return found
+
+
 def get_summaries_by_run(run_id: str) -> dict[str, str]:
     """Get summaries for a run. Returns {item_id: summary}."""
     def _do():
         return get_client().table("summaries").select("item_id, summary").eq("run_id", run_id).execute()
-    result = _retry(_do)
+    result = _retry(_do, op="summaries.select")
     return {row["item_id"]: row["summary"] for row in result.data}
 
 
@@ -212,6 +286,19 @@ def cache_translation(text_hash: str, original_text: str, source_lang: str,
             "translated_text": translated_text,
         }).execute()
     try:
-        _retry(_do)
+        _retry(_do, op="translations.upsert")
     except Exception as e:
         logger.warning(f"Failed to cache translation: {e}")
+
+
+def cache_translations(rows: list[dict]) -> int:
+    """Bulk upsert translation rows (text_hash, original_text, source_language,
+    target_language, translated_text). Returns count written."""
+    if not rows:
+        return 0
+    def _do():
+        return get_client().table("translations").upsert(
+            rows, on_conflict="text_hash,source_language,target_language"
+        ).execute()
+    result = _retry(_do, op="translations.upsert")
+    return len(result.data)
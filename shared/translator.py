@@ -3,20 +3,41 @@ Translation wrapper with Supabase caching.
 
 Uses deep-translator (GoogleTranslator) for CJK -> English translation.
 Caches results in Supabase translations table to avoid redundant API calls.
+
+translate_texts() is the bulk path used by the fetcher: identical strings are
+translated once, every cache hit is resolved with one lookup, misses go through
+a small thread pool paced by a token bucket (TRANSLATE_RATE_PER_SEC) instead
+of fixed sleeps, and new translations are written back with one bulk upsert.
 """
 import hashlib
 import logging
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from deep_translator import GoogleTranslator
 
-from shared import supabase_client
+from shared import config, metrics, supabase_client
+from shared.ratelimit import TokenBucket
 from shared.utils import is_cjk, detect_language
 
 logger = logging.getLogger(__name__)
 
-_translator = GoogleTranslator(source="auto", target="en")
+BODY_SNIPPET_LEN = 500
+
+
+_rate_limiter = TokenBucket(config.TRANSLATE_RATE_PER_SEC, config.TRANSLATE_BURST)
+_local = threading.local()
+
+
+def _get_translator(target_lang: str) -> GoogleTranslator:
+    # GoogleTranslator keeps request params on the instance, so use one per thread
+    translators = getattr(_local, "translators", None)
+    if translators is None:
+        translators = _local.translators = {}
+    if target_lang not in translators:
+        translators[target_lang] = GoogleTranslator(source="auto", target=target_lang)
+    return translators[target_lang]
 
 
 def _text_hash(text: str, source_lang: str, target_lang: str = "en") -> str:
@@ -24,46 +45,117 @@ def _text_hash(text: str, source_lang: str, target_lang: str = "en") -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def translate_text(text: str, source_lang: Optional[str] = None, target_lang: str = "en") -> str:
-    """
-    Translate text to target language. Returns original if already in target or on failure.
+def _translate_uncached(text: str, source_lang: str, target_lang: str) -> Optional[str]:
+    """One rate-limited translator call. Returns None on failure."""
+    _rate_limiter.acquire()
+    try:
+        with metrics.timer("translate.request"):
+            return _get_translator(target_lang).translate(text) or None
+    except Exception as e:
+        metrics.incr("translate.failures")
+        logger.warning(f"Translation failed for [{source_lang}] text: {e}")
+        return None
 
-    Checks Supabase cache first, then calls Google Translate, then caches result.
-    """
-    if not text or not text.strip():
-        return text or ""
 
-    if source_lang is None:
-        source_lang = detect_language(text)
+@metrics.timer("translate.batch")
+def translate_texts(entries: list[tuple[str, Optional[str]]], target_lang: str = "en") -> list[str]:
+    """
+    Translate many (text, source_lang) pairs. Returns translations in input order.
 
-    if source_lang == target_lang:
-        return text
+    A source_lang of None is auto-detected. Texts already in the target language,
+    empty texts and failed translations come back unchanged.
+    """
+    results = [text or "" for text, _ in entries]
+    pending: dict[str, tuple[str, str]] = {}  # text_hash -> (text, source_lang)
+    slots: list[tuple[int, str]] = []
+    for idx, (text, source_lang) in enumerate(entries):
+        if not text or not text.strip():
+            continue
+        if source_lang is None:
+            source_lang = detect_language(text)
+        if source_lang == target_lang:
+            continue
+        th = _text_hash(text, source_lang, target_lang)
+        pending.setdefault(th, (text, source_lang))
+        slots.append((idx, th))
+    if not pending:
+        return results
 
     # Check cache
-    th = _text_hash(text, source_lang, target_lang)
     try:
-        cached = supabase_client.get_cached_translation(th, source_lang, target_lang)
-        if cached:
-            return cached
+        translated = supabase_client.get_cached_translations(list(pending))
     except Exception as e:
         logger.debug(f"Cache lookup failed (ok, will translate): {e}")
+        translated = {}
+
+    # Translate misses
+    misses = [th for th in pending if th not in translated]
+    metrics.incr("translate.cache_hits", len(pending) - len(misses))
+    if misses:
+        logger.info(f"Translating {len(misses)} strings ({len(pending) - len(misses)} cached)")
+        workers = min(len(misses), config.TRANSLATE_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as pool:
+            outputs = list(pool.map(lambda th: _translate_uncached(*pending[th], target_lang), misses))
+
+        new_rows = []
+        for th, output in zip(misses, outputs):
+            if output:
+                translated[th] = output
+                text, source_lang = pending[th]
+                new_rows.append({
+                    "text_hash": th,
+                    "original_text": text,
+                    "source_language": source_lang,
+                    "target_language": target_lang,
+                    "translated_text": output,
+                })
+
+        # Cache results
+        try:
+            supabase_client.cache_translations(new_rows)
+        except Exception as e:
+            logger.debug(f"Failed to cache translations: {e}")
+
+    for idx, th in slots:
+        results[idx] = translated.get(th, results[idx])
+    return results
 
-    # Translate
-    try:
-        translated = _translator.translate(text)
-        if not translated:
-            return text
-    except Exception as e:
-        logger.warning(f"Translation failed for [{source_lang}] text: {e}")
-        return text
 
-    # Cache result
-    try:
-        supabase_client.cache_translation(th, text, source_lang, translated, target_lang)
-    except Exception as e:
-        logger.debug(f"Failed to cache translation: {e}")
+def translate_text(text: str, source_lang: Optional[str] = None, target_lang: str = "en") -> str:
+    """
+    Translate text to target language. Returns original if already in target or on failure.
+
+    Checks Supabase cache first, then calls Google Translate, then caches result.
+    """
+    return translate_texts([(text, source_lang)], target_lang)[0]
+
+
+def translate_items(items: list[dict]) -> list[dict]:
+    """
+    Translate title and body of every non-English FetchItem in one bulk pass.
+    Modifies items in-place and returns them.
+    """
+    entries: list[tuple[str, str]] = []
+    targets: list[tuple[dict, str]] = []
+    for item in items:
+        lang = item.get("original_language", "en")
+        if lang == "en":
+            continue
+
+        title = item.get("title", "")
+        if title and is_cjk(title):
+            entries.append((title, lang))
+            targets.append((item, "title_translated"))
 
-    return translated
+        body = item.get("raw_body", "")
+        if body and is_cjk(body):
+            # Only translate first 500 chars of body
+            entries.append((body[:BODY_SNIPPET_LEN], lang))
+            targets.append((item, "body_translated"))
+
+    for (item, field), translated in zip(targets, translate_texts(entries)):
+        item[field] = translated
+    return items
 
 
 def translate_item(item: dict) -> dict:
@@ -71,21 +163,5 @@ def translate_item(item: dict) -> dict:
     Translate title and body of a FetchItem if non-English.
     Modifies item in-place and returns it.
     """
-    lang = item.get("original_language", "en")
-    if lang == "en":
-        return item
-
-    title = item.get("title", "")
-    if title and is_cjk(title):
-        item["title_translated"] = translate_text(title, source_lang=lang)
-        # Small delay to respect rate limits
-        time.sleep(0.2)
-
-    body = item.get("raw_body", "")
-    if body and is_cjk(body):
-        # Only translate first 500 chars of body
-        snippet = body[:500]
-        item["body_translated"] = translate_text(snippet, source_lang=lang)
-        time.sleep(0.2)
-
+    translate_items([item])
     return item
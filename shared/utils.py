@@ -4,8 +4,12 @@ Utility functions: hashing, date parsing, text cleaning.
 import hashlib
 import re
 from datetime import datetime, timezone
-from typing import Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+import lxml.etree
+import lxml.html
 from dateutil import parser as dateutil_parser
 from bs4 import BeautifulSoup
 
@@ -16,17 +20,41 @@ def content_hash(source_id: str, url: str, title: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def parse_date(date_string: Optional[str]) -> Optional[datetime]:
-    """Parse a date string into a UTC datetime. Returns None on failure."""
+def parse_date(date_string) -> Optional[datetime]:
+    """Parse a date string into a UTC datetime. Returns None on failure.
+
+    ISO 8601 and RFC 822 (feed) dates take a fast path before the dateutil
+    fallback, and string results are memoized. Numbers are epoch seconds.
+    """
     if not date_string:
         return None
-    try:
-        dt = dateutil_parser.parse(date_string)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    except (ValueError, OverflowError):
+    if isinstance(date_string, (int, float)):
+        try:
+            return datetime.fromtimestamp(date_string, tz=timezone.utc)
+        except (ValueError, OverflowError, OSError):
+            return None
+    return _parse_date_str(date_string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_string: str) -> Optional[datetime]:
+    for parse in (datetime.fromisoformat, parsedate_to_datetime, dateutil_parser.parse):
+        try:
+            dt = parse(date_string)
+            break
+        except (TypeError, ValueError, IndexError, OverflowError):
+            continue
+    else:
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def normalize_date(value) -> Optional[str]:
+    """Canonical ISO 8601 UTC string for a date value, or None if unparseable."""
+    dt = parse_date(value)
+    return dt.isoformat() if dt else None
 
 
 def now_utc_iso() -> str:
@@ -34,12 +62,51 @@ def now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
 def clean_html(html_string: str) -> str:
-    """Strip HTML tags, return plain text."""
+    """Strip HTML tags, return plain text.
+
+    Equivalent to BeautifulSoup(html, "lxml").get_text(separator=" ", strip=True),
+    but walks the lxml tree directly instead of building a soup, and skips
+    parsing entirely for strings with no markup or entities.
+    """
     if not html_string:
         return ""
-    soup = BeautifulSoup(html_string, "lxml")
-    return soup.get_text(separator=" ", strip=True)
+    if "<" not in html_string and "&" not in html_string:
+        return html_string.strip()
+    try:
+        root = lxml.html.document_fromstring(html_string)
+    except lxml.etree.ParserError:
+        return ""  # nothing but whitespace/comments
+    except ValueError:
+        # e.g. an XML encoding declaration in a str; let BeautifulSoup cope
+        return BeautifulSoup(html_string, "lxml").get_text(separator=" ", strip=True)
+
+    parts = []
+    # Explicit pre-order walk, so a non-text element's whole subtree can be
+    # skipped; a str on the stack is a tail, emitted after its element's subtree.
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            text = node.strip()
+            if text:
+                parts.append(text)
+            continue
+        if node.tail and node is not root:
+            stack.append(node.tail)
+        # Comments / processing instructions have non-str tags: skip their text, keep their tail
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            continue
+        if node.text:
+            text = node.text.strip()
+            if text:
+                parts.append(text)
+        stack.extend(reversed(node))
+    return " ".join(parts)
 
 
 def truncate(text: str, max_len: int = 500) -> str:
@@ -49,42 +116,74 @@ def truncate(text: str, max_len: int = 500) -> str:
     return text[:max_len].rsplit(" ", 1)[0] + "..."
 
 
+# Script classes for classify_text()
+_HAN = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"  # CJK Unified Ideographs + Extension A + compatibility
+# Hiragana, katakana (+ phonetic ext., half-width); not the ゠ / ・ punctuation
+_KANA = "\u3040-\u309f\u30a1-\u30fa\u30fc-\u30ff\u31f0-\u31ff\uff66-\uff9f"
+_HANGUL = "\u1100-\u11ff\u3130-\u318f\ua960-\ua97f\uac00-\ud7af\ud7b0-\ud7ff"  # Jamo (+ compat., ext.) and syllables
+_CJK_RE = re.compile(f"[{_HAN}{_KANA}{_HANGUL}]")
+_HAN_RE = re.compile(f"[{_HAN}]")
+_KANA_RE = re.compile(f"[{_KANA}]")
+_HANGUL_RE = re.compile(f"[{_HANGUL}]")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# Long bodies are classified from a bounded prefix
+CLASSIFY_SAMPLE_LEN = 2000
+
+
+class TextProfile(NamedTuple):
+    language: str               # "en", "ja", "ko" or "zh"
+    has_cjk: bool
+    ratios: dict[str, float]    # share of letters that are han / kana / hangul
+
+
+def classify_text(text: str, sample_len: int = CLASSIFY_SAMPLE_LEN) -> TextProfile:
+    """Detect CJK presence, script ratios and language from one bounded sample.
+
+    Japanese if any kana is present; otherwise Korean or Chinese when hangul
+    or han make up more than 30% of the letters; otherwise English.
+    """
+    sample = text[:sample_len] if text else ""
+    if not sample or not _CJK_RE.search(sample):
+        # Pure non-CJK text (the common case) needs no counting
+        return TextProfile("en", False, {"han": 0.0, "kana": 0.0, "hangul": 0.0})
+
+    letters = len(_LETTER_RE.findall(sample))
+    han = len(_HAN_RE.findall(sample))
+    kana = len(_KANA_RE.findall(sample))
+    hangul = len(_HANGUL_RE.findall(sample))
+    total = max(letters, han + kana + hangul, 1)
+    ratios = {"han": han / total, "kana": kana / total, "hangul": hangul / total}
+
+    if kana:
+        language = "ja"
+    elif ratios["hangul"] > 0.3:
+        language = "ko"
+    elif ratios["han"] > 0.3:
+        language = "zh"
+    else:
+        language = "en"
+    return TextProfile(language, True, ratios)
+
+
 def is_cjk(text: str) -> bool:
     """Check if text contains CJK characters (Chinese/Japanese/Korean)."""
-    for char in text:
-        cp = ord(char)
-        if (0x4E00 <= cp <= 0x9FFF or    # CJK Unified Ideographs
-            0x3040 <= cp <= 0x309F or     # Hiragana
-            0x30A0 <= cp <= 0x30FF or     # Katakana
-            0xAC00 <= cp <= 0xD7AF):      # Hangul Syllables
-            return True
-    return False
+    return classify_text(text).has_cjk
 
 
 def detect_language(text: str) -> str:
     """Simple language detection based on character ranges."""
+    return classify_text(text).language
+
+
+# Calibrated on GPT-4o-family tokenizers: ~4 chars per token for English and
+# JSON, about one token per CJK character
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count of text, without a tokenizer."""
     if not text:
-        return "en"
-    cjk_count = 0
-    ja_count = 0
-    ko_count = 0
-    total = 0
-    for char in text:
-        cp = ord(char)
-        if char.isalpha():
-            total += 1
-            if 0x4E00 <= cp <= 0x9FFF:
-                cjk_count += 1
-            elif 0x3040 <= cp <= 0x309F or 0x30A0 <= cp <= 0x30FF:
-                ja_count += 1
-            elif 0xAC00 <= cp <= 0xD7AF:
-                ko_count += 1
-    if total == 0:
-        return "en"
-    if ja_count > 0:
-        return "ja"
-    if ko_count > total * 0.3:
-        return "ko"
-    if cjk_count > total * 0.3:
-        return "zh"
-    return "en"
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + -(-(len(text) - cjk) // CHARS_PER_TOKEN)
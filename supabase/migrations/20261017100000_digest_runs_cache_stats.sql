@@ -0,0 +1,2 @@
+-- Per-run cache statistics, e.g. {"http": {source: {hit, not_modified, miss, bytes_saved}}}
+ALTER TABLE digest_runs ADD COLUMN IF NOT EXISTS cache_stats jsonb DEFAULT '{}'::jsonb;
@@ -0,0 +1,5 @@
+-- Persist the tldr and a hash of the summarized title + body, so later runs
+-- can reuse an item's summary instead of regenerating it.
+ALTER TABLE summaries ADD COLUMN IF NOT EXISTS tldr text DEFAULT '';
+ALTER TABLE summaries ADD COLUMN IF NOT EXISTS content_hash text;
+CREATE INDEX IF NOT EXISTS idx_summaries_item_hash ON summaries(item_id, content_hash);
@@ -0,0 +1,90 @@
+-- Item-intrinsic score components (engagement, keyword relevance, source
+-- priority) are computed once per item by the scorer and stored on the item.
+-- static_score_version fingerprints the keyword lists and source priorities
+-- they were computed with, so a config change triggers a recompute.
+-- Each run then only needs score_run_items(): recency and the weighted total
+-- as one INSERT ... SELECT over the stored components.
+
+ALTER TABLE items ADD COLUMN IF NOT EXISTS engagement_score double precision;
+ALTER TABLE items ADD COLUMN IF NOT EXISTS keyword_score double precision;
+ALTER TABLE items ADD COLUMN IF NOT EXISTS source_priority_score double precision;
+ALTER TABLE items ADD COLUMN IF NOT EXISTS static_score_version text;
+
+-- score_run_items' anti-join against this run's existing scores
+CREATE INDEX IF NOT EXISTS idx_scores_run_item ON scores(run_id, item_id);
+
+-- Bulk write of computed components: p_rows is a JSON array of
+-- {id, engagement_score, keyword_score, source_priority_score}.
+CREATE OR REPLACE FUNCTION set_item_static_scores(p_rows jsonb, p_version text)
+RETURNS int
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE items i
+    SET engagement_score = r.engagement_score,
+        keyword_score = r.keyword_score,
+        source_priority_score = r.source_priority_score,
+        static_score_version = p_version
+    FROM jsonb_to_recordset(p_rows) AS r(
+      id uuid,
+      engagement_score double precision,
+      keyword_score double precision,
+      source_priority_score double precision
+    )
+    WHERE i.id = r.id
+    RETURNING 1
+  )
+  SELECT count(*)::int FROM updated;
+$$;
+
+-- Scores every item fetched since p_since that has stored components and no
+-- score row for p_run_id yet. Recency follows agents/scorer/main.py::_recency_score.
+CREATE OR REPLACE FUNCTION score_run_items(
+  p_run_id uuid,
+  p_since timestamptz,
+  p_w_recency double precision,
+  p_w_engagement double precision,
+  p_w_keyword double precision,
+  p_w_source double precision,
+  p_now timestamptz DEFAULT now()
+)
+RETURNS int
+LANGUAGE sql
+AS $$
+  WITH candidates AS (
+    SELECT i.id, i.engagement_score, i.keyword_score, i.source_priority_score,
+           extract(epoch FROM (p_now - i.published_at)) / 3600 AS hours_ago
+    FROM items i
+    WHERE i.fetched_at >= p_since
+      AND i.static_score_version IS NOT NULL
+      AND NOT EXISTS (
+        SELECT 1 FROM scores s WHERE s.run_id = p_run_id AND s.item_id = i.id
+      )
+  ),
+  components AS (
+    SELECT id, engagement_score, keyword_score, source_priority_score,
+           CASE
+             WHEN hours_ago IS NULL THEN 0.3
+             WHEN hours_ago <= 0 THEN 1.0
+             WHEN hours_ago <= 24 THEN 1.0 - hours_ago / 48
+             WHEN hours_ago <= 72 THEN 0.5 - (hours_ago - 24) / 96
+             WHEN hours_ago <= 168 THEN 0.25 - (hours_ago - 72) / 384
+             ELSE 0.0
+           END AS recency_score
+    FROM candidates
+  ),
+  inserted AS (
+    INSERT INTO scores (item_id, run_id, total_score, recency_score, engagement_score,
+                        keyword_score, source_priority_score)
+    SELECT id, p_run_id,
+           round((p_w_recency * recency_score + p_w_engagement * engagement_score
+                  + p_w_keyword * keyword_score + p_w_source * source_priority_score)::numeric, 4),
+           round(recency_score::numeric, 4),
+           round(engagement_score::numeric, 4),
+           round(keyword_score::numeric, 4),
+           round(source_priority_score::numeric, 4)
+    FROM components
+    RETURNING 1
+  )
+  SELECT count(*)::int FROM inserted;
+$$;
@@ -0,0 +1,3 @@
+-- Per-stage results of a run ({"fetch": ..., "score": ..., "summarize": ..., "render": ..., "email": ...}),
+-- read by `python run.py --resume <run_id>` to skip finished stages
+ALTER TABLE digest_runs ADD COLUMN IF NOT EXISTS checkpoints jsonb DEFAULT '{}'::jsonb;
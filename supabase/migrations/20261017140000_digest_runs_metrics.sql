@@ -0,0 +1,4 @@
+-- Per-attempt timings and counters from shared/metrics.py, oldest first:
+-- {"attempts": [{"timers": {name: {count, total, mean, min, p50, p95, max}}, "histograms": {...},
+--                "counters": {name: value}, "gauges": {name: value}}, ...]}
+ALTER TABLE digest_runs ADD COLUMN IF NOT EXISTS metrics jsonb DEFAULT '{}'::jsonb;
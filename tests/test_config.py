@@ -12,3 +12,34 @@ def test_scoring_weights_sum():
     from shared.config import SCORING_WEIGHTS
     total = sum(SCORING_WEIGHTS.values())
     assert abs(total - 1.0) < 0.01, f"Weights sum to {total}, expected ~1.0"
+
+
+def test_keyword_in_text_word_boundaries():
+    """'AI' must not match inside other words; overlapping keywords all count."""
+    from shared.config import keyword_in_text
+    assert keyword_in_text(["AI"], "check your email for details") == 0
+    assert keyword_in_text(["AI"], "New AI model") == 1
+    assert keyword_in_text(["video", "video generation", "generation"], "Video Generation") == 3
+    assert keyword_in_text(["wan"], "Wan2 released") == 0
+
+
+def test_keyword_matcher_per_list_counts_and_cjk():
+    """One pass returns a count per list; CJK keywords match as substrings."""
+    from shared.keywords import KeywordMatcher
+    matcher = KeywordMatcher(["anime", "visual novel"], ["comfyui", "anime"], ["アニメ"])
+    assert matcher.counts("ComfyUI nodes for anime and visual novels") == (1, 2, 0)
+    assert matcher.counts("AIアニメ動画") == (0, 0, 1)
+    assert matcher.matches("") is False
+
+
+def test_substring_matcher_keeps_repo_name_recall():
+    """Sources written against CamelCase/hyphenated names match keywords inside words."""
+    from agents.fetcher.sources import comfyui_nodes
+    from shared.keywords import KeywordMatcher
+    assert comfyui_nodes._matches_keywords("ComfyUI-WanVideoWrapper wrapper nodes")
+    assert comfyui_nodes._matches_keywords("HunyuanVideo nodes")
+    assert not comfyui_nodes._matches_keywords("Image upscaler")
+    matcher = KeywordMatcher(["video", "video generation"], ["wan"], substring=True)
+    assert matcher.counts("WanVideoGeneration") == (1, 1)
+    assert matcher.counts("Wan2 video generation") == (2, 1)
+    assert KeywordMatcher([], substring=True).matches("anything") is False
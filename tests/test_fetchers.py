@@ -7,6 +7,7 @@ Each fetcher should:
 3. Return dicts with required keys when successful
 """
 import importlib
+import json
 import os
 
 
@@ -32,12 +33,109 @@ def test_all_fetchers_have_fetch_function():
         assert callable(mod.fetch), f"{mod_name}.fetch is not callable"
 
 
-def test_all_fetchers_return_list():
-    """Every fetch() must return a list (network calls may fail, but shouldn't raise)."""
+def test_all_fetchers_parse_recorded_responses(monkeypatch, tmp_path):
+    """Every fetch() parses a non-empty list of well-formed items from the recorded fixtures."""
+    from shared import config
+    from agents.fetcher.sources import comfyui_nodes
+    monkeypatch.setattr(config, "HTTP_REPLAY_MODE", "replay")
+    monkeypatch.setattr(comfyui_nodes, "SNAPSHOT_PATH", tmp_path / "comfyui_nodes_snapshot.json")
     for mod_name in _get_all_fetcher_modules():
         mod = importlib.import_module(f"agents.fetcher.sources.{mod_name}")
         result = mod.fetch()
-        assert isinstance(result, list), f"{mod_name}.fetch() returned {type(result)}, expected list"
+        assert isinstance(result, list) and result, f"{mod_name}.fetch() parsed nothing from its fixtures"
+        for item in result:
+            assert REQUIRED_KEYS <= item.keys() and item["title"] and item["url"], (mod_name, item)
+            assert item["source_category"] in VALID_CATEGORIES, (mod_name, item)
+
+
+def test_all_fetchers_return_list_when_offline(monkeypatch, tmp_path):
+    """Every fetch() must return a list, even when every request fails (replay with no fixtures)."""
+    from shared import config
+    monkeypatch.setattr(config, "HTTP_REPLAY_MODE", "replay")
+    monkeypatch.setattr(config, "HTTP_FIXTURES_DIR", str(tmp_path))
+    for mod_name in _get_all_fetcher_modules():
+        mod = importlib.import_module(f"agents.fetcher.sources.{mod_name}")
+        result = mod.fetch()
+        assert result == [], f"{mod_name}.fetch() returned {result!r} with every request failing"
+
+
+def test_run_fetcher_replays_recorded_feed(monkeypatch, tmp_path):
+    """run_fetcher runs offline against a recorded feed."""
+    import requests
+    from shared import config, http_replay, supabase_client
+    from agents.fetcher import main as fetcher_main
+    from agents.fetcher.sources import arxiv
+
+    feed = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>cs.CV</title>
+    <item><title>Anime video diffusion</title><link>https://arxiv.org/abs/1</link>
+    <description>A video generation model for anime.</description></item>
+    <item><title>Point clouds</title><link>https://arxiv.org/abs/2</link>
+    <description>Unrelated.</description></item></channel></rss>"""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers["Content-Type"] = "application/rss+xml"
+    resp._content = feed
+    monkeypatch.setattr(config, "HTTP_FIXTURES_DIR", str(tmp_path))
+    http_replay.record(arxiv.FEED_URL, resp)
+
+    monkeypatch.setattr(config, "HTTP_REPLAY_MODE", "replay")
+    monkeypatch.setattr(fetcher_main, "FETCHERS", [("arxiv", arxiv)])
+    monkeypatch.setattr(fetcher_main, "translate_items", lambda items: items)
+    monkeypatch.setattr(supabase_client, "create_run", lambda: {"id": "run-1"})
+    monkeypatch.setattr(supabase_client, "existing_content_hashes", lambda hashes: set())
+    monkeypatch.setattr(supabase_client, "insert_items", lambda items: len(items))
+    monkeypatch.setattr(supabase_client, "update_run", lambda run_id, updates: None)
+
+    result = fetcher_main.run_fetcher()
+
+    assert result["sources_succeeded"] == 1 and result["sources_failed"] == 0
+    assert result["items_fetched"] == result["items_new"] == 1
+
+
+def test_feed_is_cached_only_after_its_items_are_stored(monkeypatch, tmp_path):
+    """A failed insert must not leave validators behind that turn the next fetch into a 304."""
+    import requests
+    from shared import config, http_client, supabase_client
+    from agents.fetcher import main as fetcher_main
+    from agents.fetcher.sources import arxiv
+
+    feed = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>cs.CV</title>
+    <item><title>Anime video diffusion</title><link>https://arxiv.org/abs/1</link>
+    <description>A video generation model for anime.</description></item></channel></rss>"""
+    sent_headers = []
+
+    class _Session:
+        def get(self, url, headers=None, **_kwargs):
+            sent_headers.append(dict(headers or {}))
+            resp = requests.Response()
+            resp.url = url
+            if headers and headers.get("If-None-Match") == '"v1"':
+                resp.status_code = 304
+            else:
+                resp.status_code = 200
+                resp.headers.update({"ETag": '"v1"', "Content-Type": "application/rss+xml"})
+                resp._content = feed
+            return resp
+
+    def _failing_insert(items):
+        raise RuntimeError("supabase down")
+
+    monkeypatch.setattr(config, "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(http_client, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(http_client, "_get_session", lambda: _Session())
+    monkeypatch.setattr(fetcher_main, "FETCHERS", [("arxiv", arxiv)])
+    monkeypatch.setattr(fetcher_main, "translate_items", lambda items: items)
+    monkeypatch.setattr(supabase_client, "create_run", lambda: {"id": "run-1"})
+    monkeypatch.setattr(supabase_client, "existing_content_hashes", lambda hashes: set())
+    monkeypatch.setattr(supabase_client, "update_run", lambda run_id, updates: None)
+
+    monkeypatch.setattr(supabase_client, "insert_items", _failing_insert)
+    assert fetcher_main.run_fetcher()["items_new"] == 0
+    monkeypatch.setattr(supabase_client, "insert_items", lambda items: len(items))
+    assert fetcher_main.run_fetcher()["items_new"] == 1  # refetched in full, not a 304
+    assert fetcher_main.run_fetcher()["items_fetched"] == 0  # stored, so now unchanged
+
+    assert "If-None-Match" not in sent_headers[1] and sent_headers[2]["If-None-Match"] == '"v1"'
 
 
 def test_utils_content_hash():
@@ -58,6 +156,41 @@ def test_utils_clean_html():
     assert clean_html("") == ""
 
 
+def test_utils_clean_html_matches_beautifulsoup():
+    """The lxml walker should match BeautifulSoup's get_text on feed-style markup."""
+    from bs4 import BeautifulSoup
+    from shared.utils import clean_html
+    samples = [
+        "<p>a<script>var x=1</script><style>p{}</style><!-- c -->b</p>",
+        "x &nbsp; y&amp;z AT&T &copy",
+        "<title>T</title><p>a\n b</p>",
+        "<ul><li>Fix <code>sampler</code></li><li>Add <a href='#'>LoRA</a> support</li></ul>",
+        "<p>unclosed <b>bold",
+        "a < b and c > d",
+        "<br/>line<br>two",
+        "<!-- only a comment -->",
+        "  plain text, no markup  ",
+        "<template><p>tt</p></template>after",
+        "<div><script>if (a < b) { x(); }</script><noscript>n</noscript><p>p <i>i</i> tail</p></div>",
+    ]
+    for html in samples:
+        assert clean_html(html) == BeautifulSoup(html, "lxml").get_text(separator=" ", strip=True), html
+
+
+def test_utils_parse_date_formats():
+    """ISO, RFC 822 and free-form dates all normalize to the same UTC instant."""
+    from shared.utils import normalize_date, parse_date
+    expected = "2026-10-17T01:00:00+00:00"
+    assert normalize_date("2026-10-17T10:00:00+09:00") == expected
+    assert normalize_date("2026-10-17T01:00:00Z") == expected
+    assert normalize_date("Sat, 17 Oct 2026 01:00:00 GMT") == expected
+    assert normalize_date("October 17, 2026 1:00 AM UTC") == expected
+    assert normalize_date(1792198800) == expected  # epoch seconds
+    assert normalize_date("2026-10-17 01:00:00") == expected  # naive means UTC
+    assert normalize_date("not a date") is None
+    assert parse_date(None) is None
+
+
 def test_utils_detect_language():
     """Language detection for CJK."""
     from shared.utils import detect_language
@@ -66,6 +199,28 @@ def test_utils_detect_language():
     assert detect_language("AI视频生成模型") == "zh"
 
 
+def test_utils_classify_text_scripts():
+    """classify_text covers Extension A, half-width katakana and Hangul Jamo."""
+    from shared.utils import classify_text
+    assert classify_text("\u3400\u3401\u3402 \u4db0").language == "zh"
+    assert classify_text("\uff71\uff86\uff92").language == "ja"
+    assert classify_text("\u1112\u1161\u11ab\u1100\u1173\u11af").language == "ko"
+    profile = classify_text("AI動画生成モデル")
+    assert profile.has_cjk and profile.language == "ja"
+    assert profile.ratios["kana"] > 0 and profile.ratios["han"] > 0
+    assert classify_text("plain English").has_cjk is False
+    # Only a bounded prefix of long bodies is sampled
+    assert classify_text("x" * 5000 + "アニメ", sample_len=100).has_cjk is False
+
+
+def test_utils_estimate_tokens():
+    from shared.utils import estimate_tokens
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("アニメ動画") == 5
+    assert estimate_tokens("Wan2 アニメ") == 3 + 2
+
+
 def test_utils_truncate():
     """Truncation should respect max length."""
     from shared.utils import truncate
@@ -79,3 +234,105 @@ def test_models_import():
     assert FetchItem is not None
     assert ScoreResult is not None
     assert DigestRun is not None
+
+
+def test_engine_run_sources_isolates_errors_and_keeps_order():
+    """A failing source must not affect others; results follow input order."""
+    import time
+    from types import SimpleNamespace
+    from agents.fetcher.engine import run_sources
+
+    def _slow():
+        time.sleep(0.05)
+        return [{"title": "slow"}]
+
+    def _boom():
+        raise RuntimeError("boom")
+
+    fetchers = [
+        ("slow", SimpleNamespace(fetch=_slow)),
+        ("broken", SimpleNamespace(fetch=_boom)),
+        ("fast", SimpleNamespace(fetch=lambda: [{"title": "fast"}])),
+    ]
+    results = run_sources(fetchers)
+    assert [name for name, _, _ in results] == ["slow", "broken", "fast"]
+    assert results[0][1] == [{"title": "slow"}]
+    assert results[1][1] is None and isinstance(results[1][2], RuntimeError)
+    assert results[2][1] == [{"title": "fast"}]
+
+
+def test_engine_map_feeds_preserves_order():
+    """map_feeds returns results in feed order regardless of completion order."""
+    import time
+    from agents.fetcher.engine import map_feeds
+
+    def _fetch(delay):
+        time.sleep(delay)
+        return delay
+
+    assert map_feeds(_fetch, [0.05, 0.0, 0.02]) == [0.05, 0.0, 0.02]
+
+
+def test_comfyui_diff_nodes_reports_added_and_updated():
+    """Only nodes that are new or have a changed last_update are reported."""
+    from agents.fetcher.sources.comfyui_nodes import diff_nodes
+    nodes = [
+        {"reference": "https://github.com/a/old", "last_update": "2026-01-01"},
+        {"reference": "https://github.com/a/bumped", "last_update": "2026-03-01"},
+        {"reference": "https://github.com/a/new", "last_update": "2026-03-02"},
+    ]
+    previous = {"https://github.com/a/old": "2026-01-01", "https://github.com/a/bumped": "2026-02-01"}
+    changed, snapshot = diff_nodes(nodes, previous)
+    assert [n["reference"] for n in changed] == ["https://github.com/a/bumped", "https://github.com/a/new"]
+    assert snapshot["https://github.com/a/new"] == "2026-03-02"
+    assert len(diff_nodes(nodes, None)[0]) == 3
+
+
+def _serve_comfyui_nodes(monkeypatch, tmp_path, nodes):
+    import requests
+    from agents.fetcher.sources import comfyui_nodes
+
+    def _get(url, **_kwargs):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps({"custom_nodes": nodes}).encode()
+        resp.from_cache = True  # unchanged list: still diffed
+        return resp
+
+    monkeypatch.setattr(comfyui_nodes.http_client, "get", _get)
+    monkeypatch.setattr(comfyui_nodes, "SNAPSHOT_PATH", tmp_path / "snapshot.json")
+    monkeypatch.setattr(comfyui_nodes, "MAX_ITEMS", 2)
+    return comfyui_nodes
+
+
+def test_comfyui_snapshot_is_saved_on_commit_and_baselines_without_one(monkeypatch, tmp_path):
+    """Without a snapshot, the top MAX_ITEMS are emitted and the rest recorded as seen."""
+    nodes = [{"reference": f"https://github.com/a/video-{i}", "title": f"Video node {i}",
+              "last_update": f"2026-03-{i + 1:02d}"} for i in range(5)]
+    nodes.append({"reference": "https://github.com/a/upscale", "title": "Upscaler", "last_update": "2026-03-09"})
+    comfyui_nodes = _serve_comfyui_nodes(monkeypatch, tmp_path, nodes)
+
+    first = comfyui_nodes.fetch()
+    assert [i["title"] for i in first] == ["Video node 4", "Video node 3"]
+    assert comfyui_nodes.fetch() == first  # not committed (e.g. insert failed): same items again
+    comfyui_nodes.commit()
+    assert comfyui_nodes.fetch() == []  # the older history is not drained as "new"
+    assert len(json.loads((tmp_path / "snapshot.json").read_text())) == 6
+
+
+def test_comfyui_defers_new_nodes_cut_by_max_items(monkeypatch, tmp_path):
+    """With a snapshot, relevant new nodes beyond MAX_ITEMS are emitted on later runs."""
+    old = [{"reference": "https://github.com/a/upscale", "title": "Upscaler", "last_update": "2026-02-01"},
+           {"reference": "https://github.com/a/video-old", "title": "Video node old", "last_update": "2026-02-02"}]
+    (tmp_path / "snapshot.json").write_text(json.dumps({n["reference"]: n["last_update"] for n in old}))
+    new = [{"reference": f"https://github.com/a/video-{i}", "title": f"Video node {i}",
+            "last_update": f"2026-03-{i + 1:02d}"} for i in range(5)]
+    comfyui_nodes = _serve_comfyui_nodes(monkeypatch, tmp_path, old + new)
+
+    assert [i["title"] for i in comfyui_nodes.fetch()] == ["Video node 4", "Video node 3"]
+    comfyui_nodes.commit()
+    assert [i["title"] for i in comfyui_nodes.fetch()] == ["Video node 2", "Video node 1"]
+    comfyui_nodes.commit()
+    assert [i["title"] for i in comfyui_nodes.fetch()] == ["Video node 0"]
+    comfyui_nodes.commit()
+    assert comfyui_nodes.fetch() == []
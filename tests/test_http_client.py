@@ -0,0 +1,89 @@
+"""Tests for the shared HTTP client's conditional-GET cache."""
+import requests
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, **_kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        status, resp_headers, body = self.responses.pop(0)
+        resp = requests.Response()
+        resp.status_code = status
+        resp.url = url
+        resp.headers.update(resp_headers)
+        resp._content = body
+        return resp
+
+
+def test_304_is_served_from_disk(monkeypatch, tmp_path):
+    """Second fetch revalidates with If-None-Match and serves the cached body on 304."""
+    from shared import http_client
+
+    session = _FakeSession([
+        (200, {"ETag": '"v1"', "Content-Type": "application/rss+xml"}, b"<rss>v1</rss>"),
+        (304, {"ETag": '"v1"'}, b""),
+    ])
+    monkeypatch.setattr(http_client, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(http_client, "_get_session", lambda: session)
+    http_client.reset_cache_stats()
+    token = http_client.current_source.set("test_source")
+    try:
+        first = http_client.get("https://example.com/feed.xml")
+        assert http_client.commit_cache(["test_source"]) == 1
+        second = http_client.get("https://example.com/feed.xml")
+    finally:
+        http_client.current_source.reset(token)
+
+    assert first.from_cache is False and first.content == b"<rss>v1</rss>"
+    assert second.from_cache is True and second.content == b"<rss>v1</rss>"
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+    stats = http_client.cache_stats()["test_source"]
+    assert stats["miss"] == 1 and stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(b"<rss>v1</rss>")
+
+
+def test_record_then_replay_offline(monkeypatch, tmp_path):
+    """Recorded responses replay without the network; unknown URLs fail like a dropped connection."""
+    import pytest
+    from shared import config, http_client, http_replay
+
+    session = _FakeSession([(200, {"Content-Type": "application/json", "Set-Cookie": "x"}, b'{"items": []}')])
+    monkeypatch.setattr(http_client, "_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(http_client, "_get_session", lambda: session)
+    monkeypatch.setattr(config, "HTTP_FIXTURES_DIR", str(tmp_path / "fixtures"))
+    monkeypatch.setattr(config, "HTTP_REPLAY_MODE", "record")
+    recorded = http_client.get("https://api.example.com/models", params={"tag": "anime"})
+
+    monkeypatch.setattr(config, "HTTP_REPLAY_MODE", "replay")
+    monkeypatch.setattr(config, "HTTP_REPLAY_LATENCY_MS", 1)
+    monkeypatch.setattr(http_client, "_get_session", lambda: pytest.fail("network used in replay mode"))
+    replayed = http_client.get("https://api.example.com/models", params={"tag": "anime"})
+
+    assert replayed.status_code == 200 and replayed.from_cache is False
+    assert replayed.json() == recorded.json() == {"items": []}
+    assert replayed.headers["content-type"] == "application/json" and "set-cookie" not in replayed.headers
+    with pytest.raises(requests.ConnectionError):
+        http_client.get("https://api.example.com/models", params={"tag": "other"})
+
+
+def test_uncommitted_response_is_refetched(monkeypatch, tmp_path):
+    """A 200 whose items were never stored is not cached, so the next run gets the full body."""
+    from shared import http_client
+
+    session = _FakeSession([
+        (200, {"ETag": '"v1"'}, b"<rss>v1</rss>"),
+        (200, {"ETag": '"v1"'}, b"<rss>v1</rss>"),
+    ])
+    monkeypatch.setattr(http_client, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(http_client, "_get_session", lambda: session)
+    http_client.get("https://example.com/feed.xml")
+    http_client.discard_staged_cache()  # e.g. insert_items failed
+
+    again = http_client.get("https://example.com/feed.xml")
+
+    assert again.from_cache is False and again.content == b"<rss>v1</rss>"
+    assert "If-None-Match" not in session.sent_headers[1]
+    http_client.discard_staged_cache()
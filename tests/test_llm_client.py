@@ -0,0 +1,151 @@
+"""Tests for the LLM client's persistent response cache."""
+from types import SimpleNamespace
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=f"reply to {kwargs['messages'][-1]['content']}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)],
+                               usage=SimpleNamespace(total_tokens=42))
+
+
+def test_identical_prompts_are_served_from_cache(monkeypatch, tmp_path):
+    from shared import config, llm_cache, llm_client
+
+    completions = _FakeCompletions()
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(llm_client, "_get_client", lambda: fake_client)
+    monkeypatch.setattr(llm_cache, "_DB_PATH", tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "_conn", None)
+    monkeypatch.setattr(config, "LLM_CACHE_ENABLED", True)
+    llm_cache.reset_cache_stats()
+
+    messages = [{"role": "user", "content": "hello"}]
+    first = llm_client.generate(messages, max_tokens=100)
+    second = llm_client.generate(messages, max_tokens=100)
+    other = llm_client.generate(messages, max_tokens=200)
+
+    assert first == second == other == "reply to hello"
+    assert completions.calls == 2  # max_tokens is part of the key
+    assert llm_cache.cache_stats() == {"hits": 1, "misses": 2, "tokens_saved": 42}
+
+
+def test_eviction_keeps_most_recent_entries(monkeypatch, tmp_path):
+    from shared import config, llm_cache
+
+    monkeypatch.setattr(llm_cache, "_DB_PATH", tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "_conn", None)
+    monkeypatch.setattr(config, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "LLM_CACHE_MAX_ENTRIES", 2)
+
+    for key in ("a", "b", "c"):
+        llm_cache.put(key, f"content {key}")
+
+    assert llm_cache.get("a") is None
+    assert llm_cache.get("c") == "content c"
+
+
+def test_throttling_halves_concurrency_and_successes_grow_it(monkeypatch):
+    import httpx
+    from openai import RateLimitError
+    from shared import config, llm_client, metrics
+    from shared.ratelimit import AdaptiveConcurrency
+
+    class _ThrottledOnce(_FakeCompletions):
+        def create(self, **kwargs):
+            if self.calls == 0:
+                self.calls += 1
+                response = httpx.Response(429, request=httpx.Request("POST", "https://example"))
+                raise RateLimitError("rate limited", response=response, body=None)
+            return super().create(**kwargs)
+
+    completions = _ThrottledOnce()
+    monkeypatch.setattr(llm_client, "_get_client",
+                        lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(llm_client, "_concurrency", AdaptiveConcurrency(4))
+    monkeypatch.setattr(llm_client, "_backoff_delay", lambda attempt, error=None: 0.0)
+    monkeypatch.setattr(config, "LLM_CACHE_ENABLED", False)
+    metrics.reset()
+
+    assert llm_client.generate([{"role": "user", "content": "hi"}]) == "reply to hi"
+
+    # Halved by the 429, then +1/limit for the successful retry
+    assert llm_client._concurrency.limit == 2.5
+    snap = metrics.snapshot()
+    assert snap["counters"]["llm.throttled"] == 1
+    assert snap["gauges"]["llm.concurrency_limit"] == 2.5
+    assert snap["histograms"]["llm.estimated_tokens"]["count"] == 2
+
+
+
+def test_rate_wait_does_not_hold_a_concurrency_slot(monkeypatch):
+    from shared import config, llm_client
+    from shared.ratelimit import AdaptiveConcurrency
+
+    completions = _FakeCompletions()
+    monkeypatch.setattr(llm_client, "_get_client",
+                        lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(llm_client, "_concurrency", AdaptiveConcurrency(1))
+    monkeypatch.setattr(config, "LLM_CACHE_ENABLED", False)
+    in_flight = []
+    monkeypatch.setattr(llm_client, "_pace", lambda kwargs: in_flight.append(llm_client._concurrency.in_flight))
+
+    llm_client.generate([{"role": "user", "content": "hi"}])
+
+    assert in_flight == [0]
+
+def test_adaptive_concurrency_absorbs_burst_of_throttles(monkeypatch):
+    from shared import ratelimit
+
+    clock = [100.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: clock[0])
+    limiter = ratelimit.AdaptiveConcurrency(8, decrease_interval=5.0)
+
+    assert limiter.on_throttle() is True
+    assert limiter.on_throttle() is False  # same overload, already in flight
+    assert limiter.limit == 4
+    clock[0] += 6
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 2
+    # Roughly +1 per window of `limit` successes
+    limiter.on_success()
+    limiter.on_success()
+    assert int(limiter.limit) == 2
+    limiter.on_success()
+    assert int(limiter.limit) == 3
+
+
+def test_stream_yields_chunks_and_caches_complete_responses(monkeypatch, tmp_path):
+    from shared import config, llm_cache, llm_client
+
+    def _chunk(content=None, finish_reason=None):
+        choice = SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+        return SimpleNamespace(choices=[choice], usage=None)
+
+    class _StreamingCompletions(_FakeCompletions):
+        def create(self, **kwargs):
+            self.calls += 1
+            assert kwargs["stream"] is True
+            finish = "length" if kwargs["max_completion_tokens"] < 100 else "stop"
+            return iter([_chunk("par"), _chunk("tial"), _chunk(finish_reason=finish),
+                         SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=7))])
+
+    completions = _StreamingCompletions()
+    monkeypatch.setattr(llm_client, "_get_client",
+                        lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(llm_cache, "_DB_PATH", tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "_conn", None)
+    monkeypatch.setattr(config, "LLM_CACHE_ENABLED", True)
+    messages = [{"role": "user", "content": "hi"}]
+
+    assert list(llm_client.generate_stream(messages, max_tokens=200)) == ["par", "tial"]
+    assert list(llm_client.generate_stream(messages, max_tokens=200)) == ["partial"]  # cache hit
+    # Truncated responses are not cached
+    assert "".join(llm_client.generate_stream(messages, max_tokens=50)) == "partial"
+    assert "".join(llm_client.generate_stream(messages, max_tokens=50)) == "partial"
+    assert completions.calls == 3
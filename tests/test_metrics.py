@@ -0,0 +1,53 @@
+"""Tests for the instrumentation module and its Supabase wiring."""
+
+
+def test_timers_counters_and_histograms():
+    from shared import metrics
+
+    metrics.reset()
+
+    @metrics.timer("work.decorated")
+    def work(x):
+        return x * 2
+
+    assert [work(i) for i in range(3)] == [0, 2, 4]
+    with metrics.timer("work.block"):
+        pass
+    metrics.incr("work.items", 5)
+    metrics.gauge("work.limit", 4)
+    metrics.gauge("work.limit", 2.5)
+    metrics.incr("work.items")
+    for value in (10, 20, 30, 40):
+        metrics.observe("work.tokens", value)
+
+    snap = metrics.snapshot()
+    assert snap["timers"]["work.decorated"]["count"] == 3
+    assert snap["timers"]["work.block"]["count"] == 1
+    assert snap["counters"] == {"work.items": 6}
+    assert snap["gauges"] == {"work.limit": 2.5}
+    tokens = snap["histograms"]["work.tokens"]
+    assert (tokens["count"], tokens["total"], tokens["min"], tokens["max"]) == (4, 100, 10, 40)
+    assert tokens["p50"] == 30 and tokens["mean"] == 25
+
+    metrics.reset()
+    assert metrics.snapshot() == {"timers": {}, "histograms": {}, "counters": {}, "gauges": {}}
+
+
+def test_supabase_retries_are_counted_per_operation(monkeypatch):
+    from shared import metrics, supabase_client
+
+    metrics.reset()
+    monkeypatch.setattr(supabase_client.time, "sleep", lambda seconds: None)
+    attempts = []
+
+    def _flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("reset by peer")
+        return "ok"
+
+    assert supabase_client._retry(_flaky, op="items.insert") == "ok"
+
+    snap = metrics.snapshot()
+    assert snap["counters"] == {"supabase.retries.items.insert": 2}
+    assert snap["timers"]["supabase.items.insert"]["count"] == 1
@@ -0,0 +1,36 @@
+"""Tests for the renderer's selection snapshot path."""
+from tests.test_summarizer import _score_rows
+
+
+def test_snapshot_renders_same_digest_as_supabase(monkeypatch, tmp_path):
+    """Rendering from the summarizer's snapshot matches the standalone DB path, without DB reads."""
+    from shared import config, selection, supabase_client
+    from agents.renderer import main as renderer
+
+    rows = _score_rows(12)
+    rows[1]["items"]["raw_body"] = "<p>" + "Long &amp; detailed body text " * 20 + "</p>"
+    summaries = {f"item-{i}": f"summary {i}" for i in range(0, 12, 2)}
+    summary_data = {"highlights": "Highlights.", "tldr_map": {"item-1": "tldr 1"},
+                    "editor_pick_id": "item-2", "editor_pick_reason": "Because.", "section_stats": {}}
+
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(supabase_client, "update_run", lambda run_id, updates: None)
+
+    # Standalone: selection and summaries come from Supabase
+    monkeypatch.setattr(renderer, "OUTPUT_DIR", tmp_path / "db")
+    monkeypatch.setattr(renderer, "select_digest_items", lambda run_id: rows)
+    monkeypatch.setattr(supabase_client, "get_summaries_by_run", lambda run_id: summaries)
+    from_db = renderer.run_renderer("run-1", summary_data=summary_data)
+
+    # Pipeline: the snapshot replaces both queries
+    def _no_db(*_args, **_kwargs):
+        raise AssertionError("renderer queried Supabase despite a snapshot")
+    monkeypatch.setattr(renderer, "OUTPUT_DIR", tmp_path / "snapshot")
+    monkeypatch.setattr(renderer, "select_digest_items", _no_db)
+    monkeypatch.setattr(supabase_client, "get_summaries_by_run", _no_db)
+    path = selection.write_selection("run-1", rows, summaries)
+    from_snapshot = renderer.run_renderer("run-1", summary_data={**summary_data, "selection_path": path})
+
+    for key in ("md_path", "html_path"):
+        with open(from_db[key], encoding="utf-8") as a, open(from_snapshot[key], encoding="utf-8") as b:
+            assert a.read() == b.read()
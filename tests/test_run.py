@@ -0,0 +1,72 @@
+"""Tests for the pipeline's stage checkpoints and --resume."""
+import pytest
+
+
+def _fail(*_args, **_kwargs):
+    raise AssertionError("checkpointed stage was re-run")
+
+
+def test_resume_skips_finished_stages(monkeypatch, tmp_path):
+    import run
+    from shared import config, llm_cache, supabase_client
+    from agents.emailer import main as emailer
+    from agents.fetcher import main as fetcher
+    from agents.renderer import main as renderer
+    from agents.scorer import main as scorer
+    from agents.summarizer import main as summarizer
+
+    checkpoints = {
+        "fetch": {"run_id": "run-1", "items_new": 40, "sources_failed": 0},
+        "score": {"items_scored": 40},
+        "summarize": {"themes": ["Theme"], "tldr_map": {}, "selection_path": ""},
+    }
+    first_attempt = {"timers": {"stage.fetch": {"count": 1, "total": 12.0}}, "histograms": {},
+                     "counters": {}, "gauges": {}}
+    updates = []
+    monkeypatch.setattr(supabase_client, "get_run", lambda run_id: {
+        "id": run_id, "checkpoints": dict(checkpoints), "metrics": {"attempts": [first_attempt]}})
+    monkeypatch.setattr(supabase_client, "update_run", lambda run_id, data: updates.append(data))
+    monkeypatch.setattr(llm_cache, "cache_stats", lambda: {"hits": 0, "misses": 0, "tokens_saved": 0})
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path))
+    for module, name in ((fetcher, "run_fetcher"), (scorer, "run_scorer"),
+                         (scorer, "select_digest_items"), (summarizer, "run_summarizer")):
+        monkeypatch.setattr(module, name, _fail)
+
+    html_path = tmp_path / "digest.html"
+    md_path = tmp_path / "digest.md"
+    rendered = []
+
+    def _render(run_id, summary_data=None):
+        rendered.append(summary_data)
+        html_path.write_text("<html></html>")
+        md_path.write_text("# digest")
+        return {"md_path": str(md_path), "html_path": str(html_path)}
+    monkeypatch.setattr(renderer, "run_renderer", _render)
+    monkeypatch.setattr(emailer, "run_emailer", lambda path: {"sent": 1})
+
+    run.main(["--resume", "run-1"])
+
+    assert rendered == [checkpoints["summarize"]]
+    saved = [u["checkpoints"] for u in updates if "checkpoints" in u]
+    assert set(saved[-1]) == {"fetch", "score", "summarize", "render", "email"}
+    assert {"status": "completed"} in updates
+    # The resumed attempt is appended after the first one's metrics, with its own report
+    attempts = next(u["metrics"] for u in updates if "metrics" in u)["attempts"]
+    assert attempts[0] == first_attempt
+    assert "stage.render" in attempts[1]["timers"]
+    assert (tmp_path / "runs" / "run-1" / "report-2.json").exists()
+
+    # A second resume finds everything done, including the sent email
+    checkpoints.update(saved[-1])
+    monkeypatch.setattr(renderer, "run_renderer", _fail)
+    monkeypatch.setattr(emailer, "run_emailer", _fail)
+    run.main(["--resume", "run-1"])
+
+
+def test_resume_without_fetch_checkpoint_exits(monkeypatch):
+    import run
+    from shared import supabase_client
+
+    monkeypatch.setattr(supabase_client, "get_run", lambda run_id: None)
+    with pytest.raises(SystemExit):
+        run.main(["--resume", "missing"])
@@ -0,0 +1,122 @@
+"""Tests for the scorer: the columnar path must match the scalar formulas."""
+import random
+from datetime import datetime, timedelta, timezone
+
+NOW = datetime(2026, 10, 17, 9, 0, tzinfo=timezone.utc)
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+def _random_items(n, seed=7):
+    rng = random.Random(seed)
+    words = ["anime", "lora", "comfyui", "wan2", "video", "model", "release", "the", "webtoon", "アニメ", "AI"]
+    items = []
+    for i in range(n):
+        published = None
+        if rng.random() > 0.1:
+            published = (NOW - timedelta(hours=rng.uniform(-5, 240))).isoformat()
+        metadata = rng.choice([
+            {}, {"stars": rng.randint(0, 200_000)}, {"downloads": rng.randint(0, 10**6), "rating": rng.uniform(0, 5)},
+            {"favorites": rng.randint(0, 5000)}, {"score": rng.randint(-10, 120)}, {"rating": -1, "stars": None},
+        ])
+        items.append({
+            "id": f"item-{i}",
+            "title": " ".join(rng.choices(words, k=5)),
+            "raw_body": " ".join(rng.choices(words, k=30)),
+            "title_translated": rng.choice(["", "Translated anime LoRA"]),
+            "published_at": published,
+            "metadata": metadata,
+            "source_category": rng.choice(["models", "community", "industry", "youtube", "legal", "other"]),
+        })
+    return items
+
+
+def test_columnar_scores_match_scalar_functions(monkeypatch):
+    from agents.scorer import main as scorer
+    from agents.scorer.columnar import extract_columns, recency_scores, static_scores, weighted_total
+
+    monkeypatch.setattr(scorer, "datetime", _FixedDatetime)
+    items = _random_items(500)
+    columns = extract_columns(items, scorer._SCORING_KEYWORDS)
+    scores = {"recency_score": recency_scores(columns.published_epoch, NOW), **static_scores(columns)}
+    scores["total_score"] = weighted_total(scores["recency_score"], scores["engagement_score"],
+                                           scores["keyword_score"], scores["source_priority_score"])
+
+    for i, item in enumerate(items):
+        title = item["title_translated"] or item["title"]
+        expected = {
+            "recency_score": scorer._recency_score(item["published_at"]),
+            "engagement_score": scorer._engagement_score(item["metadata"]),
+            "keyword_score": scorer._keyword_score(title, item["raw_body"]),
+            "source_priority_score": scorer._source_priority_score(item["source_category"]),
+        }
+        weights = scorer.config.SCORING_WEIGHTS
+        expected["total_score"] = (
+            weights["recency"] * expected["recency_score"] +
+            weights["engagement"] * expected["engagement_score"] +
+            weights["keyword_relevance"] * expected["keyword_score"] +
+            weights["source_priority"] * expected["source_priority_score"]
+        )
+        for name, value in expected.items():
+            assert round(float(scores[name][i]), 4) == round(value, 4), (name, item)
+
+
+def test_run_scorer_only_computes_missing_static_components(monkeypatch):
+    """Static components are computed for items that lack them; the run total is left to SQL."""
+    from agents.scorer import main as scorer
+    from shared import supabase_client
+
+    pages = [_random_items(3)]
+    stored, score_calls, run_updates = [], [], []
+    monkeypatch.setattr(supabase_client, "get_items_missing_static_scores",
+                        lambda since, version, limit=1000: pages.pop(0) if pages else [])
+    monkeypatch.setattr(supabase_client, "set_item_static_scores",
+                        lambda rows, version: stored.extend(rows) or len(rows))
+    monkeypatch.setattr(supabase_client, "score_run_items",
+                        lambda run_id, since, weights: score_calls.append((run_id, weights)) or 7)
+    monkeypatch.setattr(supabase_client, "update_run", lambda run_id, updates: run_updates.append(updates))
+
+    result = scorer.run_scorer("run-1")
+
+    assert result == {"items_scored": 7}
+    assert [row["id"] for row in stored] == ["item-0", "item-1", "item-2"]
+    item = _random_items(3)[1]
+    title = item["title_translated"] or item["title"]
+    assert stored[1]["keyword_score"] == scorer._keyword_score(title, item["raw_body"])
+    assert stored[1]["engagement_score"] == scorer._engagement_score(item["metadata"])
+    assert score_calls == [("run-1", scorer.config.SCORING_WEIGHTS)]
+    assert run_updates == [{"items_scored": 7}]
+
+
+def _cap_rows():
+    specs = [("models", "a")] * 20 + [("community", "b"), ("community", "c")] * 5 + [("legal", "d")] * 3
+    return [{"total_score": 1 - n / 100,
+             "items": {"id": f"item-{n}", "source_category": cat, "source_id": src}}
+            for n, (cat, src) in enumerate(specs)]
+
+
+def test_apply_source_cap_without_limit_keeps_top_items_per_source():
+    from agents.scorer.main import apply_source_cap
+
+    rows = _cap_rows()
+    result = apply_source_cap(rows, max_per_source=8)
+
+    ids = [r["items"]["id"] for r in result]
+    assert len(ids) == 8 + 10 + 3
+    assert ids == sorted(ids, key=lambda i: int(i.split("-")[1]))  # score order kept
+    assert "item-8" not in ids  # 9th item from source "a"
+
+
+def test_apply_source_cap_with_limit_reserves_category_minimums():
+    from agents.scorer.main import apply_source_cap
+
+    result = apply_source_cap(_cap_rows(), max_per_source=8, limit=10)
+
+    cats = [r["items"]["source_category"] for r in result]
+    assert len(result) == 10
+    assert cats.count("legal") == 3 and cats.count("community") == 3 and cats.count("models") == 4
+    assert [r["total_score"] for r in result] == sorted((r["total_score"] for r in result), reverse=True)
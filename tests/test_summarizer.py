@@ -0,0 +1,242 @@
+"""Tests for the summarizer's orchestration, using a fake LLM and Supabase."""
+import json
+import re
+
+
+def _fake_generate(messages, **_kwargs):
+    prompt = messages[-1]["content"]
+    if "For each item below" in prompt:
+        ids = re.findall(r'"id": "(item-\d+)"', prompt)
+        return json.dumps({"summaries": [{"id": i, "summary": f"summary {i}", "tldr": f"tldr {i}"} for i in ids]})
+    if "theme phrases" in prompt:
+        return json.dumps({"themes": ["Theme A", "Theme B"]})
+    if '"section_stats"' in prompt:
+        stats = {cat: ["1 fact", "2 facts"] for cat in ("models", "community", "industry")}
+        return json.dumps({"pick_id": "item-0", "pick_reason": "Because.", "section_stats": stats})
+    if "Editor's Pick" in prompt:
+        return json.dumps({"pick_id": "item-0", "pick_reason": "Because."})
+    if "numerical/statistical facts" in prompt:
+        return json.dumps({"facts": ["1 fact", "2 facts"]})
+    return "Highlights paragraph."
+
+
+def _streamed(fake):
+    """generate_stream stand-in that sends fake()'s response in small chunks."""
+    def _stream(messages, **kwargs):
+        response = fake(messages, **kwargs)
+        for i in range(0, len(response), 7):
+            yield response[i:i + 7]
+    return _stream
+
+
+def _score_rows(n):
+    cats = ["models", "community", "industry"]
+    return [{
+        "total_score": 1 - i / 100,
+        "items": {"id": f"item-{i}", "title": f"Title {i}", "raw_body": f"<p>Body {i}</p>",
+                  "source_id": f"src-{i % 7}", "source_category": cats[i % 3], "url": f"https://x/{i}"},
+    } for i in range(n)]
+
+
+def test_run_summarizer_end_to_end(monkeypatch, tmp_path):
+    from shared import config, supabase_client
+    from agents.summarizer import main as summarizer
+
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "AZURE_OPENAI_API_KEY", "test")
+    monkeypatch.setattr(config, "AZURE_OPENAI_ENDPOINT", "https://example")
+    monkeypatch.setattr(summarizer, "generate", _fake_generate)
+    monkeypatch.setattr(summarizer, "generate_stream", _streamed(_fake_generate))
+    monkeypatch.setattr(supabase_client, "get_top_scored_items", lambda run_id, limit=50: _score_rows(30))
+    monkeypatch.setattr(supabase_client, "get_existing_summaries", lambda item_ids: {})
+    stored = []
+    monkeypatch.setattr(supabase_client, "insert_summaries", lambda rows: stored.extend(rows) or len(rows))
+
+    result = summarizer.run_summarizer("run-1")
+
+    assert result["items_summarized"] == 30
+    assert result["themes"] == ["Theme A", "Theme B"]
+    assert result["highlights"] == "Highlights paragraph."
+    assert result["editor_pick_id"] == "item-0"
+    assert set(result["section_stats"]) == {"models", "community", "industry"}
+    assert result["tldr_map"]["item-3"] == "tldr item-3"
+    assert len(stored) == 30
+    assert stored[0]["tldr"] and stored[0]["content_hash"]
+    assert result["selection_path"].startswith(str(tmp_path))
+
+
+def test_unchanged_items_reuse_stored_summaries(monkeypatch, tmp_path):
+    """Only items without a matching (item_id, content hash) summary are sent to the LLM."""
+    from shared import config, supabase_client
+    from agents.summarizer import main as summarizer
+
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path))
+    rows = _score_rows(12)
+    prepared = [summarizer._prepare_item(r["items"]) for r in rows]
+    existing = {
+        # Unchanged content: reused
+        "item-1": {"summary": "old summary 1", "tldr": "old tldr 1", "content_hash": summarizer._summary_hash(prepared[1])},
+        # Content changed since it was summarized: regenerated
+        "item-2": {"summary": "old summary 2", "tldr": "old tldr 2", "content_hash": "stale"},
+    }
+    sent_ids = []
+
+    def _tracking_generate(messages, **kwargs):
+        prompt = messages[-1]["content"]
+        if "For each item below" in prompt:
+            sent_ids.extend(re.findall(r'"id": "(item-\d+)"', prompt))
+        return _fake_generate(messages, **kwargs)
+
+    monkeypatch.setattr(config, "AZURE_OPENAI_API_KEY", "test")
+    monkeypatch.setattr(config, "AZURE_OPENAI_ENDPOINT", "https://example")
+    monkeypatch.setattr(summarizer, "generate", _tracking_generate)
+    monkeypatch.setattr(summarizer, "generate_stream", _streamed(_tracking_generate))
+    monkeypatch.setattr(supabase_client, "get_top_scored_items", lambda run_id, limit=50: rows)
+    monkeypatch.setattr(supabase_client, "get_existing_summaries", lambda item_ids: existing)
+    stored = []
+    monkeypatch.setattr(supabase_client, "insert_summaries", lambda rows: stored.extend(rows) or len(rows))
+
+    result = summarizer.run_summarizer("run-2")
+
+    assert "item-1" not in sent_ids and "item-2" in sent_ids
+    assert len(sent_ids) == 11
+    assert result["items_reused"] == 1
+    assert result["tldr_map"]["item-1"] == "old tldr 1"
+    assert result["tldr_map"]["item-2"] == "tldr item-2"
+    assert len(stored) == 12
+
+
+def test_pack_batches_fits_budget_and_keeps_every_item(monkeypatch):
+    """Long CJK items get smaller calls than short titles; nothing is dropped."""
+    from shared import config
+    from shared.utils import estimate_tokens
+    from agents.summarizer import main as summarizer
+
+    monkeypatch.setattr(config, "SUMMARY_BATCH_TOKEN_BUDGET", 4000)
+    short = [{"id": f"s{i}", "title": f"v1.{i} release", "body": "", "source_id": "github"} for i in range(40)]
+    long_cjk = [{"id": f"c{i}", "title": "新しい動画生成モデル", "body": "アニメ調の映像生成に特化" * 25,
+                 "source_id": "gigazine"} for i in range(10)]
+
+    batches = summarizer._pack_batches(short + long_cjk, config.SUMMARY_BATCH_TOKEN_BUDGET)
+
+    packed = [item["id"] for batch, _ in batches for item in batch]
+    assert sorted(packed) == sorted(item["id"] for item in short + long_cjk)
+    overhead = estimate_tokens(summarizer._summary_prompt("[]"))
+    for batch, max_tokens in batches:
+        prompt = overhead + sum(summarizer._item_tokens(item)[0] for item in batch)
+        assert prompt + max_tokens <= config.SUMMARY_BATCH_TOKEN_BUDGET
+        assert max_tokens <= config.SUMMARY_MAX_COMPLETION_TOKENS
+    def most(prefix):
+        return max(sum(item["id"].startswith(prefix) for item in batch) for batch, _ in batches)
+    assert most("c") < 10 < most("s")
+    assert len(batches) < len(short + long_cjk) / 10  # fewer calls than fixed batches of 10
+
+
+def test_only_missing_items_are_retried(monkeypatch):
+    from agents.summarizer import main as summarizer
+
+    calls = []
+
+    def _dropping_generate(messages, **kwargs):
+        ids = re.findall(r'"id": "(item-\d+)"', messages[-1]["content"])
+        calls.append(ids)
+        if len(calls) == 1:
+            ids = ids[:-2]  # response cut short: last two items missing
+        return json.dumps({"summaries": [{"id": i, "summary": f"summary {i}", "tldr": ""} for i in ids]})
+
+    monkeypatch.setattr(summarizer, "generate", _dropping_generate)
+    monkeypatch.setattr(summarizer, "generate_stream", _streamed(_dropping_generate))
+    items = [summarizer._prepare_item(row["items"]) for row in _score_rows(6)]
+
+    summaries = summarizer._summarize_items(items)
+
+    assert len(calls) == 2
+    assert calls[1] == calls[0][-2:]
+    assert sorted(s["id"] for s in summaries) == sorted(item["id"] for item in items)
+
+
+def test_stream_keeps_items_before_a_truncated_tail(monkeypatch):
+    """Complete summaries survive a cut-off stream; only the rest are re-requested."""
+    from agents.summarizer import main as summarizer
+
+    calls = []
+
+    def _truncating_stream(messages, **kwargs):
+        ids = re.findall(r'"id": "(item-\d+)"', messages[-1]["content"])
+        calls.append(ids)
+        response = json.dumps({"summaries": [{"id": i, "summary": f"summary {i}", "tldr": ""} for i in ids]})
+        if len(calls) == 1:
+            response = response[:response.index(ids[-2])]  # cut off inside the second-to-last item
+        yield from _streamed(lambda *_a, **_k: response)(messages)
+        if len(calls) == 1:
+            raise ConnectionError("stream dropped")
+
+    monkeypatch.setattr(summarizer, "generate_stream", _truncating_stream)
+    items = [summarizer._prepare_item(row["items"]) for row in _score_rows(6)]
+
+    summaries = summarizer._summarize_items(items)
+
+    assert len(calls) == 2
+    assert calls[1] == calls[0][-2:]
+    assert sorted(s["id"] for s in summaries) == sorted(item["id"] for item in items)
+
+
+def test_malformed_response_keeps_complete_items():
+    from agents.summarizer import main as summarizer
+
+    response = '{"summaries": [{"id": "a", "summary": "A", "tldr": ""}, {"id": "b", "summary": "B" "tldr"}, {"id": "c", "summ'
+
+    assert summarizer._parse_summaries(response) == [{"id": "a", "summary": "A", "tldr": ""}]
+
+
+def test_combined_editorial_falls_back_only_for_missing_parts(monkeypatch):
+    from agents.summarizer import main as summarizer
+
+    prompts = []
+
+    def _partial_generate(messages, **kwargs):
+        prompt = messages[-1]["content"]
+        prompts.append(prompt)
+        if '"section_stats"' in prompt:
+            # Unknown pick id and no stats for "industry"
+            return json.dumps({"pick_id": "item-99", "pick_reason": "?",
+                               "section_stats": {"models": ["3 models"], "community": ["5 LoRAs"]}})
+        return _fake_generate(messages, **kwargs)
+
+    monkeypatch.setattr(summarizer, "generate", _partial_generate)
+    items = [summarizer._prepare_item(row["items"]) for row in _score_rows(9)]
+    by_category: dict = {}
+    for item in items:
+        by_category.setdefault(item["source_category"], []).append(item)
+
+    pick, section_stats = summarizer._generate_editorial(items, by_category)
+
+    assert pick["pick_id"] == "item-0"
+    assert section_stats == {"models": ["3 models"], "community": ["5 LoRAs"], "industry": ["1 fact", "2 facts"]}
+    stats_prompts = [p for p in prompts if p.startswith("Given these")]
+    assert len(prompts) == 3 and len(stats_prompts) == 1 and "industry articles" in stats_prompts[0]
+
+
+def test_combined_editorial_only_accepts_picks_from_the_top_20(monkeypatch):
+    from agents.summarizer import main as summarizer
+
+    prompts = []
+
+    def _generate(messages, **kwargs):
+        prompts.append(messages[-1]["content"])
+        # item-25 is sent for its category's stats, but isn't pick-eligible
+        return json.dumps({"pick_id": "item-25", "pick_reason": "?",
+                           "section_stats": {"models": ["3 models"]}})
+
+    monkeypatch.setattr(summarizer, "generate", _generate)
+    items = [summarizer._prepare_item(row["items"]) for row in _score_rows(30)]
+    by_category: dict = {}
+    for item in items:
+        by_category.setdefault(item["source_category"], []).append(item)
+
+    pick, section_stats = summarizer._combined_editorial(items, by_category, list(by_category))
+
+    assert pick is None
+    assert section_stats == {"models": ["3 models"]}
+    assert '"id": "item-25"' in prompts[0]
+    assert prompts[0].count('"pick_eligible": false') == 10
@@ -0,0 +1,61 @@
+"""Tests for Supabase client helpers, run against a minimal fake client."""
+from types import SimpleNamespace
+
+
+class _FakeQuery:
+    def __init__(self, rows, calls):
+        self._rows = rows
+        self._calls = calls
+        self._filter = None
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def in_(self, column, values):
+        self._calls.append((column, list(values)))
+        self._filter = (column, set(values))
+        return self
+
+    def execute(self):
+        column, values = self._filter
+        return SimpleNamespace(data=[r for r in self._rows if r[column] in values])
+
+
+class _FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def table(self, _name):
+        return _FakeQuery(self.rows, self.calls)
+
+
+def test_existing_content_hashes_chunks_and_dedupes(monkeypatch):
+    """Hashes are checked in chunks, duplicates are collapsed before querying."""
+    from shared import supabase_client
+
+    fake = _FakeClient([{"content_hash": "h1"}, {"content_hash": "h4"}])
+    monkeypatch.setattr(supabase_client, "get_client", lambda: fake)
+
+    found = supabase_client.existing_content_hashes(["h1", "h2", "h1", "h3", "h4", ""], chunk_size=2)
+    assert found == {"h1", "h4"}
+    assert [values for _, values in fake.calls] == [["h1", "h2"], ["h3", "h4"]]
+
+
+def test_get_existing_summaries_keeps_newest_per_item(monkeypatch):
+    from shared import supabase_client
+
+    fake = _FakeClient([
+        {"item_id": "a", "summary": "new", "tldr": "t", "content_hash": "h2", "created_at": "2026-10-16"},
+        {"item_id": "a", "summary": "old", "tldr": "t", "content_hash": "h1", "created_at": "2026-10-14"},
+        {"item_id": "b", "summary": "b", "tldr": "t", "content_hash": "h3", "created_at": "2026-10-14"},
+    ])
+    monkeypatch.setattr(supabase_client, "get_client", lambda: fake)
+
+    found = supabase_client.get_existing_summaries(["a", "c"])
+    assert set(found) == {"a"}
+    assert found["a"]["summary"] == "new"
+    assert fake.calls == [("item_id", ["a", "c"])]
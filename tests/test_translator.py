@@ -0,0 +1,81 @@
+"""Tests for the bulk translation path."""
+
+
+class _FakeTranslator:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def translate(self, text):
+        self.calls.append(text)
+        return f"EN({text})"
+
+
+def test_translate_items_dedupes_and_batches_cache_io(monkeypatch):
+    """Identical strings translate once; cache reads and writes are one call each."""
+    from shared import supabase_client, translator
+
+    calls, lookups, writes = [], [], []
+    cached_hash = translator._text_hash("既訳のタイトル", "ja")
+    monkeypatch.setattr(translator, "_get_translator", lambda target_lang: _FakeTranslator(calls))
+    monkeypatch.setattr(supabase_client, "get_cached_translations",
+                        lambda hashes: lookups.append(list(hashes)) or {cached_hash: "Cached title"})
+    monkeypatch.setattr(supabase_client, "cache_translations",
+                        lambda rows: writes.append(rows) or len(rows))
+
+    items = [
+        {"original_language": "ja", "title": "新しいモデル", "raw_body": "本文です"},
+        {"original_language": "ja", "title": "新しいモデル", "raw_body": ""},
+        {"original_language": "ja", "title": "既訳のタイトル", "raw_body": ""},
+        {"original_language": "en", "title": "English title", "raw_body": "body"},
+    ]
+    translator.translate_items(items)
+
+    assert items[0]["title_translated"] == items[1]["title_translated"] == "EN(新しいモデル)"
+    assert items[0]["body_translated"] == "EN(本文です)"
+    assert items[2]["title_translated"] == "Cached title"
+    assert "title_translated" not in items[3]
+    assert sorted(calls) == sorted(["新しいモデル", "本文です"])
+    assert len(lookups) == 1 and len(lookups[0]) == 3
+    assert len(writes) == 1 and len(writes[0]) == 2
+
+
+def test_token_bucket_paces_calls(monkeypatch):
+    from shared import ratelimit
+
+    clock = [0.0]
+    sleeps = []
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: clock[0])
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+    monkeypatch.setattr(ratelimit.time, "sleep", _sleep)
+
+    bucket = ratelimit.TokenBucket(rate=5, capacity=2)
+    for _ in range(4):
+        bucket.acquire()
+
+    # Two burst tokens, then one token every 0.2s
+    assert len(sleeps) == 2
+    assert abs(clock[0] - 0.4) < 1e-9
+
+
+def test_token_bucket_oversized_request_goes_into_debt(monkeypatch):
+    from shared import ratelimit
+
+    clock = [0.0]
+    sleeps = []
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: clock[0])
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+    monkeypatch.setattr(ratelimit.time, "sleep", _sleep)
+
+    bucket = ratelimit.TokenBucket(rate=1, capacity=2)
+    assert bucket.acquire(5) == 0.0
+    assert bucket.available() == -3
+
+    # The next caller pays off the debt before its own token
+    assert bucket.acquire() == 4.0
+    assert sleeps == [4.0]